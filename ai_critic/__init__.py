@@ -1,3 +1,4 @@
+from ._version import __version__
 from .critic import AICritic
 
-__all__ = ["AICritic"]
+__all__ = ["AICritic", "__version__"]
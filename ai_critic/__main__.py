@@ -0,0 +1,5 @@
+import sys
+
+from ai_critic.cli import main
+
+sys.exit(main())
@@ -0,0 +1,160 @@
+import os
+import tempfile
+
+import numpy as np
+from joblib import Parallel, delayed
+
+from ai_critic.critic import deployment_gate
+from ai_critic.evaluators import adapters, config, data, learning_curve, performance, robustness, seeding
+from ai_critic.evaluators.folds import FoldEngine
+from ai_critic.evaluators.scoring import compute_scores
+from ai_critic.evaluators.streaming import load_array
+from ai_critic.evaluators.summary import HumanSummary
+from ai_critic.evaluators.validation import make_cv
+
+
+def _share(X):
+    """
+    Copy an in-memory array once to a ``.npy`` file on tmpfs (shared
+    memory on Linux) and return its path; workers memory-map it.
+    """
+    folder = "/dev/shm" if os.path.isdir("/dev/shm") else None
+    fd, path = tempfile.mkstemp(prefix="ai_critic_", suffix=".npy", dir=folder)
+    with os.fdopen(fd, "wb") as f:
+        np.save(f, X)
+    return path
+
+
+def evaluate_many(models, X, y, n_jobs=None, framework="sklearn", adapter_kwargs=None,
+                  random_state=None):
+    """
+    Audit many candidate models trained on the same dataset.
+
+    The data analysis (leakage scan, class balance, ...) and the CV fold
+    indices are computed once and shared by every candidate. Candidates
+    are audited in parallel worker processes; in-memory X is written
+    once to shared memory and memory-mapped by every worker instead of
+    being copied to each of them.
+
+    Parameters
+    ----------
+    models : dict or list
+        ``{name: model}`` or a list of models (named ``<class>_<i>``).
+    X, y : array-like, np.memmap or str
+        Dataset, as accepted by ``AICritic``.
+    n_jobs : int or None
+        Number of candidates audited in parallel (joblib semantics).
+    framework : str
+        "sklearn" (default), "torch", or "tensorflow"
+    adapter_kwargs : dict
+        Extra kwargs for ``ModelAdapter``.
+    random_state : int or None
+        Audit seed, as in ``AICritic``. Every candidate gets the same
+        folds and noise, so their scores are comparable, and each one
+        matches its own ``AICritic(random_state=...)`` audit.
+
+    Returns
+    -------
+    dict
+        ``data`` (shared data report), ``ranking`` (one row per
+        candidate, best first) and ``reports`` (full payload per name).
+    """
+    if not isinstance(models, dict):
+        models = {f"{type(m).__name__}_{i}": m for i, m in enumerate(models)}
+
+    X = load_array(X)
+    y = np.asarray(load_array(y))
+
+    framework = framework.lower()
+    if framework != "sklearn":
+        models = {
+            name: adapters.ModelAdapter(model, framework=framework, **(adapter_kwargs or {}))
+            for name, model in models.items()
+        }
+
+    # =========================
+    # Shared, model-independent work
+    # =========================
+    data_report = data.evaluate(X, y)
+    seed = seeding.seed_tree(random_state)
+    cv = make_cv(y, random_state=seed)
+    splits = list(cv.split(np.zeros((len(y), 1)), y))
+
+    # =========================
+    # Per-candidate audits
+    # =========================
+    shared = None
+    if n_jobs not in (None, 1) and type(X) is np.ndarray:
+        # memmaps are already shared through their file; chunked
+        # sources are passed as they are
+        shared = _share(X)
+
+    try:
+        reports = Parallel(n_jobs=n_jobs, backend="loky")(
+            delayed(_audit_candidate)(
+                model, shared or X, y, cv, splits, data_report, seed
+            )
+            for model in models.values()
+        )
+    finally:
+        if shared is not None:
+            os.unlink(shared)
+
+    reports = dict(zip(models, reports))
+    ranking = [
+        {
+            "name": name,
+            "global_score": report["scores"]["global"],
+            "deploy": report["decision"]["deploy"],
+            "risk_level": report["decision"]["risk_level"],
+            "cv_mean_score": report["performance"]["cv_mean_score"],
+            "cv_std": report["performance"]["cv_std"],
+            "robustness_verdict": report["robustness"]["verdict"],
+            "performance_drop": report["robustness"]["performance_drop"],
+        }
+        for name, report in reports.items()
+    ]
+    ranking.sort(key=lambda row: (-row["global_score"], -row["cv_mean_score"]))
+    for rank, row in enumerate(ranking, start=1):
+        row["rank"] = rank
+
+    return {"data": data_report, "ranking": ranking, "reports": reports}
+
+
+def _audit_candidate(model, X, y, cv, splits, data_report, seed):
+    # Paths are memory-mapped (see _share)
+    X = load_array(X)
+
+    folds = FoldEngine(model, X, y, cv, splits=splits, random_state=seed)
+    details = {
+        "data": data_report,
+        "config": config.evaluate(
+            model,
+            n_samples=data_report["n_samples"],
+            n_features=data_report["n_features"]
+        ),
+        "performance": performance.evaluate(model, X, y, folds=folds),
+        "robustness": robustness.evaluate(
+            model,
+            X,
+            y,
+            leakage_suspected=data_report["data_leakage"]["suspected"],
+            folds=folds,
+            random_state=seeding.spawn(seed, "robustness")
+        ),
+        "learning_curve": learning_curve.evaluate(
+            model, X, y, folds=folds, random_state=seeding.spawn(seed, "learning_curve")
+        ),
+    }
+
+    human_summary = HumanSummary().generate(details)
+    payload = {
+        "executive": human_summary["executive_summary"],
+        "technical": human_summary["technical_summary"],
+        "details": details,
+        "performance": details["performance"],
+        "robustness": details["robustness"],
+    }
+    payload["scores"] = compute_scores(payload)
+    payload["decision"] = deployment_gate(payload)
+    return payload
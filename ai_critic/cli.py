@@ -0,0 +1,245 @@
+"""
+``ai-critic`` command-line batch auditor.
+
+Audits one model, or every (model, dataset) pair of a manifest, and
+writes one JSON line per audit. The exit code summarizes the batch:
+
+- 0 : every model may be deployed
+- 1 : at least one deployment is blocked
+- 2 : at least one audit failed (unreadable file, fitting error, ...)
+
+Manifest (JSON)::
+
+    {
+      "datasets": {
+        "train": {"X": "X.npy", "y": "y.npy"},
+        "tabular": {"path": "data.parquet", "target": "label"}
+      },
+      "audits": [
+        {"name": "forest", "model": "forest.joblib", "dataset": "train"},
+        {"model": "logreg.pkl", "dataset": "tabular", "random_state": 0},
+        {"model": "svm.joblib", "X": "data.npz:X", "y": "data.npz:y"}
+      ]
+    }
+
+Relative paths are resolved against the manifest's directory. Each
+dataset is loaded once, however many audits use it.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+from pathlib import Path
+
+import numpy as np
+
+from ai_critic.loaders import load_dataset, load_model
+
+EXIT_OK = 0
+EXIT_BLOCKED = 1
+EXIT_ERROR = 2
+
+# Dataset spec keys allowed inline in an audit entry
+_DATASET_KEYS = ("X", "y", "path", "target", "features")
+
+# Audit entry keys forwarded to AICritic
+_CRITIC_KEYS = ("framework", "adapter_kwargs", "random_state")
+
+
+def _resolve(spec, base):
+    spec = dict(spec)
+    for key in ("X", "y", "path"):
+        # Archive keys ({"path": "d.npz", "X": "X"}) are not paths
+        if key in spec and not (key != "path" and "path" in spec):
+            spec[key] = str(base / spec[key])
+    return spec
+
+
+def read_manifest(path):
+    """
+    Parse a manifest into a list of audits, each with a resolved
+    ``dataset`` spec and a ``dataset_key`` shared by identical specs.
+
+    A bare JSON list is read as the ``audits`` list.
+    """
+    path = Path(path)
+    with open(path) as f:
+        manifest = json.load(f)
+    if isinstance(manifest, list):
+        manifest = {"audits": manifest}
+    base = path.parent
+    datasets = manifest.get("datasets", {})
+
+    audits = []
+    for i, entry in enumerate(manifest["audits"]):
+        dataset = entry.get("dataset")
+        if isinstance(dataset, str):
+            if dataset not in datasets:
+                raise ValueError(f"Audit {i} uses unknown dataset {dataset!r}.")
+            spec = datasets[dataset]
+        elif isinstance(dataset, dict):
+            spec = dataset
+        else:
+            spec = {k: entry[k] for k in _DATASET_KEYS if k in entry}
+
+        spec = _resolve(spec, base)
+        audits.append({
+            "name": entry.get("name", f"{Path(entry['model']).stem}_{i}"),
+            "model": str(base / entry["model"]),
+            "dataset": spec,
+            "dataset_key": json.dumps(spec, sort_keys=True),
+            "critic": {k: entry[k] for k in _CRITIC_KEYS if k in entry},
+        })
+    return audits
+
+
+def _json_default(value):
+    if isinstance(value, np.generic):
+        return value.item()
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    return str(value)
+
+
+def _audit(audit, X, y, full_report=False):
+    # Runs in a worker: the model is unpickled there, X / y are arrays
+    # or memory-mapped paths
+    from ai_critic.critic import AICritic
+    from ai_critic.evaluators.scoring import compute_scores
+
+    record = {"name": audit["name"], "model": audit["model"]}
+    start = time.perf_counter()
+    try:
+        critic = AICritic(load_model(audit["model"]), X, y, **audit["critic"])
+        report = critic.evaluate(view="all")
+        decision = critic.deploy_decision()
+    except Exception as exc:
+        record["error"] = f"{type(exc).__name__}: {exc}"
+        return record
+
+    record.update({
+        "deploy": decision["deploy"],
+        "risk_level": decision["risk_level"],
+        "confidence": decision["confidence"],
+        "blocking_issues": decision["blocking_issues"],
+        "verdict": report["executive"]["verdict"],
+        "scores": compute_scores(report),
+        "cv_mean_score": report["performance"]["cv_mean_score"],
+        "seconds": round(time.perf_counter() - start, 3),
+    })
+    if full_report:
+        record["report"] = report
+    return record
+
+
+def run(audits, n_jobs=None, full_report=False):
+    """
+    Audit every manifest entry and yield its record, in manifest order.
+
+    Datasets are loaded once in this process. With a worker pool,
+    in-memory datasets are written once to shared memory and memory-
+    mapped by the workers; ``.npy`` memmaps are passed by file.
+    """
+    from joblib import Parallel, delayed
+
+    from ai_critic.batch import _share
+
+    loaded, errors, shared = {}, {}, []
+    for audit in audits:
+        key = audit["dataset_key"]
+        if key in loaded or key in errors:
+            continue
+        try:
+            X, y = load_dataset(audit["dataset"])
+        except Exception as exc:
+            errors[key] = f"{type(exc).__name__}: {exc}"
+            continue
+        if n_jobs not in (None, 1) and type(X) is np.ndarray:
+            X = _share(X)
+            shared.append(X)
+        loaded[key] = (X, np.asarray(y))
+
+    def records():
+        for audit in audits:
+            if audit["dataset_key"] in errors:
+                continue
+            yield delayed(_audit)(audit, *loaded[audit["dataset_key"]], full_report)
+
+    try:
+        results = iter(Parallel(n_jobs=n_jobs, backend="loky", return_as="generator")(records()))
+        for audit in audits:
+            error = errors.get(audit["dataset_key"])
+            if error is not None:
+                yield {"name": audit["name"], "model": audit["model"], "error": error}
+            else:
+                yield next(results)
+    finally:
+        for path in shared:
+            os.unlink(path)
+
+
+def exit_code(records):
+    """
+    Batch exit code (see module docstring).
+    """
+    if any("error" in r for r in records):
+        return EXIT_ERROR
+    if not all(r["deploy"] for r in records):
+        return EXIT_BLOCKED
+    return EXIT_OK
+
+
+def _parser():
+    parser = argparse.ArgumentParser(
+        prog="ai-critic",
+        description="Audit models and write one JSON line per audit.",
+    )
+    parser.add_argument("manifest", nargs="?", help="JSON manifest of (model, dataset) audits")
+    parser.add_argument("--model", help="single audit: joblib / pickle model file")
+    parser.add_argument("--X", dest="X", help="single audit: features (.npy, .npz[:key])")
+    parser.add_argument("--y", dest="y", help="single audit: target (.npy, .npz[:key])")
+    parser.add_argument("-o", "--output", default="-", help="JSON lines file (default: stdout)")
+    parser.add_argument("-j", "--n-jobs", type=int, default=None, help="parallel audits (-1: all cores)")
+    parser.add_argument("--random-state", type=int, default=None, help="seed for every audit")
+    parser.add_argument("--full-report", action="store_true", help="include the full evaluate() payload")
+    return parser
+
+
+def main(argv=None):
+    parser = _parser()
+    args = parser.parse_args(argv)
+
+    if args.manifest:
+        audits = read_manifest(args.manifest)
+    elif args.model and args.X and args.y:
+        spec = {"X": args.X, "y": args.y}
+        audits = [{
+            "name": Path(args.model).stem,
+            "model": args.model,
+            "dataset": spec,
+            "dataset_key": json.dumps(spec, sort_keys=True),
+            "critic": {},
+        }]
+    else:
+        parser.error("give a manifest, or --model, --X and --y")
+
+    if args.random_state is not None:
+        for audit in audits:
+            audit["critic"].setdefault("random_state", args.random_state)
+
+    out = sys.stdout if args.output == "-" else open(args.output, "w")
+    records = []
+    try:
+        for record in run(audits, n_jobs=args.n_jobs, full_report=args.full_report):
+            records.append(record)
+            out.write(json.dumps(record, default=_json_default) + "\n")
+            out.flush()
+    finally:
+        if out is not sys.stdout:
+            out.close()
+    return exit_code(records)
+
+
+if __name__ == "__main__":
+    sys.exit(main())
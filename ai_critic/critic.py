@@ -1,3 +1,11 @@
+import asyncio
+import copy
+import queue
+import threading
+
+import numpy as np
+
+from ai_critic._version import __version__
 from ai_critic.evaluators import (
     robustness,
     config,
@@ -5,9 +13,20 @@ from ai_critic.evaluators import (
     performance,
     adapters  # <- novo import
 )
+from ai_critic.evaluators import fingerprint, learning_curve, progressive as progressive_mode, seeding
+from ai_critic.evaluators.budget import AuditBudget
+from ai_critic.evaluators.folds import FoldEngine
+from ai_critic.evaluators.scheduler import EvaluatorScheduler
+from ai_critic.evaluators.streaming import load_array, take_rows
 from ai_critic.evaluators.summary import HumanSummary
-from ai_critic.sessions import CriticSessionStore
+from ai_critic.evaluators.validation import make_cv, make_subsample
+from ai_critic.sessions import CriticSessionStore, ResultCache
 from ai_critic.evaluators.scoring import compute_scores
+from ai_critic.plotting import PlotRenderer
+from ai_critic.profiling import Profiler
+
+# Evaluator tasks of an audit, in registration order
+EVALUATORS = ("data", "config", "performance", "robustness", "learning_curve")
 
 
 class AICritic:
@@ -22,39 +41,310 @@ class AICritic:
     - Human-readable executive and technical summaries
     """
 
-    def __init__(self, model, X, y, random_state=None, session=None, framework="sklearn", adapter_kwargs=None):
+    def __init__(self, model, X, y, random_state=None, session=None, framework="sklearn", adapter_kwargs=None,
+                 n_jobs=None, backend="loky", cache=None, progressive=False,
+                 min_samples=5000, ci_tolerance=0.02, profile=False, profile_hooks=None,
+                 plot_dir="ai_critic_plots", plot_top_k=20, max_seconds=None, max_fits=None,
+                 dtype=np.float64):
         """
         Parameters
         ----------
         model : object
             scikit-learn estimator, torch.nn.Module, or tf.keras.Model
-        X : np.ndarray
-            Feature matrix
-        y : np.ndarray
+        X : np.ndarray, np.memmap, str or array-like
+            Feature matrix. ``.npy`` paths are memory-mapped and chunked
+            sources (h5py/zarr-like arrays) are streamed in row blocks.
+        y : np.ndarray, np.memmap, str or array-like
             Target vector
         random_state : int or None
-            Global seed for reproducibility (optional)
+            Root of the audit's seed tree (``seeding.DEFAULT_SEED``
+            when None). CV folds, subsamples, unseeded estimators,
+            robustness noise and learning-curve orders each draw from
+            their own branch, so an audit is bit-identical across runs
+            and ``n_jobs``.
         session : str or None
             Optional session name for longitudinal comparison
         framework : str
             "sklearn" (default), "torch", or "tensorflow"
         adapter_kwargs : dict
-            Extra kwargs para o adaptador (ex: epochs, lr, batch_size)
+            Extra kwargs para o adaptador (ex: epochs, lr, batch_size).
+            Networks are audited as regressors unless
+            ``task="classification"`` is given.
+        n_jobs : int or None
+            Parallelism for evaluators and CV folds (joblib semantics:
+            None/1 sequential, -1 all cores)
+        backend : str
+            joblib backend for CV folds: "loky" (processes, default)
+            or "threading"
+        cache : bool, ResultCache or None
+            Persistent result cache shared across processes. True uses
+            a ``ResultCache`` next to the session store directory.
+        progressive : bool
+            Audit growing stratified subsamples first and stop as soon
+            as the verdict is settled (see ``evaluate``).
+        min_samples : int
+            Size of the first progressive subsample.
+        ci_tolerance : float
+            Progressive mode stops once the 95% confidence interval of
+            the CV score is at most this wide on each side.
+        profile : bool
+            Attach per-stage wall time, CPU time, peak RSS and fit
+            count to the payload under ``profile`` (also persisted with
+            the session).
+        profile_hooks : list of ProfileHook or None
+            Receive the same metrics as they are measured; implies
+            ``profile=True``.
+        plot_dir : str or Path
+            Output directory of ``evaluate(plot=True)``.
+        plot_top_k : int
+            Number of features in the correlation heatmap.
+        max_seconds : float or None
+            Wall-clock budget of an audit. Checked before each
+            fold-based evaluator: once the remaining budget cannot
+            cover its fits, it runs a cheaper variant (2-fold CV on a
+            ``min_samples`` subsample, fewer noise levels, no extra
+            learning-curve sizes) and the payload's ``budget`` entry
+            lists what was degraded. The time per fit is only known
+            after the first fits, so ``max_seconds`` cannot bound the
+            first CV; use ``max_fits`` for that. Datasets of at most
+            ``min_samples`` rows are never moved to the subsample.
+        max_fits : int or None
+            Same, as a maximum number of model fits.
+        dtype : numpy dtype
+            Compute dtype of the data and robustness evaluators.
+            np.float32 keeps float32 data float32 (no upcast copies)
+            and halves their row blocks and noise buffers; model fits
+            always see X in its own dtype.
         """
-        adapter_kwargs = adapter_kwargs or {}
+        self.X = load_array(X)
+        self.y = load_array(y)
+
         self.framework = framework.lower()
         if self.framework != "sklearn":
-            self.model = adapters.ModelAdapter(model, framework=self.framework, **adapter_kwargs)
+            self.model = adapters.ModelAdapter(
+                model, framework=self.framework, **(adapter_kwargs or {})
+            )
         else:
             self.model = model
-
-        self.X = X
-        self.y = y
         self.random_state = random_state
+        self._seed = seeding.seed_tree(random_state)
         self.session = session
+        self.n_jobs = n_jobs
+        self.backend = backend
+        self.progressive = progressive
+        self.min_samples = min_samples
+        self.ci_tolerance = ci_tolerance
+        self.profile_hooks = list(profile_hooks or [])
+        self.profile = profile or bool(self.profile_hooks)
+        self.plot_top_k = plot_top_k
+        self._renderer = PlotRenderer(plot_dir, top_k=plot_top_k)
+        self.max_seconds = max_seconds
+        self.max_fits = max_fits
+        self.dtype = np.dtype(dtype)
         self._store = CriticSessionStore() if session else None
+        self._cache = ResultCache() if cache is True else (cache or None)
+
+        # Memoized payloads, keyed by fingerprint()
+        self._results = {}
+        self._data_digest = None
+        self._cv = None
+
+    def fingerprint(self) -> str:
+        """
+        Key of the current evaluation: model params, X/y content and
+        evaluator settings.
+
+        The X/y content hash is computed once per critic; call
+        ``invalidate()`` after mutating X or y in place.
+        """
+        if self._data_digest is None:
+            self._data_digest = fingerprint.data_fingerprint(self.X, self.y)
+
+        return fingerprint.combine(
+            self._data_digest,
+            fingerprint.model_fingerprint(self.model),
+            self._settings()
+        )
+
+    def _settings(self) -> dict:
+        # Everything besides model and data that changes evaluator output
+        return {
+            "version": __version__,
+            "framework": self.framework,
+            "random_state": self.random_state,
+            "cv": repr(self._cv_splitter()),
+            "progressive": (
+                (self.min_samples, self.ci_tolerance) if self.progressive else None
+            ),
+            "profile": self.profile,
+            "top_k": self.plot_top_k,
+            "budget": (self.max_seconds, self.max_fits),
+            "dtype": self.dtype.str,
+        }
+
+    def _cv_splitter(self):
+        if self._cv is None:
+            self._cv = make_cv(self.y, random_state=self._seed)
+        return self._cv
+
+    def invalidate(self):
+        """
+        Drop memoized evaluations and the cached X/y content hash.
+
+        Entries of the persistent ``cache`` are content-addressed and
+        are left in place.
+        """
+        self._results.clear()
+        self._data_digest = None
+        self._cv = None
+
+    def _schedule(self, X=None, y=None, cv=None, profiler=None, budget=None):
+        """
+        Build the evaluator dependency graph.
+
+        config needs the dataset shape and robustness needs the leakage
+        flag, both from data; performance and the learning curve only
+        depend on the shared CV folds, so they start right away.
+
+        ``X``, ``y`` and ``cv`` default to the full dataset and its
+        splitter (progressive mode passes subsamples). With a
+        ``profiler``, every task is measured as its own stage.
+
+        With a ``budget``, robustness and the learning curve also wait
+        for performance: an evaluator whose fits exceed the budget runs
+        on a cheaper 2-fold subsample engine, and the evaluators after
+        it follow it there.
+        """
+        if X is None:
+            X, y, cv = self.X, self.y, self._cv_splitter()
+
+        # Each (fold, data variant) is fitted once and reused by
+        # performance and robustness.
+        folds = FoldEngine(
+            self.model,
+            X,
+            y,
+            cv,
+            n_jobs=self.n_jobs,
+            backend=self.backend,
+            random_state=self._seed
+        )
+
+        engines = {"full": folds}
+        engines_lock = threading.Lock()
+        if budget is not None:
+            budget.track(folds)
+
+        def cheap_folds():
+            # Shared by every degraded evaluator
+            with engines_lock:
+                if "cheap" not in engines:
+                    n = min(len(y), self.min_samples)
+                    index = make_subsample(y, n, random_state=self._seed)
+                    X_small, y_small = take_rows(X, index), take_rows(y, index)
+                    engines["cheap"] = budget.track(FoldEngine(
+                        self.model, X_small, y_small,
+                        make_cv(y_small, n_splits=2, random_state=self._seed),
+                        n_jobs=self.n_jobs, backend=self.backend, random_state=self._seed
+                    ))
+                return engines["cheap"]
+
+        def fold_engine(projected_fits):
+            # -> (engine, degradation note or None)
+            if budget is None:
+                return folds, None
+            if projected_fits == 0 and folds.is_fitted("clean"):
+                # Nothing left to fit: stay on performance's CV
+                return folds, None
+            if "cheap" in engines:
+                return engines["cheap"], "runs on the degraded performance subsample"
+            if budget.allows(projected_fits) or len(y) <= self.min_samples:
+                # Within budget, or no smaller dataset to fall back to
+                return folds, None
+            cheap = cheap_folds()
+            return cheap, f"2-fold CV on a {len(cheap.y)}-row subsample"
+
+        def degraded(name, result, *notes):
+            notes = [note for note in notes if note]
+            if notes:
+                result["degraded"] = budget.degrade(name, "; ".join(notes))
+            return result
+
+        def thread_fits():
+            with engines_lock:
+                return sum(engine.thread_fits() for engine in engines.values())
+
+        def run_performance(deps):
+            engine, note = fold_engine(len(folds.splits))
+            return degraded(
+                "performance",
+                performance.evaluate(self.model, engine.X, engine.y, folds=engine),
+                note
+            )
 
-    def evaluate(self, view="all", plot=False):
+        def run_robustness(deps):
+            engine, note = fold_engine(0)
+            levels, level_note = robustness.DEFAULT_NOISE_LEVELS, None
+            if budget is not None and not budget.allows(0):
+                levels, level_note = (), "reference noise level only"
+            return degraded(
+                "robustness",
+                robustness.evaluate(
+                    self.model,
+                    engine.X,
+                    engine.y,
+                    leakage_suspected=deps["data"]["data_leakage"]["suspected"],
+                    folds=engine,
+                    noise_levels=levels,
+                    random_state=seeding.spawn(self._seed, "robustness"),
+                    dtype=self.dtype
+                ),
+                note, level_note
+            )
+
+        def run_learning_curve(deps):
+            engine, note = fold_engine(0)
+            kwargs, size_note = {}, None
+            cost = learning_curve.fit_cost(len(engine.splits))
+            if budget is not None and not budget.allows(cost):
+                kwargs, size_note = {"train_sizes": ()}, "full train size only"
+            return degraded(
+                "learning_curve",
+                learning_curve.evaluate(
+                    self.model, engine.X, engine.y, folds=engine,
+                    random_state=seeding.spawn(self._seed, "learning_curve"), **kwargs
+                ),
+                note, size_note
+            )
+
+        scheduler = EvaluatorScheduler(n_jobs=self.n_jobs)
+
+        def add(name, func, requires=()):
+            if profiler is not None:
+                func = profiler.wrap(name, func, thread_fits)
+            scheduler.add(name, func, requires)
+
+        add(
+            "data",
+            lambda deps: data.evaluate(X, y, dtype=self.dtype, top_k=self.plot_top_k)
+        )
+        add(
+            "config",
+            lambda deps: config.evaluate(
+                self.model,
+                n_samples=deps["data"]["n_samples"],
+                n_features=deps["data"]["n_features"]
+            ),
+            requires=["data"]
+        )
+        # Under a budget, later evaluators need performance's engine choice
+        after = ["performance"] if budget is not None else []
+        add("performance", run_performance)
+        add("robustness", run_robustness, requires=["data"] + after)
+        add("learning_curve", run_learning_curve, requires=after)
+        return scheduler
+
+    def evaluate(self, view="all", plot=False, on_result=None):
         """
         Evaluate the model.
 
@@ -67,66 +357,346 @@ class AICritic:
             - "details" : low-level evaluator outputs
             - list : subset of views
         plot : bool
-            - True : generate plots
+            - True : render the correlation heatmap, CV scores and
+              robustness curve into ``plot_dir`` in a background
+              thread; the payload's ``plots`` entry lists the files
+              (call ``wait_for_plots()`` to block until they exist)
             - False : no plots
+        on_result : callable or None
+            Callback mode: ``on_result(name, result, summary)`` is called
+            in the calling thread as each evaluator finishes, with the
+            executive summary of the results so far (see ``stream``).
+
+        Results are memoized by ``fingerprint()``: repeated calls with the
+        same model params, data and settings (including ``deploy_decision``)
+        are served without re-running any evaluator. With ``cache`` set,
+        the same key is also looked up on disk.
+
+        With ``progressive=True``, datasets larger than ``min_samples``
+        are audited on growing stratified subsamples. The audit stops at
+        the first subsample where a leaked feature is confirmed or the
+        CV score interval is within ``ci_tolerance``; the payload's
+        ``progressive`` entry reports the sample size used.
         """
+        if on_result is not None:
+            for name, result, summary in self.stream():
+                if name == "report":
+                    return self._view(result, view, plot)
+                on_result(name, result, summary)
+
+        key = self.fingerprint()
+        payload = self._results.get(key)
+
+        if payload is None:
+            payload = self._compute(key)
+            self._save_session(payload)
+            self._results[key] = payload
+
+        return self._view(payload, view, plot)
+
+    def stream(self):
+        """
+        Run the audit and yield ``(name, result, summary)`` as each
+        evaluator finishes.
+
+        ``summary`` is the executive summary of the results so far: it
+        reports risks as soon as they are found and stays "Incomplete"
+        while clean results are pending. The last item is
+        ``("report", payload, executive)`` with the full ``evaluate()``
+        payload. Memoized audits are replayed immediately.
+
+        The audit runs in a background thread. Closing the generator
+        early stops it at the next evaluator boundary without memoizing
+        or saving anything. Combine with ``max_seconds`` / ``max_fits``
+        to bound its latency.
+        """
+        key = self.fingerprint()
+        payload = self._results.get(key)
+
+        if payload is None:
+            events = queue.Queue()
+            cancel = threading.Event()
+            outcome = {}
+
+            def audit():
+                try:
+                    outcome["payload"] = self._compute(
+                        key, lambda name, result: events.put((name, result)), cancel
+                    )
+                except BaseException as exc:
+                    outcome["error"] = exc
+                finally:
+                    events.put(None)
+
+            threading.Thread(target=audit, name="ai_critic_audit", daemon=True).start()
+            try:
+                details = {}
+                for name, result in iter(events.get, None):
+                    details[name] = result
+                    yield name, copy.deepcopy(result), self._partial_summary(details)
+            finally:
+                cancel.set()
+
+            if "error" in outcome:
+                raise outcome["error"]
+            payload = outcome["payload"]
+            self._save_session(payload)
+            self._results[key] = payload
+        else:
+            for name, result, summary in self._replay(payload):
+                yield name, result, summary
+
+        yield "report", copy.deepcopy(payload), copy.deepcopy(payload["executive"])
+
+    def _partial_summary(self, details):
+        pending = [name for name in EVALUATORS if name not in details]
+        return HumanSummary().generate(details, pending)["executive_summary"]
+
+    def _replay(self, payload):
+        details = {}
+        for name, result in payload["details"].items():
+            details[name] = result
+            yield name, copy.deepcopy(result), self._partial_summary(details)
+
+    def _compute(self, key, on_result=None, cancel=None):
+        # Persistent cache first, then a full run (memo and session are
+        # handled by the caller)
+        # Models without get_params have no cross-process identity
+        persistent = self._cache is not None and hasattr(self.model, "get_params")
+
+        payload = self._cache.get(key) if persistent else None
+        if payload is None:
+            payload = self._run(on_result, cancel)
+            if persistent:
+                self._cache.put(key, payload)
+        elif on_result is not None:
+            # Same events as a run or a memo replay (see _replay)
+            for name, result in payload["details"].items():
+                on_result(name, result)
+        return payload
+
+    def _view(self, payload, view, plot=False):
+        payload = copy.deepcopy(payload)
+
+        # Plots are drawn from the results, off the audit's critical path
+        if plot:
+            self._renderer.submit(payload["details"], self.X, self.y)
+            payload["plots"] = self._renderer.paths(payload["details"])
 
         # =========================
-        # Low-level evaluator outputs
+        # View selector
         # =========================
-        details = {}
+        if view == "all":
+            return payload
 
-        # -------------------------
-        # Data analysis
-        # -------------------------
-        details["data"] = data.evaluate(
-            self.X,
-            self.y,
-            plot=plot
-        )
+        if isinstance(view, list):
+            return {k: payload[k] for k in view if k in payload}
 
-        # -------------------------
-        # Model configuration sanity
-        # -------------------------
-        details["config"] = config.evaluate(
-            self.model,
-            n_samples=details["data"]["n_samples"],
-            n_features=details["data"]["n_features"]
-        )
+        return payload.get(view)
 
-        # -------------------------
-        # Performance evaluation
-        # -------------------------
-        details["performance"] = performance.evaluate(
-            self.model,
-            self.X,
-            self.y,
-            plot=plot
-        )
+    async def astream(self, timeout=None, executor=None):
+        """
+        Run the audit without blocking the event loop and yield
+        ``(name, result, summary)`` for each evaluator as it finishes
+        (same items as ``stream``).
 
-        # -------------------------
-        # Robustness evaluation
-        # -------------------------
-        details["robustness"] = robustness.evaluate(
-            self.model,
-            self.X,
-            self.y,
-            leakage_suspected=details["data"]["data_leakage"]["suspected"],
-            plot=plot
+        data and config arrive first; performance, robustness and the
+        learning curve follow as their fold fits complete. Audits served
+        by the memo or the ``cache`` replay every evaluator the same way.
+
+        Parameters
+        ----------
+        timeout : float or None
+            Seconds for the whole audit; ``asyncio.TimeoutError`` is
+            raised once it elapses.
+        executor : concurrent.futures.Executor or None
+            Executor running the audit (default: the loop's default
+            thread pool). Fold fits are parallelized inside it as with
+            ``evaluate`` (``n_jobs`` / ``backend``).
+
+        On timeout or cancellation of the consuming task, no further
+        evaluator is started; the one running finishes in the executor
+        and its result is discarded (nothing is memoized or saved).
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+
+        def remaining():
+            return None if deadline is None else max(0.0, deadline - loop.time())
+
+        # Hashing X reads the whole dataset
+        key = await asyncio.wait_for(
+            loop.run_in_executor(executor, self.fingerprint), remaining()
         )
+        payload = self._results.get(key)
+
+        if payload is None:
+            events = asyncio.Queue()
+            cancel = threading.Event()
+
+            def on_result(name, result):
+                loop.call_soon_threadsafe(events.put_nowait, (name, result))
+
+            audit = loop.run_in_executor(executor, self._compute, key, on_result, cancel)
+            # Queued after every on_result call of the audit thread
+            audit.add_done_callback(lambda _: events.put_nowait(None))
+            try:
+                details = {}
+                while True:
+                    item = await asyncio.wait_for(events.get(), remaining())
+                    if item is None:
+                        break
+                    name, result = item
+                    details[name] = result
+                    yield name, copy.deepcopy(result), self._partial_summary(details)
+                payload = audit.result()
+            except BaseException:
+                cancel.set()
+                audit.cancel()
+                raise
+
+            await self._asave_session(payload)
+            self._results[key] = payload
+        else:
+            for name, result, summary in self._replay(payload):
+                yield name, result, summary
+
+        yield "report", copy.deepcopy(payload), copy.deepcopy(payload["executive"])
+
+    async def aevaluate(self, view="all", plot=False, timeout=None, on_result=None, executor=None):
+        """
+        Async ``evaluate``: the audit runs in an executor and the event
+        loop stays free.
+
+        Parameters
+        ----------
+        view, plot :
+            As in ``evaluate``.
+        timeout : float or None
+            Seconds before ``asyncio.TimeoutError``.
+        on_result : callable or None
+            ``on_result(name, result, summary)`` for every intermediate
+            evaluator result (coroutine functions are awaited).
+        executor : concurrent.futures.Executor or None
+            See ``astream``.
+        """
+        payload = None
+        async for name, result, summary in self.astream(timeout=timeout, executor=executor):
+            if name == "report":
+                payload = result
+            elif on_result is not None:
+                maybe = on_result(name, result, summary)
+                if asyncio.iscoroutine(maybe):
+                    await maybe
+        return self._view(payload, view, plot)
+
+    def wait_for_plots(self, timeout=None) -> dict:
+        """
+        Wait for pending ``evaluate(plot=True)`` renderings and return
+        ``{name: path}`` of the written files.
+        """
+        return self._renderer.wait(timeout)
+
+    def _run(self, on_result=None, cancel=None):
+        """
+        Run every evaluator and build the full payload.
+
+        ``on_result`` and ``cancel`` are passed to
+        ``EvaluatorScheduler.run``.
+        """
+
+        profiler = Profiler(self.profile_hooks) if self.profile else None
+        budget = None
+        if self.max_seconds is not None or self.max_fits is not None:
+            budget = AuditBudget(self.max_seconds, self.max_fits)
+
+        # =========================
+        # Low-level evaluator outputs
+        # =========================
+        if self.progressive and len(self.y) > self.min_samples:
+            details, report = self._run_progressive(profiler, on_result, cancel, budget)
+        else:
+            details = self._schedule(profiler=profiler, budget=budget).run(on_result, cancel)
+            report = None
 
         # =========================
         # Human summaries
         # =========================
-        human_summary = HumanSummary().generate(details)
+        summarize = HumanSummary().generate
+        if profiler is not None:
+            summarize = profiler.wrap("summary", summarize)
+        human_summary = summarize(details)
 
         payload = {
             "executive": human_summary["executive_summary"],
             "technical": human_summary["technical_summary"],
             "details": details,
             "performance": details["performance"],
+            "robustness": details["robustness"],
+        }
+        if report is not None:
+            payload["progressive"] = report
+        if profiler is not None:
+            payload["profile"] = profiler.report()
+        if budget is not None:
+            payload["budget"] = budget.report()
+
+        return payload
+
+    def _run_progressive(self, profiler=None, on_result=None, cancel=None, budget=None):
+        """
+        Run the evaluators on growing subsamples until the verdict is
+        settled; the last step is the full dataset. ``on_result`` sees
+        the evaluator results of every step. With a ``budget``, growth
+        also stops once the next step's CV no longer fits in it.
+        """
+        n_total = len(self.y)
+        steps = []
+        used = None
+        reason = None
+
+        for n in progressive_mode.sample_sizes(n_total, self.min_samples):
+            if used is not None and budget is not None and not budget.allows(
+                self._cv_splitter().get_n_splits()
+            ):
+                reason = "budget_exhausted"
+                break
+
+            if n < n_total:
+                index = make_subsample(self.y, n, random_state=self._seed)
+                X, y = take_rows(self.X, index), take_rows(self.y, index)
+                cv = make_cv(y, random_state=self._seed)
+                details = self._schedule(
+                    X=X, y=y, cv=cv, profiler=profiler, budget=budget
+                ).run(on_result, cancel)
+            else:
+                cv = self._cv_splitter()
+                details = self._schedule(profiler=profiler, budget=budget).run(on_result, cancel)
+            used = n
+
+            reason = progressive_mode.stopping_reason(
+                details, cv.get_n_splits(), self.ci_tolerance
+            )
+            steps.append({
+                "n_samples": n,
+                "cv_mean_score": details["performance"]["cv_mean_score"],
+                "ci_half_width": progressive_mode.score_interval(
+                    details["performance"], cv.get_n_splits()
+                ),
+                "leakage_suspected": details["data"]["data_leakage"]["suspected"],
+            })
+            if reason is not None:
+                break
+
+        return details, {
+            "n_samples_used": used,
+            "n_samples_total": n_total,
+            "stopped_early": used < n_total,
+            "reason": reason or "full_dataset",
+            "steps": steps,
         }
 
+    def _save_session(self, payload):
         # =========================
         # Session persistence (optional)
         # =========================
@@ -135,16 +705,10 @@ class AICritic:
             payload["scores"] = scores
             self._store.save(self.session, payload)
 
-        # =========================
-        # View selector
-        # =========================
-        if view == "all":
-            return payload
-
-        if isinstance(view, list):
-            return {k: payload[k] for k in view if k in payload}
-
-        return payload.get(view)
+    async def _asave_session(self, payload):
+        if self.session:
+            payload["scores"] = compute_scores(payload)
+            await self._store.asave(self.session, payload)
 
     def compare_with(self, previous_session: str) -> dict:
         """
@@ -154,8 +718,11 @@ class AICritic:
         if not self.session:
             raise ValueError("Current session name not set.")
 
-        current = self._store.load(self.session)
-        previous = self._store.load(previous_session)
+        # Scores only: the detail payloads are never deserialized
+        current = self._results.get(self.fingerprint(), {}).get("scores")
+        if current is None:
+            current = self._store.load_scores(self.session)
+        previous = self._store.load_scores(previous_session)
 
         if not previous:
             raise FileNotFoundError(
@@ -164,15 +731,15 @@ class AICritic:
 
         diff = {
             "global_score": {
-                "current": current["scores"]["global"],
-                "previous": previous["scores"]["global"],
-                "delta": current["scores"]["global"] - previous["scores"]["global"],
+                "current": current["global"],
+                "previous": previous["global"],
+                "delta": current["global"] - previous["global"],
             },
             "components": {}
         }
 
-        for key, value in current["scores"]["components"].items():
-            prev_value = previous["scores"]["components"].get(key)
+        for key, value in current["components"].items():
+            prev_value = previous["components"].get(key)
             if prev_value is not None:
                 diff["components"][key] = {
                     "current": value,
@@ -190,72 +757,104 @@ class AICritic:
             )
         }
 
+    @classmethod
+    def evaluate_many(cls, models, X, y, n_jobs=None, framework="sklearn",
+                      adapter_kwargs=None, random_state=None):
+        """
+        Audit many candidate models over the same dataset and rank them.
+
+        Data analysis and CV splits are computed once; candidates are
+        audited in parallel processes (see ``ai_critic.batch``).
+        """
+        from ai_critic.batch import evaluate_many
+
+        return evaluate_many(
+            models, X, y,
+            n_jobs=n_jobs,
+            framework=framework,
+            adapter_kwargs=adapter_kwargs,
+            random_state=random_state
+        )
+
     def deploy_decision(self):
         """
         Final deployment gate.
         """
 
-        report = self.evaluate(view="all", plot=False)
+        return deployment_gate(self.evaluate(view="all", plot=False))
+
+    async def adeploy_decision(self, timeout=None, executor=None):
+        """
+        Async ``deploy_decision`` (see ``aevaluate``).
+        """
+        return deployment_gate(
+            await self.aevaluate(view="all", timeout=timeout, executor=executor)
+        )
+
+
+def deployment_gate(report):
+    """
+    Deployment decision for an evaluation payload.
+    """
+    data_risk = report["details"]["data"]["data_leakage"]["suspected"]
+    perfect_cv = report["details"]["performance"]["suspiciously_perfect"]
+    robustness_verdict = report["details"]["robustness"]["verdict"]
+    structural_warnings = report["details"]["config"]["structural_warnings"]
+
+    blocking_issues = []
+    risk_level = "low"
+
+    # Hard blockers
+    if data_risk and perfect_cv:
+        blocking_issues.append(
+            "Data leakage combined with suspiciously perfect CV score"
+        )
+        risk_level = "high"
 
-        data_risk = report["details"]["data"]["data_leakage"]["suspected"]
-        perfect_cv = report["details"]["performance"]["suspiciously_perfect"]
-        robustness_verdict = report["details"]["robustness"]["verdict"]
-        structural_warnings = report["details"]["config"]["structural_warnings"]
+    if robustness_verdict == "misleading":
+        blocking_issues.append(
+            "Robustness results are misleading due to inflated baseline performance"
+        )
+        risk_level = "high"
 
-        blocking_issues = []
-        risk_level = "low"
+    if data_risk:
+        blocking_issues.append(
+            "Suspected target leakage in feature set"
+        )
+        risk_level = "high"
 
-        # Hard blockers
-        if data_risk and perfect_cv:
+    # Soft blockers
+    if risk_level != "high":
+        if robustness_verdict == "fragile":
             blocking_issues.append(
-                "Data leakage combined with suspiciously perfect CV score"
+                "Model performance degrades significantly under noise"
             )
-            risk_level = "high"
+            risk_level = "medium"
 
-        if robustness_verdict == "misleading":
+        if perfect_cv:
             blocking_issues.append(
-                "Robustness results are misleading due to inflated baseline performance"
+                "Suspiciously perfect cross-validation score"
             )
-            risk_level = "high"
+            risk_level = "medium"
 
-        if data_risk:
+        if structural_warnings:
             blocking_issues.append(
-                "Suspected target leakage in feature set"
+                "Structural complexity risks detected in model configuration"
             )
-            risk_level = "high"
-
-        # Soft blockers
-        if risk_level != "high":
-            if robustness_verdict == "fragile":
-                blocking_issues.append(
-                    "Model performance degrades significantly under noise"
-                )
-                risk_level = "medium"
-
-            if perfect_cv:
-                blocking_issues.append(
-                    "Suspiciously perfect cross-validation score"
-                )
-                risk_level = "medium"
-
-            if structural_warnings:
-                blocking_issues.append(
-                    "Structural complexity risks detected in model configuration"
-                )
-                risk_level = "medium"
-
-        deploy = len(blocking_issues) == 0
-
-        confidence = 1.0
-        confidence -= 0.35 if data_risk else 0
-        confidence -= 0.25 if perfect_cv else 0
-        confidence -= 0.25 if robustness_verdict in ("fragile", "misleading") else 0
-        confidence -= 0.15 if structural_warnings else 0
-        confidence = max(0.0, round(confidence, 2))
-
-        return {
-            "deploy": deploy,
-            "risk_level": risk_level,
-            "blocking_issues": blocking_issues,
-            "confidence": confidence
-        }
+            risk_level = "medium"
+
+    deploy = len(blocking_issues) == 0
+
+    confidence = 1.0
+    confidence -= 0.35 if data_risk else 0
+    confidence -= 0.25 if perfect_cv else 0
+    confidence -= 0.25 if robustness_verdict in ("fragile", "misleading") else 0
+    confidence -= 0.15 if structural_warnings else 0
+    confidence = max(0.0, round(confidence, 2))
+
+    return {
+        "deploy": deploy,
+        "risk_level": risk_level,
+        "blocking_issues": blocking_issues,
+        "confidence": confidence
+    }
@@ -1,21 +1,51 @@
 # evaluators/adapters.py
+import copy
+import importlib
+import warnings
+from contextlib import contextmanager
+
 import numpy as np
+from sklearn.base import BaseEstimator, clone as sklearn_clone
+from sklearn.metrics import accuracy_score, r2_score
+from sklearn.utils import get_tags
+
+
+def _import_framework(module_name, package):
+    # torch / tensorflow are only imported when an adapter needs them,
+    # so importing ai_critic stays fast for scikit-learn audits
+    try:
+        return importlib.import_module(module_name)
+    except ImportError as exc:
+        raise ImportError(
+            f"This adapter requires {package}. Install it with `pip install {package}`."
+        ) from exc
+
 
-try:
-    import torch
-    import torch.nn as nn
-except ImportError:
-    torch = None
+def _as_tensor(torch, array):
+    """
+    CPU tensor sharing memory with ``array``.
+
+    float32 C-contiguous inputs (memmaps included) are not copied; other
+    inputs are converted once.
+    """
+    array = np.ascontiguousarray(array, dtype=np.float32)
+    with warnings.catch_warnings():
+        # Read-only memmaps are fine: the tensor is never written to
+        warnings.filterwarnings("ignore", message=".*not writable.*")
+        return torch.from_numpy(array)
 
-try:
-    import tensorflow as tf
-except ImportError:
-    tf = None
 
-class ModelAdapter:
+class ModelAdapter(BaseEstimator):
     """
     Wraps scikit-learn, PyTorch, or TensorFlow models to provide a
     unified fit/predict interface for AICritic.
+
+    The adapter follows the scikit-learn estimator protocol
+    (``get_params``, ``set_params``, cloning, estimator tags), so torch
+    and Keras models go through the same cached, parallel CV folds as
+    scikit-learn estimators. The initial weights are snapshotted once;
+    every clone starts from that snapshot instead of deep-copying the
+    current (possibly trained) weights.
     """
 
     def __init__(self, model, framework="sklearn", **kwargs):
@@ -27,47 +57,219 @@ class ModelAdapter:
         framework : str
             One of "sklearn", "torch", "tensorflow"
         kwargs : dict
-            Extra hyperparameters for training (epochs, batch_size, optimizer, etc)
+            Extra hyperparameters for training (epochs, batch_size, optimizer, etc).
+            ``task`` ("regression", the default, or "classification")
+            picks the scoring metric and, with the network's output
+            width, the default loss: MSE for regression, cross-entropy
+            over the outputs for several outputs, binary cross-entropy
+            on logits for a single output. PyTorch also accepts
+            ``predict_batch_size`` (chunk size of ``predict``), ``shuffle``
+            (reshuffle mini-batches every epoch), ``num_threads``
+            (torch intra-op threads during fit/predict) and
+            ``random_state`` (seed of the mini-batch order and of the
+            CPU RNG during fit, e.g. dropout; global RNG when None).
         """
         self.model = model
         self.framework = framework.lower()
         self.kwargs = kwargs
+        self.task = kwargs.get("task", "regression")
 
         if self.framework not in ("sklearn", "torch", "tensorflow"):
             raise ValueError(f"Unsupported framework: {framework}")
+        if self.task not in ("regression", "classification"):
+            raise ValueError(f"Unsupported task: {self.task}")
 
         # PyTorch default settings
         if self.framework == "torch":
+            torch = _import_framework("torch", "torch")
             self.epochs = kwargs.get("epochs", 5)
             self.lr = kwargs.get("lr", 1e-3)
-            self.loss_fn = kwargs.get("loss_fn", nn.MSELoss())
+            # None: picked from the output width on the first fit
+            self.loss_fn = kwargs.get("loss_fn")
             self.optimizer_class = kwargs.get("optimizer", torch.optim.Adam)
             self.device = kwargs.get("device", "cpu")
+            self.batch_size = kwargs.get("batch_size", 32)
+            self.predict_batch_size = kwargs.get("predict_batch_size", 4096)
+            self.shuffle = kwargs.get("shuffle", True)
+            self.num_threads = kwargs.get("num_threads")
+            self.random_state = kwargs.get("random_state")
             self.model.to(self.device)
+            self._initial_state = {
+                name: tensor.detach().clone()
+                for name, tensor in self.model.state_dict().items()
+            }
 
         # TensorFlow default settings
         if self.framework == "tensorflow":
+            tf = _import_framework("tensorflow", "tensorflow")
             self.epochs = kwargs.get("epochs", 5)
             self.batch_size = kwargs.get("batch_size", 32)
-            self.loss_fn = kwargs.get("loss_fn", "mse")
+            self.loss_fn = kwargs.get("loss_fn", self._keras_loss(tf))
             self.optimizer = kwargs.get("optimizer", "adam")
             self.model.compile(optimizer=self.optimizer, loss=self.loss_fn)
+            # Empty for models that are not built yet
+            self._initial_state = self.model.get_weights()
+
+    # =========================
+    # Estimator protocol
+    # =========================
+    def get_params(self, deep=True):
+        params = {"model": self.model, "framework": self.framework}
+        if self.framework == "torch":
+            # Unset seeds are filled in per fold by folds.seeded_clone
+            params["random_state"] = None
+        params.update(self.kwargs)
+        if deep and self.framework == "sklearn" and hasattr(self.model, "get_params"):
+            for key, value in self.model.get_params(deep=True).items():
+                params[f"model__{key}"] = value
+        return params
+
+    def set_params(self, **params):
+        nested = {k[len("model__"):]: v for k, v in params.items() if k.startswith("model__")}
+        if nested:
+            self.model.set_params(**nested)
+
+        params = {k: v for k, v in params.items() if not k.startswith("model__")}
+        if params:
+            current = self.get_params(deep=False)
+            current.update(params)
+            model = current.pop("model")
+            framework = current.pop("framework")
+            self.__init__(model, framework=framework, **current)
+        return self
+
+    def __sklearn_clone__(self):
+        clone = copy.copy(self)
+        clone.kwargs = dict(self.kwargs)
+
+        if self.framework == "sklearn":
+            clone.model = sklearn_clone(self.model)
+        elif self.framework == "torch":
+            clone.model = self._torch_from_snapshot()
+        elif self.framework == "tensorflow":
+            import tensorflow as tf
+
+            clone.model = tf.keras.models.clone_model(self.model)
+            if self._initial_state:
+                clone.model.set_weights(self._initial_state)
+            clone.model.compile(optimizer=self.optimizer, loss=self.loss_fn)
+        return clone
+
+    def _n_outputs(self, output_shape):
+        return int(output_shape[-1]) if len(output_shape) > 1 else 1
+
+    def _torch_loss(self, torch, n_outputs):
+        if self.loss_fn is not None:
+            return self.loss_fn
+        if self.task == "regression":
+            return torch.nn.MSELoss()
+        if n_outputs > 1:
+            return torch.nn.CrossEntropyLoss()
+        return torch.nn.BCEWithLogitsLoss()
+
+    def _keras_loss(self, tf):
+        if self.task == "regression":
+            return "mse"
+        # Unbuilt models have no output shape yet: one output per class
+        shape = getattr(self.model, "output_shape", None)
+        if shape is not None and self._n_outputs(shape) == 1:
+            return tf.keras.losses.BinaryCrossentropy(from_logits=True)
+        return tf.keras.losses.SparseCategoricalCrossentropy(from_logits=True)
+
+    def _torch_from_snapshot(self):
+        # Parameters and persistent buffers are substituted by copies of
+        # the initial snapshot during the deepcopy, so the current weights
+        # are never copied; tied weights stay tied (same id -> same copy)
+        memo = {}
+        for name, param in self.model.named_parameters():
+            memo[id(param)] = type(param)(
+                self._initial_state[name].clone(), requires_grad=param.requires_grad
+            )
+        for name, buffer in self.model.named_buffers():
+            if name in self._initial_state:
+                memo[id(buffer)] = self._initial_state[name].clone()
+        return copy.deepcopy(self.model, memo)
+
+    def __sklearn_tags__(self):
+        tags = super().__sklearn_tags__()
+        if self.framework == "sklearn":
+            tags.estimator_type = get_tags(self.model).estimator_type
+        else:
+            tags.estimator_type = (
+                "classifier" if self.task == "classification" else "regressor"
+            )
+        return tags
 
+    def initial_weights(self):
+        """
+        Snapshot of the weights every clone starts from (empty for
+        scikit-learn models).
+        """
+        if self.framework == "torch":
+            return {name: tensor.cpu().numpy() for name, tensor in self._initial_state.items()}
+        if self.framework == "tensorflow":
+            return {str(i): w for i, w in enumerate(self._initial_state)}
+        return {}
+
+    def n_parameters(self, trainable_only=True):
+        """
+        Number of (trainable) weights of the wrapped network, or None
+        for scikit-learn models.
+        """
+        if self.framework == "torch":
+            return int(sum(
+                p.numel() for p in self.model.parameters()
+                if p.requires_grad or not trainable_only
+            ))
+        if self.framework == "tensorflow":
+            weights = self.model.trainable_weights if trainable_only else self.model.weights
+            return int(sum(np.prod(w.shape) for w in weights))
+        return None
+
+    # =========================
+    # Training / inference
+    # =========================
     def fit(self, X, y):
         if self.framework == "sklearn":
             self.model.fit(X, y)
         elif self.framework == "torch":
-            X_tensor = torch.tensor(X, dtype=torch.float32).to(self.device)
-            y_tensor = torch.tensor(y, dtype=torch.float32).to(self.device).view(-1, 1)
+            import torch
+
+            # Views over the NumPy buffers; only one mini-batch at a time
+            # is gathered and moved to the device
+            X_tensor = _as_tensor(torch, X)
+            n_samples = X_tensor.shape[0]
             optimizer = self.optimizer_class(self.model.parameters(), lr=self.lr)
 
-            self.model.train()
-            for epoch in range(self.epochs):
-                optimizer.zero_grad()
-                output = self.model(X_tensor)
-                loss = self.loss_fn(output, y_tensor)
-                loss.backward()
-                optimizer.step()
+            with self._torch_threads(torch), self._torch_rng(torch) as generator:
+                # Output width of one row picks the loss and target layout
+                self.model.eval()
+                with torch.no_grad():
+                    n_outputs = self._n_outputs(self.model(X_tensor[:1].to(self.device)).shape)
+                loss_fn = self._torch_loss(torch, n_outputs)
+                if self.task == "classification" and n_outputs > 1:
+                    # Class indices, one score per class
+                    y_tensor = torch.from_numpy(np.ascontiguousarray(y, dtype=np.int64))
+                else:
+                    y_tensor = _as_tensor(torch, y).view(-1, 1)
+
+                self.model.train()
+                for epoch in range(self.epochs):
+                    if self.shuffle:
+                        order = torch.randperm(n_samples, generator=generator)
+                    else:
+                        order = torch.arange(n_samples)
+
+                    for start in range(0, n_samples, self.batch_size):
+                        batch = order[start:start + self.batch_size]
+                        X_batch = X_tensor[batch].to(self.device)
+                        y_batch = y_tensor[batch].to(self.device)
+
+                        optimizer.zero_grad()
+                        output = self.model(X_batch)
+                        loss = loss_fn(output, y_batch)
+                        loss.backward()
+                        optimizer.step()
         elif self.framework == "tensorflow":
             self.model.fit(X, y, epochs=self.epochs, batch_size=self.batch_size, verbose=0)
         return self
@@ -76,9 +278,68 @@ class ModelAdapter:
         if self.framework == "sklearn":
             return self.model.predict(X)
         elif self.framework == "torch":
-            self.model.eval()
-            with torch.no_grad():
-                X_tensor = torch.tensor(X, dtype=torch.float32).to(self.device)
-                return self.model(X_tensor).cpu().numpy().flatten()
+            import torch
+
+            X_tensor = _as_tensor(torch, X)
+            outputs = []
+
+            with self._torch_threads(torch), torch.no_grad():
+                self.model.eval()
+                for start in range(0, X_tensor.shape[0], self.predict_batch_size):
+                    X_batch = X_tensor[start:start + self.predict_batch_size].to(self.device)
+                    outputs.append(self.model(X_batch).cpu().numpy())
+
+            if not outputs:
+                return np.empty(0, dtype=np.float32)
+            return self._postprocess(np.concatenate(outputs))
         elif self.framework == "tensorflow":
-            return self.model.predict(X).flatten()
+            return self._postprocess(self.model.predict(X, verbose=0))
+
+    def _postprocess(self, output):
+        if self.task == "classification":
+            # Multi-output networks emit one score per class. A single
+            # output is a logit under the default loss, otherwise it is
+            # read as the probability of the positive class
+            if output.ndim > 1 and output.shape[1] > 1:
+                return output.argmax(axis=1)
+            threshold = 0.0 if self.kwargs.get("loss_fn") is None else 0.5
+            return (output.reshape(-1) > threshold).astype(np.int64)
+        return output.flatten()
+
+    def score(self, X, y):
+        """
+        Accuracy for classification, R² for regression (as in scikit-learn).
+        """
+        if self.framework == "sklearn":
+            return self.model.score(X, y)
+        predictions = self.predict(X)
+        if self.task == "classification":
+            return accuracy_score(y, predictions)
+        return r2_score(y, predictions)
+
+    @contextmanager
+    def _torch_rng(self, torch):
+        # -> generator of the mini-batch order (None: global RNG)
+        if self.random_state is None:
+            yield None
+            return
+        # Dropout and other layers draw from a seeded CPU RNG; the
+        # caller's RNG state is restored afterwards
+        with torch.random.fork_rng(devices=[]):
+            torch.default_generator.manual_seed(self.random_state)
+            yield torch.Generator().manual_seed(self.random_state)
+
+    @contextmanager
+    def _torch_threads(self, torch):
+        # torch's intra-op pool is process-wide: restore it afterwards so
+        # parallel CV folds can each run with a fixed thread budget
+        if self.num_threads is None:
+            yield
+            return
+
+        previous = torch.get_num_threads()
+        torch.set_num_threads(self.num_threads)
+        try:
+            yield
+        finally:
+            torch.set_num_threads(previous)
@@ -0,0 +1,85 @@
+# evaluators/budget.py
+import threading
+import time
+
+
+class AuditBudget:
+    """
+    Wall-clock and fit-count budget of one audit.
+
+    The budget is checked before each fold-based evaluator starts: if
+    the fits it would need (``projected_fits``) do not fit in what is
+    left, the evaluator runs a cheaper variant instead. Running fits are
+    never interrupted, so the overrun is bounded by one evaluator's
+    cheap variant.
+    """
+
+    def __init__(self, max_seconds=None, max_fits=None):
+        """
+        Parameters
+        ----------
+        max_seconds : float or None
+            Wall-clock budget of the audit.
+        max_fits : int or None
+            Maximum number of model fits.
+        """
+        self.max_seconds = max_seconds
+        self.max_fits = max_fits
+        self.degraded = {}
+        self._engines = []
+        self._start = time.perf_counter()
+        self._lock = threading.Lock()
+
+    def track(self, folds):
+        """
+        Count the fits of a ``FoldEngine`` against the budget.
+        """
+        with self._lock:
+            self._engines.append(folds)
+        return folds
+
+    @property
+    def n_fits(self):
+        with self._lock:
+            return sum(folds.n_fits for folds in self._engines)
+
+    @property
+    def elapsed(self):
+        return time.perf_counter() - self._start
+
+    def allows(self, projected_fits):
+        """
+        Whether ``projected_fits`` more fits stay within the budget.
+
+        The time needed is extrapolated from the mean time per fit so
+        far (an overestimate: it includes the non-fitting stages).
+        Before the first fit there is nothing to extrapolate from, so
+        only the time already spent counts: ``max_seconds`` cannot
+        bound the first evaluator's fits, ``max_fits`` can.
+        """
+        n_fits = self.n_fits
+        if self.max_fits is not None and n_fits + projected_fits > self.max_fits:
+            return False
+        if self.max_seconds is not None:
+            elapsed = self.elapsed
+            per_fit = elapsed / n_fits if n_fits else 0.0
+            if elapsed + projected_fits * per_fit > self.max_seconds:
+                return False
+        return True
+
+    def degrade(self, name, reason):
+        """
+        Record that evaluator ``name`` ran its cheaper variant.
+        """
+        with self._lock:
+            self.degraded[name] = reason
+        return reason
+
+    def report(self):
+        return {
+            "max_seconds": self.max_seconds,
+            "max_fits": self.max_fits,
+            "elapsed": self.elapsed,
+            "n_fits": self.n_fits,
+            "degraded": dict(self.degraded),
+        }
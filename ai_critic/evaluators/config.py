@@ -31,5 +31,16 @@ def evaluate(model, n_samples=None, n_features=None):
             "message": "More features than samples can cause instability."
         })
 
+    # Real weight counts for wrapped torch / Keras networks
+    n_weights = model.n_parameters() if hasattr(model, "n_parameters") else None
+    if n_weights is not None:
+        report["n_trainable_weights"] = n_weights
+        if n_samples and n_weights > 10 * n_samples:
+            warnings.append({
+                "issue": "high_weight_sample_ratio",
+                "n_trainable_weights": n_weights,
+                "message": "Network has far more trainable weights than training samples."
+            })
+
     report["structural_warnings"] = warnings
     return report
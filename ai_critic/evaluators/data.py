@@ -1,33 +1,366 @@
 import numpy as np
-import matplotlib.pyplot as plt
-import seaborn as sns
-import pandas as pd
+from scipy import sparse
+from sklearn.utils.sparsefuncs import mean_variance_axis, min_max_axis
 
-def evaluate(X, y, plot=False):
+from .streaming import DEFAULT_BLOCK_BYTES, any_nan, iter_row_blocks, sparse_float, take_rows
+from .validation import infer_problem_type
+
+
+# Leakage thresholds. Informative-but-honest features stay below the MI
+# threshold (e.g. ~0.75 for the best iris feature), while targets that
+# are re-encoded, hashed or sorted into IDs reach ~0.95-1.0.
+CORRELATION_THRESHOLD = 0.98
+MUTUAL_INFORMATION_THRESHOLD = 0.9
+
+
+def feature_target_correlation(X, y, dtype=np.float64, block_bytes=DEFAULT_BLOCK_BYTES):
+    """
+    Pearson correlation of every feature with the target.
+
+    X is streamed in row blocks of at most ``block_bytes`` (in ``dtype``),
+    so memmaps and chunked sources are scanned with a bounded footprint.
+    Each block contributes to running sums through one matrix-vector
+    product; constant columns are masked out at the end and reported as
+    NaN.
+
+    Parameters
+    ----------
+    X : np.ndarray
+        Feature matrix (n_samples, n_features)
+    y : np.ndarray
+        Target vector
+    dtype : numpy dtype
+        Compute dtype; np.float32 halves the block footprint.
+    block_bytes : int
+        Memory budget of one row block.
+    """
+    if sparse.issparse(X):
+        return _sparse_feature_target_correlation(X, y, dtype)
+
+    n_samples, n_features = X.shape
+    corr = np.full(n_features, np.nan)
+
+    sum_x = np.zeros(n_features)
+    sum_xx = np.zeros(n_features)
+    sum_xy = np.zeros(n_features)
+    sum_y = sum_yy = 0.0
+    col_min = np.full(n_features, np.inf)
+    col_max = np.full(n_features, -np.inf)
+    y_min, y_max = np.inf, -np.inf
+    shift_x = shift_y = None
+
+    itemsize = np.dtype(dtype).itemsize
+    buffer = None
+    for start, stop, block in iter_row_blocks(X, block_bytes, itemsize=itemsize):
+        # Each block is copied into one reused buffer and centered there
+        if buffer is None:
+            buffer = np.empty(block.shape, dtype=dtype)
+        block = _fill(buffer, block)
+        y_block = np.array(y[start:stop], dtype=dtype)
+
+        # Shifting by the first block's means keeps the one-pass sums
+        # well conditioned, also in float32
+        if shift_x is None:
+            shift_x = block.mean(axis=0)
+            shift_y = y_block.mean()
+
+        np.minimum(col_min, block.min(axis=0), out=col_min)
+        np.maximum(col_max, block.max(axis=0), out=col_max)
+        y_min = min(y_min, float(y_block.min()))
+        y_max = max(y_max, float(y_block.max()))
+
+        block -= shift_x
+        y_block -= shift_y
+
+        sum_x += block.sum(axis=0)
+        sum_xx += np.einsum("ij,ij->j", block, block)
+        sum_xy += y_block @ block
+        sum_y += float(y_block.sum())
+        sum_yy += float(y_block @ y_block)
+
+    if n_samples == 0 or y_min == y_max:
+        return corr
+
+    var_y = sum_yy - sum_y ** 2 / n_samples
+    varying = col_max != col_min
+    cov = sum_xy[varying] - sum_x[varying] * sum_y / n_samples
+    var_x = np.maximum(sum_xx[varying] - sum_x[varying] ** 2 / n_samples, 0)
+    corr[varying] = cov / np.sqrt(var_x * var_y)
+
+    return corr
+
+
+def _fill(buffer, block, order="C"):
+    # Copy ``block`` into the leading rows of a flat-allocated buffer;
+    # the result is contiguous in ``order``
+    view = buffer.reshape(-1)[:block.size].reshape(block.shape, order=order)
+    np.copyto(view, block, casting="unsafe")
+    return view
+
+
+def _sparse_feature_target_correlation(X, y, dtype=np.float64):
+    # Column moments and X.T @ y only touch the stored entries, so the
+    # cost is O(nnz) and X is never densified
+    X = sparse_float(X)
+    n_samples, n_features = X.shape
+    corr = np.full(n_features, np.nan)
+
+    # One copy of y, centered in place
+    y_centered = np.array(y, dtype=np.result_type(X.dtype, dtype))
+    if n_samples == 0 or y_centered.min() == y_centered.max():
+        return corr
+
+    _, var_x = mean_variance_axis(X, axis=0)
+    col_min, col_max = min_max_axis(X, axis=0)
+    y_centered -= y_centered.mean(dtype=np.float64)
+    # Centering y alone is enough: sum_i (x_i - mean_x) * y_c_i = X.T @ y_c
+    cov = (X.T @ y_centered) / n_samples
+    var_y = float(y_centered @ y_centered) / n_samples
+
+    varying = col_max != col_min
+    corr[varying] = np.clip(cov[varying] / np.sqrt(var_x[varying] * var_y), -1.0, 1.0)
+    return corr
+
+
+def _bin_edges(sample, n_bins):
+    """
+    Per-column bin edges from a row sample: midpoints between distinct
+    values for low-cardinality columns (every value gets its own bin),
+    quantiles otherwise.
+    """
+    edges = []
+    for column in sample.T:
+        column = column[~np.isnan(column)]
+        values = np.unique(column)
+        if len(values) <= n_bins:
+            edges.append((values[1:] + values[:-1]) / 2)
+        else:
+            quantiles = np.quantile(column, np.linspace(0, 1, n_bins + 1)[1:-1])
+            edges.append(np.unique(quantiles))
+    return edges
+
+
+class _BinCoder:
+    """
+    Bin codes of one column, equal to ``np.searchsorted(edges, x)``.
+
+    When every cell of a fine uniform grid over the edges holds at most
+    one edge, a code is one table lookup plus one comparison, several
+    times faster than a binary search per value. Columns the grid
+    cannot resolve (e.g. heavy tails) use ``searchsorted``.
+    """
+
+    GRID = 1024
+
+    def __init__(self, edges):
+        self.edges = edges
+        self.grid = None
+        if len(edges) < 2:
+            return
+        origin, width = edges[0], (edges[-1] - edges[0]) / self.GRID
+        cells = np.minimum(((edges - origin) / width).astype(np.int64), self.GRID - 1)
+        per_cell = np.bincount(cells, minlength=self.GRID)
+        if per_cell.max() > 1:
+            return
+        # Edges in earlier cells, and the edge inside each cell (if any)
+        base = np.concatenate([[0], np.cumsum(per_cell)[:-1]])
+        cell_edge = np.full(self.GRID, np.inf)
+        cell_edge[cells] = edges
+        self.grid = (origin, 1 / width, base, cell_edge)
+
+    def __call__(self, x, out):
+        if self.grid is None:
+            out[:] = np.searchsorted(self.edges, x)
+            return
+        origin, inv_width, base, cell_edge = self.grid
+        cell = (x - origin) * inv_width
+        # fmax / fmin also map NaN to a valid cell
+        np.fmax(cell, 0, out=cell)
+        np.fmin(cell, self.GRID - 1, out=cell)
+        cell = cell.astype(np.intp)
+        np.add(base[cell], x > cell_edge[cell], out=out)
+
+
+def _target_codes(y, n_bins):
+    # Class labels are used as they are; continuous targets are binned
+    # into quantiles like the features
+    if infer_problem_type(y) == "classification":
+        _, codes = np.unique(y, return_inverse=True)
+        return codes.reshape(-1), int(codes.max()) + 1 if len(codes) else 0
+    y = np.asarray(y, dtype=np.float64)
+    edges = np.unique(np.quantile(y, np.linspace(0, 1, n_bins + 1)[1:-1]))
+    return np.searchsorted(edges, y), len(edges) + 1
+
+
+def binned_mutual_information(X, y, n_bins=None, sample_cells=10_000_000,
+                              block_bytes=DEFAULT_BLOCK_BYTES, dtype=np.float64):
+    """
+    Normalized mutual information I(x_j; y) / H(y) of every feature with
+    the target, from histogram bins.
+
+    Catches non-monotonic leaks (IDs, hashed or re-encoded targets) that
+    a linear correlation misses: 1.0 means y is a function of the binned
+    feature.
+
+    Bin edges are fitted once on a row sample. X is then streamed in
+    row blocks; every block is coded once (see ``_BinCoder``) and a
+    single ``np.bincount`` over (feature, bin, class) updates the joint
+    counts of all features together, so the cost is linear in the
+    number of cells.
+
+    Parameters
+    ----------
+    n_bins : int or None
+        Bins per feature. None picks ``n_samples ** (1/3)`` (2 to 64),
+        so small datasets are not over-partitioned.
+    sample_cells : int
+        Size budget (rows x features) of the sample used for the edges;
+        the sample never exceeds one row block either.
+    block_bytes : int
+        Memory budget of one row block.
+    dtype : numpy dtype
+        dtype blocks are read in before binning.
+
+    Notes
+    -----
+    The plug-in estimate is corrected with the Miller-Madow term
+    ``(cells_xy - cells_x - cells_y + 1) / (2 n)``, which removes the
+    upward bias of sparsely populated histograms. Sparse X is not
+    binned (its implicit zeros would need densifying); NaN is returned.
+    """
+    n_samples, n_features = X.shape
+    scores = np.full(n_features, np.nan)
+    if sparse.issparse(X) or n_samples < 2 or n_features == 0:
+        return scores
+
+    if n_bins is None:
+        n_bins = int(np.clip(round(n_samples ** (1 / 3)), 2, 64))
+
+    y_codes, n_classes = _target_codes(np.asarray(y), n_bins)
+    if n_classes < 2:
+        return scores
+
+    # Bin edges from an evenly spaced row sample
+    itemsize = np.dtype(dtype).itemsize
+    sample_cells = min(sample_cells, block_bytes // itemsize)
+    n_sample = min(n_samples, max(1000, sample_cells // n_features))
+    sample_index = np.linspace(0, n_samples - 1, n_sample).astype(np.int64)
+    sample = np.asarray(take_rows(X, np.unique(sample_index)), dtype=dtype)
+    coders = [_BinCoder(edges) for edges in _bin_edges(sample, n_bins)]
+    del sample
+
+    # Joint counts of (feature, bin, class), all features at once
+    stride = n_bins * n_classes
+    offsets = (np.arange(n_features) * stride)[None, :]
+    counts = np.zeros(n_features * stride, dtype=np.int64)
+    values = codes_buffer = None
+    # Blocks are sized for the int64 codes, the largest per-block array
+    for start, stop, block in iter_row_blocks(X, block_bytes, itemsize=8):
+        if values is None:
+            values = np.empty(block.shape, dtype=dtype)
+            codes_buffer = np.empty(block.size, dtype=np.int64)
+        # Column-major, so every column is coded from contiguous memory
+        block = _fill(values, block, order="F")
+        codes = codes_buffer[:block.size].reshape(block.shape, order="F")
+        for j, coder in enumerate(coders):
+            coder(block[:, j], codes[:, j])
+        codes *= n_classes
+        codes += y_codes[start:stop, None]
+        codes += offsets
+        counts += np.bincount(codes.ravel(order="K"), minlength=counts.size)
+
+    joint = counts.reshape(n_features, n_bins, n_classes).astype(np.float64)
+    n = float(n_samples)
+    p_xy = joint / n
+    p_x = p_xy.sum(axis=2, keepdims=True)
+    p_y = p_xy.sum(axis=1, keepdims=True)
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        terms = p_xy * np.log(p_xy / (p_x * p_y))
+    mi = np.nansum(terms, axis=(1, 2))
+
+    # Miller-Madow bias correction
+    cells_xy = (joint > 0).sum(axis=(1, 2))
+    cells_x = (p_x[:, :, 0] > 0).sum(axis=1)
+    cells_y = (p_y[:, 0, :] > 0).sum(axis=1)
+    mi -= (cells_xy - cells_x - cells_y + 1) / (2 * n)
+
+    p_target = p_y[0, 0]
+    p_target = p_target[p_target > 0]
+    h_y = -(p_target * np.log(p_target)).sum()
+
+    return np.clip(mi / h_y, 0.0, 1.0)
+
+
+def class_balance(y, max_classes=20, block_bytes=DEFAULT_BLOCK_BYTES):
+    """
+    Streaming class counts of y, or "many_classes" past ``max_classes``.
+    """
+    counts = {}
+    for _, _, block in iter_row_blocks(y, block_bytes):
+        values, block_counts = np.unique(block, return_counts=True)
+        for value, count in zip(values, block_counts):
+            counts[value] = counts.get(value, 0) + int(count)
+        if len(counts) >= max_classes:
+            return "many_classes"
+    return {int(v): c for v, c in sorted(counts.items())}
+
+
+def evaluate(X, y, plot=False, dtype=np.float64, block_bytes=DEFAULT_BLOCK_BYTES,
+             mutual_information=True, top_k=20):
+    """
+    Dataset checks: size, NaN, class balance and target leakage.
+
+    A feature is a leakage suspect when its |correlation| with y exceeds
+    ``CORRELATION_THRESHOLD`` or its normalized binned mutual information
+    exceeds ``MUTUAL_INFORMATION_THRESHOLD``; suspects are ranked by the
+    stronger of the two. ``mutual_information=False`` skips the binned
+    scan.
+
+    ``top_correlated_features`` lists the ``top_k`` features most
+    correlated with y; ``plot=True`` renders their heatmap to
+    ``heatmap_correlation.png``.
+
+    ``dtype`` is the compute dtype of the streamed row blocks:
+    np.float32 keeps float32 data float32 and halves every block.
+    """
     report = {
         "n_samples": int(X.shape[0]),
         "n_features": int(X.shape[1]),
-        "has_nan": bool(np.isnan(X).any() or np.isnan(y).any())
+        "has_nan": bool(any_nan(X, block_bytes) or any_nan(y, block_bytes))
     }
 
     # Class balance
-    if len(set(y)) < 20:
-        values, counts = np.unique(y, return_counts=True)
-        report["class_balance"] = {int(v): int(c) for v, c in zip(values, counts)}
+    report["class_balance"] = class_balance(y, block_bytes=block_bytes)
+
+    # Data leakage detection: linear (correlation) and non-linear
+    # (binned mutual information) dependence on the target
+    corr = feature_target_correlation(X, y, dtype=dtype, block_bytes=block_bytes)
+    abs_corr = np.abs(np.nan_to_num(corr))
+    if mutual_information:
+        mi = binned_mutual_information(X, y, block_bytes=block_bytes, dtype=dtype)
     else:
-        report["class_balance"] = "many_classes"
-
-    # Data leakage detection
-    suspicious_features = []
-    y_mean = np.mean(y)
-    y_centered = y - y_mean
-    for i in range(X.shape[1]):
-        feature = X[:, i]
-        if np.std(feature) == 0:
-            continue
-        corr = np.corrcoef(feature, y_centered)[0, 1]
-        if abs(corr) > 0.98:
-            suspicious_features.append({"feature_index": int(i), "correlation": float(corr)})
+        mi = np.full(X.shape[1], np.nan)
+    mi_scores = np.nan_to_num(mi)
+
+    by_corr = abs_corr > CORRELATION_THRESHOLD
+    by_mi = mi_scores > MUTUAL_INFORMATION_THRESHOLD
+    suspicious = np.flatnonzero(by_corr | by_mi)
+    # Strongest evidence first
+    suspicious = suspicious[np.argsort(-np.maximum(abs_corr, mi_scores)[suspicious], kind="stable")]
+    suspicious_features = [
+        {
+            "feature_index": int(i),
+            "correlation": float(corr[i]),
+            "mutual_information": float(mi[i]),
+            "detected_by": [
+                name for name, flagged in
+                (("correlation", by_corr[i]), ("mutual_information", by_mi[i]))
+                if flagged
+            ],
+        }
+        for i in suspicious
+    ]
 
     report["data_leakage"] = {
         "suspected": bool(len(suspicious_features) > 0),
@@ -38,20 +371,20 @@ def evaluate(X, y, plot=False):
         )
     }
 
+    # Strongest linear relations with the target (heatmap input)
+    ranked = np.argsort(-abs_corr, kind="stable")[:top_k]
+    report["top_correlated_features"] = [
+        {"feature_index": int(i), "correlation": float(corr[i])}
+        for i in ranked if not np.isnan(corr[i])
+    ]
+
     # =========================
     # Heatmap de correlação Features x Target
     # =========================
     if plot:
-        feature_names = [f"feat_{i}" for i in range(X.shape[1])]
-        df = pd.DataFrame(X, columns=feature_names)
-        df['target'] = y
-        corr_matrix = df.corr()
-
-        plt.figure(figsize=(10,8))
-        sns.heatmap(corr_matrix, annot=False, cmap="coolwarm")  # <- removi os números
-        plt.title("Correlação Features x Target")
-        plt.tight_layout()
-        plt.savefig("heatmap_correlation.png", dpi=150)  # Salva automaticamente
-        plt.show()
+        # Headless, top-k only (see ai_critic.plotting)
+        from ai_critic.plotting import render_heatmap
+
+        render_heatmap(report, X, y, "heatmap_correlation.png", top_k)
 
     return report
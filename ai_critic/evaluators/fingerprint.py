@@ -0,0 +1,85 @@
+# evaluators/fingerprint.py
+import hashlib
+
+import numpy as np
+from scipy import sparse
+
+from .streaming import DEFAULT_BLOCK_BYTES, iter_row_blocks
+
+
+def _hasher():
+    return hashlib.blake2b(digest_size=16)
+
+
+def data_fingerprint(*arrays, block_bytes=DEFAULT_BLOCK_BYTES):
+    """
+    Content hash of one or more arrays (shape, dtype and bytes).
+
+    Arrays are hashed in row blocks, so memmaps and chunked sources are
+    never loaded whole; sparse matrices are hashed through their CSR
+    arrays.
+    """
+    h = _hasher()
+    for array in arrays:
+        h.update(repr((tuple(array.shape), str(array.dtype))).encode())
+        if sparse.issparse(array):
+            # Canonical CSR structure: O(nnz), never densified
+            array = array.tocsr()
+            if not array.has_canonical_format:
+                array = array.copy()
+                array.sum_duplicates()
+            # Index dtypes (int32 / int64) depend on scipy, not on content
+            h.update(np.ascontiguousarray(array.indptr, dtype=np.int64).data)
+            h.update(np.ascontiguousarray(array.indices, dtype=np.int64).data)
+            h.update(np.ascontiguousarray(array.data).data)
+            continue
+        for _, _, block in iter_row_blocks(array, block_bytes):
+            h.update(np.ascontiguousarray(block).data)
+    return h.hexdigest()
+
+
+def _stable_repr(value):
+    # repr() truncates large arrays and nested estimators, so both are
+    # expanded explicitly; estimator contents are covered by deep params
+    if isinstance(value, np.ndarray):
+        return f"ndarray:{data_fingerprint(value)}"
+    if hasattr(value, "get_params"):
+        return f"{type(value).__module__}.{type(value).__qualname__}"
+    if isinstance(value, dict):
+        items = sorted((str(k), _stable_repr(v)) for k, v in value.items())
+        return "{" + ",".join(f"{k}:{v}" for k, v in items) + "}"
+    if isinstance(value, (list, tuple)):
+        return "[" + ",".join(_stable_repr(v) for v in value) + "]"
+    return repr(value)
+
+
+def model_fingerprint(model):
+    """
+    Hash of the estimator class and its ``get_params(deep=True)``.
+
+    Objects without ``get_params`` can only be identified by ``id()``,
+    which never matches across processes.
+    """
+    if hasattr(model, "get_params"):
+        params = model.get_params(deep=True)
+    else:
+        params = {"id": id(model)}
+    h = _hasher()
+    h.update(_stable_repr(model).encode())
+    h.update(_stable_repr(params).encode())
+
+    # Wrapped networks: the weights every CV clone starts from
+    if hasattr(model, "initial_weights"):
+        for name, weights in sorted(model.initial_weights().items()):
+            h.update(name.encode())
+            h.update(np.ascontiguousarray(weights).data)
+    return h.hexdigest()
+
+
+def combine(*parts):
+    """
+    Hash an ordered sequence of fingerprints / settings into one key.
+    """
+    h = _hasher()
+    h.update(_stable_repr(list(parts)).encode())
+    return h.hexdigest()
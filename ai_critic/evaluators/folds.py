@@ -0,0 +1,192 @@
+# evaluators/folds.py
+import threading
+
+import numpy as np
+from joblib import Parallel, delayed
+from sklearn.base import clone, is_classifier, is_regressor
+from sklearn.metrics import accuracy_score, r2_score
+
+from .seeding import int_seed, seed_tree
+from .streaming import take_rows
+
+
+class FoldEngine:
+    """
+    Per-evaluation cache of cross-validation fits.
+
+    Every (fold, data variant) pair is fitted exactly once. The fitted
+    estimator, its out-of-fold predictions and its score are shared by
+    every evaluator that asks for the same variant, so performance and
+    robustness no longer train the same clean folds twice.
+
+    Folds of a variant are fitted in parallel with joblib; concurrent
+    requests for the same variant wait for the first one instead of
+    fitting it again.
+    """
+
+    def __init__(self, model, X, y, cv, n_jobs=None, backend="loky", splits=None,
+                 random_state=None):
+        """
+        Parameters
+        ----------
+        model : object
+            Unfitted estimator; it is cloned for every fold.
+        X : np.ndarray
+            Feature matrix (ndarray, memmap or chunked source)
+        y : np.ndarray
+            Target vector
+        cv : object
+            CV splitter (see ``validation.make_cv``)
+        n_jobs : int or None
+            Number of folds fitted in parallel (joblib semantics).
+        backend : str
+            joblib backend: "loky" (processes) or "threading".
+        splits : list of (train_index, test_index) or None
+            Precomputed ``cv`` splits, e.g. shared by the candidates of
+            a batch audit.
+        random_state : int, np.random.SeedSequence or None
+            Audit seed (see ``seeding.seed_tree``). Estimators whose
+            own ``random_state`` is unset are seeded per fold from it.
+        """
+        self.model = model
+        self.X = X
+        self.y = np.asarray(y)
+        self.cv = cv
+        self.n_jobs = n_jobs
+        self.backend = backend
+        self.random_state = seed_tree(random_state)
+        # Splitters only need the number of rows; a placeholder keeps
+        # memmaps and chunked sources from being touched here
+        if splits is None:
+            splits = cv.split(np.zeros((len(self.y), 1)), self.y)
+        self.splits = list(splits)
+        self.n_fits = 0
+        self._fits_by_thread = {}
+        self._results = {}
+        self._lock = threading.Lock()
+        self._variant_locks = {}
+
+    def run(self, variant="clean", X=None, transform=None, dtype=None):
+        """
+        Fit (or reuse) one estimator per fold for a data variant.
+
+        Parameters
+        ----------
+        variant : str
+            Cache key of the data variant ("clean", "noisy", ...)
+        X : np.ndarray or None
+            Feature matrix of the variant. Defaults to the clean X.
+        transform : callable or None
+            Row-block perturbation applied while gathering fold rows
+            (see ``streaming.take_rows``), so perturbed variants never
+            materialize a full copy of X.
+        dtype : numpy dtype or None
+            dtype of the gathered fold matrices.
+
+        Returns
+        -------
+        list of dict
+            One entry per fold with ``estimator``, ``train_index``,
+            ``test_index``, ``predictions`` and ``score``.
+        """
+        with self._lock:
+            variant_lock = self._variant_locks.setdefault(
+                variant, threading.Lock()
+            )
+
+        with variant_lock:
+            if variant not in self._results:
+                X = self.X if X is None else X
+                parallel = Parallel(n_jobs=self.n_jobs, backend=self.backend)
+                self._results[variant] = parallel(
+                    delayed(_fit_fold)(
+                        self.model, X, self.y, train_index, test_index,
+                        transform, dtype, self.random_state, f
+                    )
+                    for f, (train_index, test_index) in enumerate(self.splits)
+                )
+                self.count_fits(len(self.splits))
+        return self._results[variant]
+
+    def is_fitted(self, variant="clean"):
+        """
+        Whether the folds of ``variant`` are already fitted.
+        """
+        with self._lock:
+            return variant in self._results
+
+    def count_fits(self, n):
+        """
+        Record ``n`` fits made by the calling thread, including fits
+        outside the cache (e.g. learning-curve train sizes).
+        """
+        with self._lock:
+            self.n_fits += n
+            thread = threading.get_ident()
+            self._fits_by_thread[thread] = self._fits_by_thread.get(thread, 0) + n
+
+    def thread_fits(self):
+        """
+        Number of fold fits triggered by the calling thread.
+        """
+        with self._lock:
+            return self._fits_by_thread.get(threading.get_ident(), 0)
+
+    def scores(self, variant="clean", X=None, transform=None, dtype=None):
+        """
+        Fold scores of a variant, equivalent to ``cross_val_score``.
+        """
+        folds = self.run(variant, X, transform=transform, dtype=dtype)
+        return np.array([fold["score"] for fold in folds])
+
+
+def seeded_clone(model, random_state, fold):
+    """
+    Unfitted clone of ``model`` whose unset ``random_state`` parameters
+    (including those of pipeline steps) get the ("fit", fold) seed of
+    the audit, so forests, SGD and the like fit the same fold the same
+    way in every run and worker. Every data variant of a fold shares
+    the seed, so variants only differ by their data.
+    """
+    estimator = clone(model)
+    if not hasattr(estimator, "get_params"):
+        return estimator
+    unset = {
+        name: int_seed(random_state, "fit", fold)
+        for name, value in estimator.get_params(deep=True).items()
+        if (name == "random_state" or name.endswith("__random_state")) and value is None
+    }
+    if unset:
+        estimator.set_params(**unset)
+    return estimator
+
+
+def _fit_fold(model, X, y, train_index, test_index, transform=None, dtype=None,
+              random_state=None, fold=0):
+    estimator = seeded_clone(model, random_state, fold)
+    estimator.fit(take_rows(X, train_index, transform, dtype), y[train_index])
+
+    X_test = take_rows(X, test_index, transform, dtype)
+    y_test = y[test_index]
+    predictions = estimator.predict(X_test)
+
+    return {
+        "estimator": estimator,
+        "train_index": train_index,
+        "test_index": test_index,
+        "predictions": predictions,
+        "score": float(score_predictions(estimator, y_test, predictions, X_test)),
+    }
+
+
+def score_predictions(estimator, y_true, predictions, X=None):
+    """
+    Same metric as ``estimator.score`` (accuracy for classifiers, R² for
+    regressors), computed from existing predictions. Other estimators
+    fall back to ``estimator.score(X, y_true)``.
+    """
+    if is_classifier(estimator):
+        return accuracy_score(y_true, predictions)
+    if is_regressor(estimator):
+        return r2_score(y_true, predictions)
+    return estimator.score(X, y_true)
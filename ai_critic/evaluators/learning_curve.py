@@ -0,0 +1,211 @@
+# evaluators/learning_curve.py
+import warnings
+
+import numpy as np
+from sklearn.base import is_classifier
+
+from .folds import FoldEngine, score_predictions, seeded_clone
+from .seeding import generator, seed_tree
+from .streaming import take_rows
+from .validation import make_cv
+
+# Fractions of each fold's training rows
+DEFAULT_TRAIN_SIZES = (0.2, 0.5, 1.0)
+
+# Training scores are computed on at most this many rows
+TRAIN_SCORE_ROWS = 10_000
+
+# Train - validation gap above which the model is flagged as overfitting
+GAP_THRESHOLD = 0.1
+
+
+def _strategy(model):
+    """
+    How a fold's model grows across the smaller train sizes (the full
+    size is always the clean CV fit, i.e. the audited model):
+
+    - "partial_fit" : one model is fed each new chunk of rows
+    - "warm_start" : one model is refitted from its previous solution
+      (not for ensembles, whose warm start adds estimators instead)
+    - "refit" : a fresh model per size
+    """
+    if hasattr(model, "partial_fit"):
+        return "partial_fit"
+    params = model.get_params() if hasattr(model, "get_params") else {}
+    if "warm_start" in params and "n_estimators" not in params:
+        return "warm_start"
+    return "refit"
+
+
+def fit_cost(n_splits, train_sizes=DEFAULT_TRAIN_SIZES):
+    """
+    Number of fits ``evaluate`` adds on top of the clean CV fits (the
+    full size reuses them whatever the strategy).
+    """
+    n_sizes = len(set(float(f) for f in train_sizes) | {1.0})
+    return n_splits * (n_sizes - 1)
+
+
+def _train_score(estimator, X, y, rows):
+    # Evenly spaced subset keeps the training score cheap on big folds
+    if len(rows) > TRAIN_SCORE_ROWS:
+        rows = rows[np.linspace(0, len(rows) - 1, TRAIN_SCORE_ROWS).astype(np.int64)]
+    X_rows = take_rows(X, rows)
+    return score_predictions(estimator, y[rows], estimator.predict(X_rows), X_rows)
+
+
+def _nested_order(train_index, y, rng, stratify):
+    """
+    Order in which a fold's training rows are added: every size is a
+    prefix of it. For classifiers each class is permuted on its own and
+    the classes are interleaved at their own rate, so every prefix keeps
+    the class proportions (a class of n rows first appears after about
+    1 / (2n) of the rows).
+    """
+    if not stratify:
+        return train_index[rng.permutation(len(train_index))]
+
+    labels = y[train_index]
+    keys = np.empty(len(train_index))
+    for label in np.unique(labels):
+        rows = np.flatnonzero(labels == label)
+        # Evenly spaced ranks in (0, 1), shuffled within the class
+        keys[rows[rng.permutation(len(rows))]] = (np.arange(len(rows)) + 0.5) / len(rows)
+    return train_index[np.argsort(keys, kind="stable")]
+
+
+def _fold_curve(model, X, y, fold, sizes, strategy, classes, seed, fit_seed, f):
+    train_index = fold["train_index"]
+    test_index = fold["test_index"]
+    # Nested subsets: every size extends the previous one
+    order = _nested_order(train_index, y, generator(seed, f), is_classifier(model))
+    X_test = take_rows(X, test_index)
+    y_test = y[test_index]
+
+    train_scores, validation_scores = [], []
+    estimator = None
+    fitted_classes = None
+    n_fits = 0
+    seen = 0
+
+    for size in sizes:
+        rows = order[:size]
+
+        try:
+            if size == len(order):
+                # The gap is measured on the model the audit scores
+                estimator = fold["estimator"]
+            elif strategy == "partial_fit":
+                if estimator is None:
+                    estimator = seeded_clone(model, fit_seed, f)
+                chunk = order[seen:size]
+                if len(chunk):
+                    kwargs = {"classes": classes} if classes is not None else {}
+                    n_fits += 1
+                    estimator.partial_fit(take_rows(X, chunk), y[chunk], **kwargs)
+            else:
+                size_classes = np.unique(y[rows]) if is_classifier(model) else None
+                # A warm start cannot grow its coefficients to new classes
+                if (estimator is None or strategy == "refit"
+                        or not np.array_equal(size_classes, fitted_classes)):
+                    estimator = seeded_clone(model, fit_seed, f)
+                    if strategy == "warm_start":
+                        estimator.set_params(warm_start=True)
+                fitted_classes = size_classes
+                n_fits += 1
+                estimator.fit(take_rows(X, rows), y[rows])
+
+            train_scores.append(_train_score(estimator, X, y, np.sort(rows)))
+            validation_scores.append(
+                score_predictions(estimator, y_test, estimator.predict(X_test), X_test)
+            )
+            seen = size
+        except Exception:
+            # Like error_score=np.nan: a size that cannot be fitted (e.g.
+            # a single class) is left out instead of aborting the audit
+            if size == len(order):
+                raise
+            train_scores.append(np.nan)
+            validation_scores.append(np.nan)
+            # The next size starts over from a fresh model
+            estimator = None
+            seen = 0
+
+    return train_scores, validation_scores, n_fits
+
+
+def evaluate(model, X, y, folds=None, train_sizes=DEFAULT_TRAIN_SIZES, random_state=None,
+             strategy=None):
+    """
+    Learning curve on the CV folds of the main audit.
+
+    Parameters
+    ----------
+    folds : FoldEngine or None
+        Shared fold engine: its splits are reused and its clean fits
+        serve as the full size.
+    train_sizes : sequence of float
+        Fractions (0, 1] of each fold's training rows.
+    random_state : int, np.random.SeedSequence or None
+        Seed tree of the order in which each fold's training rows are
+        added (see ``seeding.seed_tree``). Models are seeded like the
+        fold engine's fits, so the full size matches the clean fit.
+    strategy : str or None
+        Force "partial_fit", "warm_start" or "refit" (default: picked
+        from the estimator). ``train_sizes=()`` only reuses the clean
+        fits: no extra fit.
+
+    Returns
+    -------
+    dict
+        Mean train / validation scores per size, the train-validation
+        gap at the largest size and an overfitting flag.
+    """
+    seed = seed_tree(random_state)
+    if folds is None:
+        folds = FoldEngine(model, X, y, make_cv(y, random_state=seed), random_state=seed)
+    y = folds.y
+
+    strategy = strategy or _strategy(model)
+    classes = np.unique(y) if strategy == "partial_fit" and is_classifier(model) else None
+    fold_results = folds.run("clean")
+
+    fractions = sorted(set(float(f) for f in train_sizes) | {1.0})
+    if fractions[0] <= 0 or fractions[-1] > 1:
+        raise ValueError("train_sizes must be fractions in (0, 1].")
+    train, validation = [], []
+    n_fits = 0
+    for f, fold in enumerate(fold_results):
+        n_train = len(fold["train_index"])
+        sizes = [max(1, int(round(fr * n_train))) for fr in fractions]
+        fold_train, fold_validation, fold_fits = _fold_curve(
+            model, X, y, fold, sizes, strategy, classes, seed, folds.random_state, f
+        )
+        train.append(fold_train)
+        validation.append(fold_validation)
+        n_fits += fold_fits
+    folds.count_fits(n_fits)
+
+    # Folds may differ by a row: sizes are reported as fractions. Sizes
+    # that failed in every fold stay NaN
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore", RuntimeWarning)
+        train = np.nanmean(np.array(train), axis=0)
+        validation = np.nanmean(np.array(validation), axis=0)
+    gap = float(train[-1] - validation[-1])
+    overfitting = gap > GAP_THRESHOLD
+
+    return {
+        "train_sizes": fractions,
+        "train_scores": [float(s) for s in train],
+        "validation_scores": [float(s) for s in validation],
+        "train_validation_gap": gap,
+        "overfitting": overfitting,
+        "strategy": strategy,
+        "n_fits": n_fits,
+        "message": (
+            "Training score is far above validation score — the model memorizes its training data."
+            if overfitting
+            else "Train / validation gap within expected range."
+        )
+    }
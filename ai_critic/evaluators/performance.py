@@ -1,22 +1,29 @@
-from sklearn.model_selection import cross_val_score, learning_curve
-import matplotlib.pyplot as plt
-import numpy as np
 
+from .folds import FoldEngine
 from .validation import make_cv
 
 
-def evaluate(model, X, y, plot=False):
+def evaluate(model, X, y, plot=False, folds=None, random_state=None):
     """
     Avalia a performance do modelo usando validação cruzada
     automaticamente adequada (StratifiedKFold ou KFold).
+
+    If ``folds`` (a ``FoldEngine``) is given, its clean fold fits are
+    reused instead of running a new cross-validation; otherwise the
+    folds and fits are seeded from ``random_state`` (see
+    ``seeding.seed_tree``).
     """
 
     # =========================
     # Cross-validation adaptativa
     # =========================
-    cv = make_cv(y)
+    if folds is None:
+        folds = FoldEngine(
+            model, X, y, make_cv(y, random_state=random_state), random_state=random_state
+        )
+    cv = folds.cv
 
-    scores = cross_val_score(model, X, y, cv=cv)
+    scores = folds.scores("clean")
     mean = float(scores.mean())
     std = float(scores.std())
     suspicious = mean > 0.995
@@ -24,6 +31,7 @@ def evaluate(model, X, y, plot=False):
     result = {
         "cv_mean_score": mean,
         "cv_std": std,
+        "cv_scores": [float(score) for score in scores],
         "suspiciously_perfect": suspicious,
         "validation_strategy": type(cv).__name__,
         "message": (
@@ -34,39 +42,12 @@ def evaluate(model, X, y, plot=False):
     }
 
     # =========================
-    # Learning curve
+    # Plot
     # =========================
     if plot:
-        train_sizes, train_scores, test_scores = learning_curve(
-            model,
-            X,
-            y,
-            cv=cv,  # <- MESMA estratégia de validação
-            train_sizes=np.linspace(0.1, 1.0, 5)
-        )
+        # Headless, from the fold scores: no extra fits (see ai_critic.plotting)
+        from ai_critic.plotting import render_performance
 
-        plt.figure(figsize=(6, 4))
-        plt.plot(
-            train_sizes,
-            np.mean(train_scores, axis=1),
-            label="Treino"
-        )
-        plt.plot(
-            train_sizes,
-            np.mean(test_scores, axis=1),
-            label="Validação"
-        )
-        plt.fill_between(
-            train_sizes,
-            np.mean(test_scores, axis=1) - np.std(test_scores, axis=1),
-            np.mean(test_scores, axis=1) + np.std(test_scores, axis=1),
-            alpha=0.2
-        )
-        plt.xlabel("Amostra de treino")
-        plt.ylabel("Score")
-        plt.title("Learning Curve")
-        plt.legend()
-        plt.tight_layout()
-        plt.show()
+        render_performance(result, "performance.png")
 
     return result
@@ -0,0 +1,70 @@
+# evaluators/progressive.py
+import numpy as np
+from scipy import stats
+
+from .data import CORRELATION_THRESHOLD
+
+
+def sample_sizes(n_total, min_samples=5000, growth=4):
+    """
+    Growing subsample sizes, ending with the full dataset.
+    """
+    sizes = []
+    n = min_samples
+    while n < n_total:
+        sizes.append(int(n))
+        n *= growth
+    return sizes + [int(n_total)]
+
+
+def confirmed_leakage(data_report, confidence=0.95):
+    """
+    Leaked features whose correlation stays above the leakage threshold
+    over the whole confidence interval (Fisher z-transform). Features
+    flagged by mutual information alone are not confirmed early.
+    """
+    n = data_report["n_samples"]
+    if n <= 3:
+        return []
+
+    z_crit = stats.norm.ppf(0.5 + confidence / 2)
+    confirmed = []
+    for feature in data_report["data_leakage"]["details"]:
+        if "correlation" not in feature["detected_by"]:
+            continue
+        z = np.arctanh(min(abs(feature["correlation"]), 1 - 1e-12))
+        lower = np.tanh(z - z_crit / np.sqrt(n - 3))
+        if lower > CORRELATION_THRESHOLD:
+            confirmed.append(feature["feature_index"])
+    return confirmed
+
+
+def score_interval(performance_report, n_splits, confidence=0.95):
+    """
+    Half-width of the t confidence interval of the CV mean score.
+    """
+    if n_splits < 2:
+        return float("inf")
+    # cv_std is the population std of the fold scores
+    t_crit = stats.t.ppf(0.5 + confidence / 2, df=n_splits - 1)
+    return float(t_crit * performance_report["cv_std"] / np.sqrt(n_splits - 1))
+
+
+def stopping_reason(details, n_splits, ci_tolerance=0.02):
+    """
+    Why a subsample audit is conclusive, or None to keep growing.
+
+    Parameters
+    ----------
+    details : dict
+        Evaluator outputs on the subsample.
+    n_splits : int
+        Number of CV folds behind the performance estimate.
+    ci_tolerance : float
+        Maximum half-width of the CV score confidence interval.
+    """
+    if confirmed_leakage(details["data"]):
+        return "leakage_confirmed"
+    if score_interval(details["performance"], n_splits) <= ci_tolerance:
+        return "scores_converged"
+    return None
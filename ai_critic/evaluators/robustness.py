@@ -1,25 +1,228 @@
 import numpy as np
-from sklearn.base import clone
-from sklearn.model_selection import cross_val_score
-import matplotlib.pyplot as plt
+from scipy import sparse
+from sklearn.base import is_classifier, is_regressor
 
-def evaluate(model, X, y, leakage_suspected=False, plot=False):
-    noise_level = 0.02  # 2% relative noise
-    scale = np.std(X)
-    noise = np.random.normal(0, noise_level * scale, X.shape)
-    X_noisy = X + noise
+from .folds import FoldEngine, score_predictions
+from .seeding import generator, seed_tree, spawn
+from .streaming import DEFAULT_BLOCK_BYTES, block_rows, column_std, take_rows
+from .validation import make_cv
 
-    model_clean = clone(model)
-    model_noisy = clone(model)
+# Noise standard deviations relative to each feature's std
+DEFAULT_NOISE_LEVELS = (0.01, 0.02, 0.05, 0.1, 0.2)
 
-    from .validation import make_cv
 
-    cv = make_cv(y)
+class GaussianNoise:
+    """
+    Row-block Gaussian noise for ``streaming.take_rows``.
 
-    score_clean = cross_val_score(model_clean, X, y, cv=cv, n_jobs=1).mean()
-    score_noisy = cross_val_score(model_noisy, X_noisy, y, cv=cv, n_jobs=1).mean()
+    Noise of each source block is drawn from the node of the ``seed``
+    tree keyed by the block's first row, so a row receives the same
+    perturbation in every fold it appears in, exactly as if
+    ``X + noise`` had been materialized once. Sparse
+    blocks only perturb their stored (nonzero) entries.
+    """
 
-    drop = score_clean - score_noisy
+    def __init__(self, sigma, seed):
+        self.sigma = sigma
+        self.seed = seed
+
+    def __call__(self, block, start):
+        rng = generator(self.seed, start)
+        values = block.data if sparse.issparse(block) else block
+        sigma = np.asarray(self.sigma, dtype=values.dtype)
+        if sparse.issparse(block) and sigma.ndim:
+            sigma = sigma[block.indices]
+        # Noise drawn in the block's dtype and scaled in place
+        noise = rng.standard_normal(values.shape, dtype=values.dtype)
+        noise *= sigma
+        values += noise
+
+
+def _perturbations(noise_levels, feature_groups, n_features):
+    # (curve name, noise level, perturbed columns or None for all)
+    perturbations = [("all", level, None) for level in noise_levels]
+    for name, columns in (feature_groups or {}).items():
+        columns = np.asarray(columns, dtype=np.int64)
+        if columns.size == 0 or columns.min() < 0 or columns.max() >= n_features:
+            raise ValueError(f"Feature group '{name}' has invalid column indices.")
+        perturbations += [(name, level, columns) for level in noise_levels]
+    return perturbations
+
+
+def _predict_mode_scores(folds, X, scale, perturbations, seed, dtype, block_bytes):
+    """
+    Score every clean fold model on every perturbation of its test rows.
+
+    Test rows are processed in row blocks: each block is perturbed into
+    one reused buffer and only predicted, so neither a noisy copy of X
+    nor any extra fit is needed. The perturbed block and the noise live
+    in two buffers of ``dtype`` allocated once for the whole sweep.
+    Sparse blocks keep their structure and only their stored entries
+    are perturbed.
+    """
+    if sparse.issparse(X):
+        return _predict_mode_scores_sparse(folds, X, scale, perturbations, seed, dtype, block_bytes)
+
+    n_rows = block_rows(X, block_bytes, itemsize=np.dtype(dtype).itemsize)
+    scores = np.empty((len(folds.splits), len(perturbations)))
+    shape = (min(n_rows, len(folds.y)), X.shape[1])
+    buffer = np.empty(shape, dtype=dtype)
+    noise = np.empty(shape, dtype=dtype)
+    sigmas = [(level * scale).astype(dtype) for _, level, _ in perturbations]
+
+    for f, fold in enumerate(folds.run("clean")):
+        estimator = fold["estimator"]
+        test_index = fold["test_index"]
+        predictions = [[] for _ in perturbations]
+
+        for start in range(0, len(test_index), n_rows):
+            X_block = take_rows(X, test_index[start:start + n_rows], dtype=dtype)
+            m = len(X_block)
+            perturbed = buffer[:m]
+
+            for p, (_, _, columns) in enumerate(perturbations):
+                rng = generator(seed, f, p, start)
+                np.copyto(perturbed, X_block)
+                if columns is None:
+                    block_noise = noise[:m]
+                    rng.standard_normal(out=block_noise, dtype=dtype)
+                    block_noise *= sigmas[p]
+                    perturbed += block_noise
+                else:
+                    # Contiguous prefix of the noise buffer
+                    block_noise = noise.reshape(-1)[:m * len(columns)].reshape(m, len(columns))
+                    rng.standard_normal(out=block_noise, dtype=dtype)
+                    block_noise *= sigmas[p][columns]
+                    perturbed[:, columns] += block_noise
+                predictions[p].append(estimator.predict(perturbed))
+            # Released before the next block is gathered
+            del X_block
+
+        y_test = folds.y[test_index]
+        for p, chunks in enumerate(predictions):
+            scores[f, p] = score_predictions(estimator, y_test, np.concatenate(chunks))
+
+    return scores.mean(axis=0)
+
+
+def _predict_mode_scores_sparse(folds, X, scale, perturbations, seed, dtype, block_bytes):
+    n_rows = block_rows(X, block_bytes, itemsize=np.dtype(dtype).itemsize)
+    scores = np.empty((len(folds.splits), len(perturbations)))
+
+    # Per-column noise scale (0 outside the perturbed group)
+    sigmas = []
+    for _, level, columns in perturbations:
+        sigma = level * scale
+        if columns is not None:
+            mask = np.zeros_like(sigma)
+            mask[columns] = 1.0
+            sigma = sigma * mask
+        sigmas.append(sigma)
+
+    for f, fold in enumerate(folds.run("clean")):
+        estimator = fold["estimator"]
+        test_index = fold["test_index"]
+        predictions = [[] for _ in perturbations]
+
+        for start in range(0, len(test_index), n_rows):
+            X_block = take_rows(X, test_index[start:start + n_rows], dtype=dtype)
+            buffer = X_block.copy()
+
+            for p, sigma in enumerate(sigmas):
+                rng = generator(seed, f, p, start)
+                np.copyto(buffer.data, X_block.data)
+                noise = rng.standard_normal(buffer.data.shape, dtype=buffer.dtype)
+                noise *= sigma[buffer.indices]
+                buffer.data += noise
+                predictions[p].append(estimator.predict(buffer))
+
+        y_test = folds.y[test_index]
+        for p, chunks in enumerate(predictions):
+            scores[f, p] = score_predictions(estimator, y_test, np.concatenate(chunks))
+
+    return scores.mean(axis=0)
+
+
+def _retrain_mode_scores(folds, X, scale, perturbations, seed, dtype):
+    # Legacy behaviour: one extra CV (fit + score) per perturbation
+    scores = []
+    for p, (name, level, columns) in enumerate(perturbations):
+        sigma = level * scale
+        if columns is not None:
+            mask = np.zeros_like(sigma)
+            mask[columns] = 1.0
+            sigma = sigma * mask
+        noise = GaussianNoise(sigma, seed=spawn(seed, p))
+        scores.append(
+            folds.scores(f"noisy:{name}@{level}", X, transform=noise, dtype=dtype).mean()
+        )
+    return np.array(scores)
+
+
+def evaluate(model, X, y, leakage_suspected=False, plot=False, folds=None,
+             noise_levels=DEFAULT_NOISE_LEVELS, reference_level=0.02,
+             feature_groups=None, mode="predict", random_state=None,
+             block_bytes=DEFAULT_BLOCK_BYTES, dtype=np.float64):
+    """
+    Noise robustness as a degradation curve.
+
+    Parameters
+    ----------
+    noise_levels : sequence of float
+        Noise standard deviations, relative to each feature's own std.
+    reference_level : float
+        Level whose drop drives the verdict (2% by default).
+    feature_groups : dict or None
+        ``{name: column indices}``; each group is also perturbed on its
+        own at every level.
+    mode : str
+        - "predict" : fold models are fitted once on clean data and only
+          scored on perturbed test rows (about one CV in total)
+        - "retrain" : models are re-fitted on perturbed data, one CV per
+          perturbation
+    random_state : int, np.random.SeedSequence or None
+        Seed tree of the noise (see ``seeding.seed_tree``): every
+        (fold, perturbation, row block) draws from its own node, so the
+        sweep is identical across runs and ``n_jobs``.
+    dtype : numpy dtype
+        dtype of the perturbed rows and of the noise; np.float32 keeps
+        float32 data float32 and halves the sweep's buffers.
+    """
+    if mode not in ("predict", "retrain"):
+        raise ValueError(f"Unsupported robustness mode: {mode}")
+
+    noise_levels = sorted(set(noise_levels) | {reference_level})
+    scale = column_std(X, block_bytes, dtype=dtype)
+    seed = seed_tree(random_state)
+    perturbations = _perturbations(noise_levels, feature_groups, X.shape[1])
+
+    # Clean folds are shared with performance.evaluate when a
+    # FoldEngine is passed in.
+    if folds is None:
+        folds = FoldEngine(model, X, y, make_cv(y, random_state=seed), random_state=seed)
+
+    score_clean = folds.scores("clean").mean()
+
+    # Predictions can only be scored for classifiers / regressors
+    estimator = folds.run("clean")[0]["estimator"]
+    if mode == "predict" and (is_classifier(estimator) or is_regressor(estimator)):
+        perturbed = _predict_mode_scores(folds, X, scale, perturbations, seed, dtype, block_bytes)
+    else:
+        mode = "retrain"
+        perturbed = _retrain_mode_scores(folds, X, scale, perturbations, seed, dtype)
+
+    curves = {}
+    for (name, level, _), score in zip(perturbations, perturbed):
+        curves.setdefault(name, []).append({
+            "noise_level": float(level),
+            "cv_score": float(score),
+            "performance_drop": float(score_clean - score),
+        })
+
+    degradation_curve = curves.pop("all")
+    reference = next(p for p in degradation_curve if p["noise_level"] == reference_level)
+    score_noisy = reference["cv_score"]
+    drop = reference["performance_drop"]
 
     # =========================
     # Verdict
@@ -37,23 +240,25 @@ def evaluate(model, X, y, leakage_suspected=False, plot=False):
         verdict = "stable"
         message = "Model shows acceptable robustness to noise."
 
-    # =========================
-    # Plot CV Clean vs Noisy
-    # =========================
-    if plot:
-        plt.figure(figsize=(4,4))
-        plt.bar(["Original", "Com Ruído"], [score_clean, score_noisy], color=['green','red'])
-        plt.ylabel("CV Score")
-        plt.title("Robustez do Modelo")
-        plt.ylim(0, 1)
-        plt.tight_layout()
-        plt.savefig("robustness.png", dpi=150)  # Salva automaticamente
-        plt.show()
-
-    return {
+    result = {
         "cv_score_original": float(score_clean),
         "cv_score_noisy": float(score_noisy),
         "performance_drop": float(drop),
+        "noise_level": float(reference_level),
+        "degradation_curve": degradation_curve,
+        "feature_groups": curves,
+        "mode": mode,
         "verdict": verdict,
         "message": message
     }
+
+    # =========================
+    # Plot degradation curve
+    # =========================
+    if plot:
+        # Headless (see ai_critic.plotting)
+        from ai_critic.plotting import render_robustness
+
+        render_robustness(result, "robustness.png")
+
+    return result
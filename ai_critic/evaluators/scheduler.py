@@ -0,0 +1,133 @@
+# evaluators/scheduler.py
+from concurrent.futures import FIRST_COMPLETED, CancelledError, ThreadPoolExecutor, wait
+
+
+class EvaluatorScheduler:
+    """
+    Runs evaluator tasks as a dependency graph.
+
+    A task starts as soon as every task it requires has finished, so
+    independent evaluators (e.g. data and performance) overlap. Tasks
+    run on a thread pool: they share one ``FoldEngine`` and spend their
+    time in NumPy / scikit-learn code, while the heavy fold fits are
+    spread across cores by the engine itself.
+    """
+
+    def __init__(self, n_jobs=None):
+        """
+        Parameters
+        ----------
+        n_jobs : int or None
+            Maximum number of evaluators running at once.
+            None or 1 runs them sequentially; -1 runs every ready task.
+        """
+        self.n_jobs = n_jobs
+        self._tasks = {}
+
+    def add(self, name, func, requires=()):
+        """
+        Register a task.
+
+        Parameters
+        ----------
+        name : str
+            Task name; its result is stored under this key.
+        func : callable
+            Called with a dict holding the results of ``requires``.
+        requires : iterable of str
+            Names of the tasks that must finish first.
+        """
+        self._tasks[name] = (func, tuple(requires))
+        return self
+
+    def run(self, on_result=None, cancel=None):
+        """
+        Execute every task and return ``{name: result}``.
+
+        Parameters
+        ----------
+        on_result : callable or None
+            Called as ``on_result(name, result)`` as soon as each task
+            finishes, from the thread that ran it.
+        cancel : threading.Event or None
+            Once set, no further task starts and ``CancelledError`` is
+            raised; tasks already running are left to finish.
+        """
+        for name, (_, requires) in self._tasks.items():
+            missing = [r for r in requires if r not in self._tasks]
+            if missing:
+                raise ValueError(
+                    f"Task '{name}' requires unknown tasks: {missing}"
+                )
+
+        if self.n_jobs in (None, 1):
+            results = self._run_sequential(on_result, cancel)
+        else:
+            results = self._run_parallel(on_result, cancel)
+
+        # Registration order, not completion order
+        return {name: results[name] for name in self._tasks}
+
+    def _call(self, name, results, on_result=None):
+        func, requires = self._tasks[name]
+        result = func({r: results[r] for r in requires})
+        if on_result is not None:
+            on_result(name, result)
+        return result
+
+    @staticmethod
+    def _check(cancel):
+        if cancel is not None and cancel.is_set():
+            raise CancelledError("Evaluation cancelled.")
+
+    def _ready(self, done, started):
+        return [
+            name for name, (_, requires) in self._tasks.items()
+            if name not in started and all(r in done for r in requires)
+        ]
+
+    def _run_sequential(self, on_result=None, cancel=None):
+        results = {}
+        while len(results) < len(self._tasks):
+            ready = self._ready(results, results)
+            if not ready:
+                raise ValueError("Circular dependency between evaluators.")
+            self._check(cancel)
+            # One task at a time, so a cheap task unlocked by the last
+            # one (config after data) runs before slower ready tasks
+            name = ready[0]
+            results[name] = self._call(name, results, on_result)
+        return results
+
+    def _run_parallel(self, on_result=None, cancel=None):
+        max_workers = len(self._tasks) if self.n_jobs < 0 else self.n_jobs
+        results = {}
+        started = set()
+        pending = {}
+
+        with ThreadPoolExecutor(max_workers=max(1, max_workers)) as pool:
+            while len(results) < len(self._tasks):
+                self._check(cancel)
+                for name in self._ready(results, started):
+                    started.add(name)
+                    future = pool.submit(self._call, name, dict(results), on_result)
+                    pending[future] = name
+
+                if not pending:
+                    raise ValueError("Circular dependency between evaluators.")
+
+                finished, _ = wait(pending, return_when=FIRST_COMPLETED)
+                if cancel is not None and cancel.is_set():
+                    for other in pending:
+                        other.cancel()
+                    self._check(cancel)
+                for future in finished:
+                    name = pending.pop(future)
+                    try:
+                        results[name] = future.result()
+                    except BaseException:
+                        for other in pending:
+                            other.cancel()
+                        raise
+
+        return results
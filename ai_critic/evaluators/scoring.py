@@ -10,6 +10,9 @@ def compute_scores(report: dict) -> dict:
     perfect_cv = report["details"]["performance"]["suspiciously_perfect"]
     robustness = report["details"]["robustness"]["verdict"]
     structural = report["details"]["config"]["structural_warnings"]
+    # Reports stored before the learning curve existed have no gap
+    curve = report["details"].get("learning_curve", {})
+    gap = max(0.0, curve.get("train_validation_gap", 0.0))
 
     if data_leakage:
         score -= 30
@@ -25,6 +28,9 @@ def compute_scores(report: dict) -> dict:
     if structural:
         score -= 10
 
+    if curve.get("overfitting"):
+        score -= 15
+
     return {
         "global": max(0, min(100, score)),
         "components": {
@@ -35,5 +41,7 @@ def compute_scores(report: dict) -> dict:
                 "fragile": 65,
                 "misleading": 40
             }.get(robustness, 100),
+            # 0 once training beats validation by 50 points or more
+            "generalization": round(100 * max(0.0, 1 - 2 * gap)),
         }
     }
@@ -0,0 +1,56 @@
+# evaluators/seeding.py
+import numpy as np
+
+# Seed of audits run without an explicit random_state, so that they are
+# reproducible (and cacheable) too
+DEFAULT_SEED = 0
+
+# Named branches of an audit's seed tree. Append new names only: the
+# position of a branch is part of the seed of every stream below it.
+BRANCHES = ("cv", "subsample", "fit", "robustness", "learning_curve")
+
+
+def seed_tree(random_state=None):
+    """
+    Root ``SeedSequence`` of an audit.
+
+    Parameters
+    ----------
+    random_state : int, np.random.SeedSequence or None
+        Audit seed (``DEFAULT_SEED`` when None). A ``SeedSequence`` is
+        returned as is, so a subtree can be handed to an evaluator.
+    """
+    if isinstance(random_state, np.random.SeedSequence):
+        return random_state
+    return np.random.SeedSequence(DEFAULT_SEED if random_state is None else random_state)
+
+
+def spawn(random_state, *keys):
+    """
+    Node of the seed tree at ``keys`` (branch names or non-negative
+    ints, e.g. ``spawn(root, "robustness", fold, level, row)``).
+
+    Unlike ``SeedSequence.spawn``, nodes are addressed by position and
+    not by call order, so the stream of an evaluator, fold, noise level
+    or row block does not depend on which worker draws it, or when.
+    """
+    root = seed_tree(random_state)
+    keys = tuple(BRANCHES.index(k) if isinstance(k, str) else int(k) for k in keys)
+    return np.random.SeedSequence(
+        root.entropy, spawn_key=root.spawn_key + keys, pool_size=root.pool_size
+    )
+
+
+def generator(random_state, *keys):
+    """
+    ``np.random.Generator`` seeded by the node at ``keys``.
+    """
+    return np.random.default_rng(spawn(random_state, *keys))
+
+
+def int_seed(random_state, *keys):
+    """
+    32-bit integer seed of the node at ``keys``, for APIs that take an
+    integer ``random_state`` (scikit-learn splitters and estimators).
+    """
+    return int(spawn(random_state, *keys).generate_state(1)[0])
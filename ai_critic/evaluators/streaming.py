@@ -0,0 +1,250 @@
+# evaluators/streaming.py
+from pathlib import Path
+
+import numpy as np
+from scipy import sparse
+from sklearn.utils.sparsefuncs import mean_variance_axis
+
+# Default memory budget for one row block of X
+DEFAULT_BLOCK_BYTES = 64 * 1024 * 1024
+
+
+def load_array(source, mmap_mode="r"):
+    """
+    Normalize a dataset source without copying it into memory.
+
+    Parameters
+    ----------
+    source : np.ndarray, np.memmap, str, Path or array-like
+        - ``.npy`` path : opened with ``np.load(mmap_mode=...)``
+        - ndarray / memmap : returned as is
+        - scipy.sparse matrix : converted to CSR (no copy if already
+          CSR), never densified
+        - chunked source : any object exposing ``chunks``, ``shape``,
+          ``dtype`` and row slicing (``source[start:stop]``), e.g. h5py,
+          zarr or dask arrays
+        - anything else (lists, torch tensors, DataFrames) : converted
+          with ``np.asarray``
+    mmap_mode : str
+        Mode used for ``.npy`` paths.
+    """
+    if isinstance(source, (str, Path)):
+        return np.load(source, mmap_mode=mmap_mode)
+    if isinstance(source, np.ndarray):
+        return source
+    if sparse.issparse(source):
+        return source.tocsr()
+    if all(hasattr(source, attr) for attr in ("chunks", "shape", "dtype", "__getitem__")):
+        return source
+    return np.asarray(source)
+
+
+def block_rows(X, block_bytes=DEFAULT_BLOCK_BYTES, itemsize=None):
+    """
+    Number of rows of X that fit in ``block_bytes``.
+
+    Sparse rows are sized by their average number of stored entries.
+    """
+    itemsize = itemsize or np.dtype(X.dtype).itemsize
+    if sparse.issparse(X):
+        entry_bytes = itemsize + X.indices.itemsize if hasattr(X, "indices") else 2 * itemsize
+        row_bytes = entry_bytes * X.nnz // max(1, X.shape[0])
+    else:
+        row_bytes = itemsize * int(np.prod(X.shape[1:], dtype=np.int64))
+    return max(1, int(block_bytes // max(1, row_bytes)))
+
+
+def iter_row_blocks(X, block_bytes=DEFAULT_BLOCK_BYTES, itemsize=None):
+    """
+    Yield ``(start, stop, block)`` over contiguous row blocks of X.
+
+    Only one block is materialized at a time, so memmaps and chunked
+    sources are read sequentially with a bounded footprint. Blocks of a
+    sparse X are sparse (CSR) row slices.
+    """
+    n_rows = X.shape[0]
+    step = block_rows(X, block_bytes, itemsize)
+    for start in range(0, n_rows, step):
+        stop = min(start + step, n_rows)
+        block = X[start:stop]
+        yield start, stop, block if sparse.issparse(block) else np.asarray(block)
+
+
+def any_nan(X, block_bytes=DEFAULT_BLOCK_BYTES):
+    """
+    Streaming ``np.isnan(X).any()`` that stops at the first NaN block.
+    """
+    if not np.issubdtype(np.dtype(X.dtype), np.inexact):
+        return False
+    if sparse.issparse(X):
+        # Implicit entries are zeros; only stored values can be NaN
+        return bool(np.isnan(X.tocsr().data).any())
+    for _, _, block in iter_row_blocks(X, block_bytes):
+        if np.isnan(block).any():
+            return True
+    return False
+
+
+def global_std(X, block_bytes=DEFAULT_BLOCK_BYTES):
+    """
+    Streaming equivalent of ``np.std(X)`` (all entries pooled).
+    """
+    if sparse.issparse(X):
+        # Implicit zeros count towards the mean and the variance
+        values = X.tocsr().data.astype(np.float64)
+        count = X.shape[0] * X.shape[1]
+        if not count:
+            return 0.0
+        mean = values.sum() / count
+        m2 = np.square(values - mean).sum() + (count - values.size) * mean ** 2
+        return float(np.sqrt(m2 / count))
+
+    count = 0
+    mean = 0.0
+    m2 = 0.0
+    for _, _, block in iter_row_blocks(X, block_bytes):
+        block = np.asarray(block, dtype=np.float64)
+        n = block.size
+        if n == 0:
+            continue
+        block_mean = block.mean()
+        block_m2 = np.square(block - block_mean).sum()
+        # Chan et al. pairwise update
+        delta = block_mean - mean
+        total = count + n
+        mean += delta * n / total
+        m2 += block_m2 + delta ** 2 * count * n / total
+        count = total
+    return float(np.sqrt(m2 / count)) if count else 0.0
+
+
+def column_std(X, block_bytes=DEFAULT_BLOCK_BYTES, dtype=np.float64):
+    """
+    Streaming equivalent of ``np.std(X, axis=0)``.
+
+    Blocks are read in ``dtype`` (float32 blocks of a float32 X are
+    not upcast); the moments are accumulated in float64.
+    """
+    if sparse.issparse(X):
+        if not X.shape[0]:
+            return np.zeros(X.shape[1])
+        _, var = mean_variance_axis(sparse_float(X), axis=0)
+        return np.sqrt(var)
+
+    count = 0
+    mean = np.zeros(X.shape[1])
+    m2 = np.zeros(X.shape[1])
+    buffer = None
+    for _, _, block in iter_row_blocks(X, block_bytes, itemsize=np.dtype(dtype).itemsize):
+        block = np.asarray(block, dtype=dtype)
+        n = block.shape[0]
+        if n == 0:
+            continue
+        if buffer is None:
+            # The first block is the largest
+            buffer = np.empty(block.shape, dtype=dtype)
+        block_mean = block.mean(axis=0, dtype=np.float64)
+        centered = buffer[:n]
+        np.subtract(block, block_mean.astype(dtype), out=centered)
+        np.square(centered, out=centered)
+        block_m2 = centered.sum(axis=0, dtype=np.float64)
+        delta = block_mean - mean
+        total = count + n
+        mean += delta * n / total
+        m2 += block_m2 + delta ** 2 * count * n / total
+        count = total
+    return np.sqrt(m2 / count) if count else m2
+
+
+def take_rows(X, index, transform=None, dtype=None, block_bytes=DEFAULT_BLOCK_BYTES):
+    """
+    Gather ``X[index]`` block by block.
+
+    Parameters
+    ----------
+    X : array-like
+        Source matrix (ndarray, memmap or chunked source)
+    index : np.ndarray
+        Row indices to gather
+    transform : callable or None
+        ``transform(block, start)`` applied in place to every source
+        block before its rows are copied, where ``start`` is the first
+        source row of the block. Used to inject perturbations without
+        materializing a perturbed copy of X.
+    dtype : numpy dtype or None
+        Output dtype (defaults to ``X.dtype``).
+
+    Sparse X gives a CSR matrix; ``transform`` then receives sparse
+    blocks (see ``robustness.GaussianNoise``).
+    """
+    index = np.asarray(index)
+    dtype = np.dtype(dtype or X.dtype)
+    if transform is None and isinstance(X, np.ndarray) and dtype == X.dtype:
+        return X[index]
+    if sparse.issparse(X):
+        return _take_sparse_rows(X.tocsr(), index, transform, dtype, block_bytes)
+
+    order = None
+    if np.any(index[1:] < index[:-1]):
+        order = np.argsort(index, kind="stable")
+        index = index[order]
+
+    out = np.empty((len(index),) + tuple(X.shape[1:]), dtype=dtype)
+    step = block_rows(X, block_bytes)
+    # Row positions of each source block inside the sorted index
+    bounds = np.searchsorted(index, np.arange(0, X.shape[0] + step, step))
+
+    for b, start in enumerate(range(0, X.shape[0], step)):
+        lo, hi = bounds[b], bounds[b + 1]
+        if lo == hi:
+            continue
+        # Rows land directly at their position in the requested order
+        target = slice(lo, hi) if order is None else order[lo:hi]
+        source = X[start:min(start + step, X.shape[0])]
+        if transform is None:
+            # Only the selected rows are read and cast, never the block
+            out[target] = np.asarray(source)[index[lo:hi] - start]
+            continue
+        block = np.array(source, dtype=dtype)
+        transform(block, start)
+        out[target] = block[index[lo:hi] - start]
+    return out
+
+
+def sparse_float(X):
+    """
+    CSR/CSC matrix with a floating dtype (no copy when it already has
+    one), as required by ``sklearn.utils.sparsefuncs``.
+    """
+    if X.format not in ("csr", "csc"):
+        X = X.tocsr()
+    if not np.issubdtype(X.dtype, np.floating):
+        X = X.astype(np.float64)
+    return X
+
+
+def _take_sparse_rows(X, index, transform, dtype, block_bytes):
+    if transform is None:
+        return X[index].astype(dtype, copy=False)
+
+    # Same source blocks as the dense path, so a row receives the same
+    # perturbation in every fold it appears in
+    order = np.argsort(index, kind="stable")
+    sorted_index = index[order]
+    step = block_rows(X, block_bytes)
+    bounds = np.searchsorted(sorted_index, np.arange(0, X.shape[0] + step, step))
+
+    parts = []
+    for b, start in enumerate(range(0, X.shape[0], step)):
+        lo, hi = bounds[b], bounds[b + 1]
+        if lo == hi:
+            continue
+        block = X[start:min(start + step, X.shape[0])].astype(dtype, copy=True)
+        transform(block, start)
+        parts.append(block[sorted_index[lo:hi] - start])
+
+    if not parts:
+        return sparse.csr_matrix((0, X.shape[1]), dtype=dtype)
+    out = sparse.vstack(parts, format="csr")
+    # Back to the requested row order
+    return out[np.argsort(order, kind="stable")]
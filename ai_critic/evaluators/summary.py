@@ -4,11 +4,30 @@ class HumanSummary:
     of the AI Critic technical report.
     """
 
-    def generate(self, report: dict) -> dict:
-        leakage = report["data"]["data_leakage"]["suspected"]
-        perfect_cv = report["performance"]["suspiciously_perfect"]
-        robustness_verdict = report["robustness"].get("verdict")
-        structural_warnings = report["config"]["structural_warnings"]
+    def generate(self, report: dict, pending=()) -> dict:
+        """
+        Parameters
+        ----------
+        report : dict
+            Evaluator outputs; missing evaluators are treated as not
+            run yet (streamed audits summarize partial results).
+        pending : iterable of str
+            Evaluators still running. Without a risk found so far, the
+            verdict stays "Incomplete" until they finish.
+        """
+        pending = list(pending)
+        data = report.get("data")
+        performance = report.get("performance")
+        leakage = bool(data and data["data_leakage"]["suspected"])
+        perfect_cv = bool(performance and performance["suspiciously_perfect"])
+        robustness_verdict = (report.get("robustness") or {}).get("verdict")
+        structural_warnings = (report.get("config") or {}).get("structural_warnings", [])
+        overfitting = (report.get("learning_curve") or {}).get("overfitting", False)
+        degraded = {
+            name: result["degraded"]
+            for name, result in report.items()
+            if isinstance(result, dict) and "degraded" in result
+        }
 
         # =========================
         # Executive summary
@@ -23,6 +42,11 @@ class HumanSummary:
             risk_level = "medium"
             deploy = False
             main_reason = "Structural or robustness-related risks detected."
+        elif pending:
+            verdict = "⏳ Incomplete"
+            risk_level = "unknown"
+            deploy = False
+            main_reason = f"No risk detected so far; waiting for: {', '.join(pending)}."
         else:
             verdict = "✅ Acceptable"
             risk_level = "low"
@@ -40,6 +64,9 @@ class HumanSummary:
                 if verdict == "❌ Unreliable"
                 else
                 "The model shows acceptable behavior under current evaluation heuristics."
+                if verdict != "⏳ Incomplete"
+                else
+                "Partial audit: the verdict may still change."
             )
         }
 
@@ -86,16 +113,31 @@ class HumanSummary:
                 "Consider regularization or simpler model architecture."
             )
 
+        if overfitting:
+            key_risks.append(
+                "Training score is far above validation score (train/validation gap "
+                f"{report['learning_curve']['train_validation_gap']:.2f})."
+            )
+            recommendations.append(
+                "Regularize the model or collect more training data."
+            )
+
         technical_summary = {
             "key_risks": key_risks or ["No significant risks detected."],
             "model_health": {
-                "data_leakage": leakage,
-                "suspicious_cv": perfect_cv,
+                "data_leakage": leakage if data else None,
+                "suspicious_cv": perfect_cv if performance else None,
                 "structural_risk": bool(structural_warnings),
-                "robustness_verdict": robustness_verdict
+                "robustness_verdict": robustness_verdict,
+                "overfitting": overfitting
             },
             "recommendations": recommendations
         }
+        if degraded:
+            # Cheaper variants run under an audit budget
+            technical_summary["degraded_evaluators"] = degraded
+        if pending:
+            technical_summary["pending_evaluators"] = pending
 
         return {
             "executive_summary": executive_summary,
@@ -1,6 +1,8 @@
 # validation.py
 import numpy as np
-from sklearn.model_selection import KFold, StratifiedKFold
+from sklearn.model_selection import KFold, ShuffleSplit, StratifiedKFold, StratifiedShuffleSplit
+
+from .seeding import int_seed
 
 def infer_problem_type(y):
     """
@@ -21,11 +23,16 @@ def infer_problem_type(y):
     return "regression"
 
 
-def make_cv(y, n_splits=3, random_state=42):
+def make_cv(y, n_splits=3, random_state=None):
     """
     Automatically selects the correct CV strategy.
+
+    ``random_state`` is the audit seed (int, ``SeedSequence`` or None,
+    see ``seeding.seed_tree``); the shuffle is seeded by its "cv"
+    branch.
     """
     problem_type = infer_problem_type(y)
+    random_state = int_seed(random_state, "cv")
 
     if problem_type == "classification":
         return StratifiedKFold(
@@ -39,3 +46,34 @@ def make_cv(y, n_splits=3, random_state=42):
         shuffle=True,
         random_state=random_state
     )
+
+
+def make_subsample(y, n_samples, random_state=None):
+    """
+    Row indices of a random subsample of ``n_samples`` rows, stratified
+    by class for classification targets (same rule as ``make_cv``).
+
+    Indices are sorted, so memory-mapped sources are read in order.
+    The draw is seeded by the ("subsample", n_samples) branch of the
+    audit seed ``random_state``.
+    """
+    y = np.asarray(y)
+    if n_samples >= len(y):
+        return np.arange(len(y))
+    random_state = int_seed(random_state, "subsample", n_samples)
+
+    if infer_problem_type(y) == "classification":
+        splitter = StratifiedShuffleSplit(
+            n_splits=1,
+            train_size=n_samples,
+            random_state=random_state
+        )
+    else:
+        splitter = ShuffleSplit(
+            n_splits=1,
+            train_size=n_samples,
+            random_state=random_state
+        )
+
+    index, _ = next(splitter.split(np.zeros((len(y), 1)), y))
+    return np.sort(index)
@@ -0,0 +1,136 @@
+import importlib
+from pathlib import Path
+
+import numpy as np
+from scipy import sparse
+
+# Keys written by scipy.sparse.save_npz
+_SPARSE_NPZ_KEYS = {"format", "shape", "data"}
+
+
+def _split_member(ref):
+    # "data.npz:X" / "data.parquet:label" -> (path, member)
+    ref = str(ref)
+    for suffix in (".npz:", ".parquet:"):
+        if suffix in ref:
+            path, member = ref.rsplit(":", 1)
+            return Path(path), member
+    return Path(ref), None
+
+
+def load_npz(path, key=None):
+    """
+    One array of an ``.npz`` archive. Archives written by
+    ``scipy.sparse.save_npz`` are loaded as CSR matrices.
+    """
+    with np.load(path) as archive:
+        if key is None and _SPARSE_NPZ_KEYS <= set(archive.files):
+            return sparse.load_npz(path).tocsr()
+        if key is None:
+            if len(archive.files) != 1:
+                raise ValueError(f"{path} holds {archive.files}; pick one with '{path}:<key>'.")
+            key = archive.files[0]
+        return archive[key]
+
+
+def _parquet_file(path):
+    try:
+        pq = importlib.import_module("pyarrow.parquet")
+    except ImportError as exc:
+        raise ImportError(
+            "Reading parquet files requires pyarrow: pip install pyarrow"
+        ) from exc
+    return pq.ParquetFile(path)
+
+
+def _column(parquet, name):
+    return parquet.read(columns=[name]).column(0).to_numpy()
+
+
+def read_parquet(path, target=None, features=None, dtype=np.float64):
+    """
+    Read a parquet file column by column into a preallocated matrix.
+
+    Only one column is decoded at a time, so the peak memory is the
+    feature matrix plus one column (no intermediate DataFrame).
+
+    Parameters
+    ----------
+    target : str or None
+        Target column, returned separately and excluded from features.
+    features : list of str or None
+        Feature columns (default: every column but ``target``).
+
+    Returns
+    -------
+    (X, y)
+        ``y`` is None without ``target``.
+    """
+    parquet = _parquet_file(path)
+    names = parquet.schema_arrow.names
+    if features is None:
+        features = [name for name in names if name != target]
+
+    X = np.empty((parquet.metadata.num_rows, len(features)), dtype=dtype)
+    for j, name in enumerate(features):
+        X[:, j] = _column(parquet, name)
+
+    y = None if target is None else _column(parquet, target)
+    return X, y
+
+
+def load_file(ref):
+    """
+    Load one array reference without copying where possible.
+
+    - ``X.npy`` : memory-mapped (read-only)
+    - ``data.npz`` / ``data.npz:key`` : archive member (sparse archives
+      become CSR matrices)
+    - ``data.parquet:column`` : a single column
+    """
+    path, member = _split_member(ref)
+    suffix = path.suffix.lower()
+    if suffix == ".npy":
+        return np.load(path, mmap_mode="r")
+    if suffix == ".npz":
+        return load_npz(path, member)
+    if suffix == ".parquet":
+        if member is None:
+            raise ValueError(f"Name the column to read: '{path}:<column>'.")
+        return _column(_parquet_file(path), member)
+    raise ValueError(f"Unsupported array file: {path}")
+
+
+def load_dataset(spec):
+    """
+    Load ``(X, y)`` from a dataset spec.
+
+    Parameters
+    ----------
+    spec : dict
+        - ``{"X": ref, "y": ref}`` : one ``load_file`` reference each
+        - ``{"path": "data.npz", "X": "X", "y": "y"}`` : archive keys
+        - ``{"path": "data.parquet", "target": "label",
+          "features": [...]}`` : parquet columns
+    """
+    if "path" in spec:
+        path = Path(spec["path"])
+        if path.suffix.lower() == ".parquet":
+            if "target" not in spec:
+                raise ValueError(f"Parquet dataset {path} needs a 'target' column.")
+            return read_parquet(path, spec["target"], spec.get("features"))
+        if path.suffix.lower() == ".npz":
+            return load_npz(path, spec.get("X", "X")), load_npz(path, spec.get("y", "y"))
+        raise ValueError(f"Unsupported dataset file: {path}")
+    return load_file(spec["X"]), load_file(spec["y"])
+
+
+def load_model(path):
+    """
+    Unpickle a model saved with joblib or pickle.
+
+    Only load files you trust: unpickling runs arbitrary code.
+    """
+    import joblib
+
+    return joblib.load(path)
@@ -0,0 +1,232 @@
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+
+import numpy as np
+from scipy import sparse
+
+from ai_critic.evaluators.streaming import DEFAULT_BLOCK_BYTES, iter_row_blocks
+
+# File name of every plot inside the output directory
+PLOT_FILES = {
+    "heatmap": "heatmap_correlation.png",
+    "performance": "performance.png",
+    "robustness": "robustness.png",
+}
+
+
+def _figure(figsize):
+    # Figure + Agg canvas instead of pyplot: no global state, so figures
+    # can be rendered from a worker thread without a display
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+    from matplotlib.figure import Figure
+
+    figure = Figure(figsize=figsize)
+    FigureCanvasAgg(figure)
+    return figure
+
+
+def top_k_correlation(X, y, features, block_bytes=DEFAULT_BLOCK_BYTES):
+    """
+    Correlation matrix of the selected feature columns and the target
+    (target last), streamed over row blocks in O(n k²).
+    """
+    features = np.asarray(features, dtype=np.int64)
+    k = len(features) + 1
+    sums = np.zeros(k)
+    gram = np.zeros((k, k))
+    shift = None
+    n = 0
+
+    for start, stop, block in iter_row_blocks(X, block_bytes):
+        columns = block[:, features]
+        columns = columns.toarray() if sparse.issparse(columns) else np.asarray(columns)
+        Z = np.column_stack([columns, np.asarray(y[start:stop])]).astype(np.float64)
+        # Shifted sums keep the one-pass covariance well conditioned
+        if shift is None:
+            shift = Z.mean(axis=0)
+        Z -= shift
+        sums += Z.sum(axis=0)
+        gram += Z.T @ Z
+        n += len(Z)
+
+    cov = gram - np.outer(sums, sums) / max(n, 1)
+    std = np.sqrt(np.diag(cov))
+    with np.errstate(divide="ignore", invalid="ignore"):
+        return cov / np.outer(std, std)
+
+
+def _plotted(name, details, top_k=20):
+    # Same skip conditions as the renderers below, so that paths() only
+    # announces files that will actually be written
+    if name == "heatmap":
+        return bool(details["data"].get("top_correlated_features", [])[:top_k])
+    if name == "performance":
+        return bool(details["performance"].get("cv_scores"))
+    return bool(details["robustness"].get("degradation_curve", []))
+
+
+def render_heatmap(data_report, X, y, path, top_k=20):
+    """
+    Heatmap of the ``top_k`` features most correlated with the target.
+    """
+    top = data_report.get("top_correlated_features", [])[:top_k]
+    if not top:
+        return None
+    features = [f["feature_index"] for f in top]
+    corr = top_k_correlation(X, y, features)
+    labels = [f"feat_{i}" for i in features] + ["target"]
+
+    figure = _figure((8, 7))
+    ax = figure.add_subplot()
+    image = ax.imshow(corr, cmap="coolwarm", vmin=-1, vmax=1)
+    ax.set_xticks(range(len(labels)), labels, rotation=90, fontsize=7)
+    ax.set_yticks(range(len(labels)), labels, fontsize=7)
+    ax.set_title(f"Correlação Features x Target (top {len(features)})")
+    figure.colorbar(image, ax=ax)
+    figure.tight_layout()
+    figure.savefig(path, dpi=150)
+    return path
+
+
+def render_performance(performance_report, path, learning_curve_report=None):
+    """
+    CV fold scores with their mean and, when available, the learning
+    curve next to them.
+    """
+    scores = performance_report.get("cv_scores")
+    if not scores:
+        return None
+
+    curve = learning_curve_report or {}
+    figure = _figure((11, 4) if curve else (6, 4))
+    ax = figure.add_subplot(1, 2 if curve else 1, 1)
+    folds = np.arange(1, len(scores) + 1)
+    ax.bar(folds, scores, color="steelblue", label="Fold")
+    ax.axhline(performance_report["cv_mean_score"], color="black", linestyle="--", label="Média")
+    ax.set_xticks(folds)
+    ax.set_xlabel("Fold")
+    ax.set_ylabel("Score")
+    ax.set_ylim(min(0.0, min(scores)), 1.0)
+    ax.set_title("Validação Cruzada")
+    ax.legend()
+
+    if curve:
+        ax = figure.add_subplot(1, 2, 2)
+        ax.plot(curve["train_sizes"], curve["train_scores"], marker="o", label="Treino")
+        ax.plot(curve["train_sizes"], curve["validation_scores"], marker="o", label="Validação")
+        ax.set_xlabel("Fração do conjunto de treino")
+        ax.set_ylabel("Score")
+        ax.set_title("Curva de Aprendizado")
+        ax.legend()
+    figure.tight_layout()
+    figure.savefig(path, dpi=150)
+    return path
+
+
+def render_robustness(robustness_report, path):
+    """
+    Degradation curve of the score under increasing noise.
+    """
+    curves = {"Todas as features": robustness_report.get("degradation_curve", [])}
+    curves.update(robustness_report.get("feature_groups", {}))
+    if not curves["Todas as features"]:
+        return None
+    clean = robustness_report["cv_score_original"]
+
+    figure = _figure((5, 4))
+    ax = figure.add_subplot()
+    for i, (name, curve) in enumerate(curves.items()):
+        ax.plot(
+            [0.0] + [p["noise_level"] for p in curve],
+            [clean] + [p["cv_score"] for p in curve],
+            marker="o" if i == 0 else ".",
+            linestyle="-" if i == 0 else "--",
+            label=name
+        )
+    ax.set_xlabel("Nível de ruído (× desvio padrão)")
+    ax.set_ylabel("CV Score")
+    ax.set_title("Robustez do Modelo")
+    ax.set_ylim(0, 1)
+    ax.legend()
+    figure.tight_layout()
+    figure.savefig(path, dpi=150)
+    return path
+
+
+class PlotRenderer:
+    """
+    Renders audit plots from already-computed evaluator results.
+
+    Rendering happens on one background thread with the headless Agg
+    backend, so ``AICritic.evaluate(plot=True)`` returns as soon as the
+    evaluators are done; nothing is shown on screen.
+    """
+
+    def __init__(self, output_dir="ai_critic_plots", top_k=20):
+        """
+        Parameters
+        ----------
+        output_dir : str or Path
+            Directory the PNG files are written to (created if needed).
+        top_k : int
+            Number of features in the correlation heatmap.
+        """
+        self.output_dir = Path(output_dir)
+        self.top_k = top_k
+        self._executor = None
+        self._futures = []
+
+    def paths(self, details=None):
+        """
+        Destination of the plots, known before rendering finishes.
+
+        Parameters
+        ----------
+        details : dict or None
+            Evaluator results. When given, only the plots they have data
+            for (and that ``render`` will write) are returned; otherwise
+            every possible destination.
+        """
+        return {
+            name: str(self.output_dir / file)
+            for name, file in PLOT_FILES.items()
+            if details is None or _plotted(name, details, self.top_k)
+        }
+
+    def render(self, details, X, y):
+        """
+        Render synchronously and return ``{name: path}`` of the written
+        plots.
+        """
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        paths = self.paths(details)
+        renderers = {
+            "heatmap": lambda path: render_heatmap(details["data"], X, y, path, self.top_k),
+            "performance": lambda path: render_performance(
+                details["performance"], path, details.get("learning_curve")
+            ),
+            "robustness": lambda path: render_robustness(details["robustness"], path),
+        }
+        written = {name: renderers[name](path) for name, path in paths.items()}
+        return {name: path for name, path in written.items() if path is not None}
+
+    def submit(self, details, X, y):
+        """
+        Render in the background; returns a Future of ``render``.
+        """
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="ai_critic_plots")
+        future = self._executor.submit(self.render, details, X, y)
+        self._futures.append(future)
+        return future
+
+    def wait(self, timeout=None):
+        """
+        Block until every submitted rendering is done and return the
+        paths written by the last one. Rendering errors are raised here.
+        """
+        written = {}
+        futures, self._futures = self._futures, []
+        for future in futures:
+            written = future.result(timeout=timeout)
+        return written
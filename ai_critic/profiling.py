@@ -0,0 +1,125 @@
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+try:
+    import resource
+except ImportError:  # Windows
+    resource = None
+
+
+def peak_rss_bytes():
+    """
+    Peak resident set size of the process so far, or None when the
+    platform does not report it.
+    """
+    if resource is None:
+        return None
+    peak = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # kilobytes on Linux, bytes on macOS
+    return int(peak if sys.platform == "darwin" else peak * 1024)
+
+
+class ProfileHook:
+    """
+    Receives instrumentation metrics, e.g. to forward them to an
+    external collector. Override the methods you need.
+    """
+
+    def on_stage_end(self, stage, metrics):
+        """
+        Called after every evaluator stage with its metrics
+        (``wall_time``, ``cpu_time``, ``peak_rss_bytes``, ``n_fits``).
+        """
+
+    def on_run_end(self, profile):
+        """
+        Called once per audit with the complete profile.
+        """
+
+
+class Profiler:
+    """
+    Per-stage wall time, CPU time, peak RSS and model fit count.
+
+    - ``cpu_time`` is process CPU time, so stages running concurrently
+      (``n_jobs``) overlap, and fits in loky worker processes are not
+      included.
+    - ``peak_rss_bytes`` is the process high-water mark at the end of
+      the stage: a stage that raises it is the one that allocated.
+    - ``n_fits`` counts the fold fits triggered by the stage itself;
+      folds reused from another stage are not counted twice.
+
+    A stage that runs several times (progressive audits) accumulates.
+    """
+
+    def __init__(self, hooks=()):
+        self.hooks = list(hooks)
+        self.stages = {}
+        self._lock = threading.Lock()
+        self._start = time.perf_counter()
+        self._cpu_start = time.process_time()
+
+    @contextmanager
+    def stage(self, name, fit_counter=None):
+        """
+        Measure the enclosed block as stage ``name``.
+
+        ``fit_counter`` returns the number of fits done so far by the
+        calling thread (see ``FoldEngine.thread_fits``).
+        """
+        fits = fit_counter() if fit_counter else 0
+        wall = time.perf_counter()
+        cpu = time.process_time()
+        try:
+            yield
+        finally:
+            metrics = {
+                "wall_time": time.perf_counter() - wall,
+                "cpu_time": time.process_time() - cpu,
+                "peak_rss_bytes": peak_rss_bytes(),
+                "n_fits": (fit_counter() - fits) if fit_counter else 0,
+            }
+            with self._lock:
+                self._record(name, metrics)
+            for hook in self.hooks:
+                hook.on_stage_end(name, metrics)
+
+    def wrap(self, name, func, fit_counter=None):
+        """
+        ``func`` measured as stage ``name`` on every call.
+        """
+        def wrapped(*args, **kwargs):
+            with self.stage(name, fit_counter):
+                return func(*args, **kwargs)
+        return wrapped
+
+    def _record(self, name, metrics):
+        total = self.stages.get(name)
+        if total is None:
+            self.stages[name] = dict(metrics, calls=1)
+            return
+        for key in ("wall_time", "cpu_time", "n_fits"):
+            total[key] += metrics[key]
+        if metrics["peak_rss_bytes"] is not None:
+            total["peak_rss_bytes"] = max(total["peak_rss_bytes"], metrics["peak_rss_bytes"])
+        total["calls"] += 1
+
+    def report(self):
+        """
+        Profile of the audit (``stages`` plus ``total``), sent to every
+        hook's ``on_run_end``.
+        """
+        profile = {
+            "stages": {name: dict(metrics) for name, metrics in self.stages.items()},
+            "total": {
+                "wall_time": time.perf_counter() - self._start,
+                "cpu_time": time.process_time() - self._cpu_start,
+                "peak_rss_bytes": peak_rss_bytes(),
+                "n_fits": sum(m["n_fits"] for m in self.stages.values()),
+            },
+        }
+        for hook in self.hooks:
+            hook.on_run_end(profile)
+        return profile
@@ -1,3 +1,5 @@
+from .cache import ResultCache
 from .store import CriticSessionStore
+from .trends import detect_regressions, rolling_baseline
 
-__all__ = ["CriticSessionStore"]
+__all__ = ["CriticSessionStore", "ResultCache", "detect_regressions", "rolling_baseline"]
@@ -0,0 +1,102 @@
+import os
+import pickle
+import tempfile
+import time
+from pathlib import Path
+
+
+class ResultCache:
+    """
+    Content-addressed on-disk cache of evaluation payloads.
+
+    Entries are keyed by ``AICritic.fingerprint()`` (X/y content hash,
+    estimator params, CV splitter config and ai_critic version), so an
+    unchanged re-audit is served from disk instead of re-fitting the CV
+    folds. Writes are atomic, which makes the cache safe to share
+    between concurrent processes.
+    """
+
+    def __init__(
+        self,
+        base_dir: str | None = None,
+        max_bytes: int = 512 * 1024 * 1024,
+        max_age: float = 30 * 24 * 3600,
+    ):
+        """
+        Parameters
+        ----------
+        base_dir : str or None
+            Cache directory. Defaults to ``cache/`` inside the
+            ``CriticSessionStore`` directory.
+        max_bytes : int
+            Total size above which the least recently used entries are
+            evicted.
+        max_age : float
+            Entries older than this many seconds are evicted.
+        """
+        self.base_dir = Path(
+            base_dir or Path.home() / ".ai_critic_sessions" / "cache"
+        )
+        self.base_dir.mkdir(parents=True, exist_ok=True)
+        self.max_bytes = max_bytes
+        self.max_age = max_age
+
+    def _entry_path(self, key: str) -> Path:
+        return self.base_dir / f"{key}.pkl"
+
+    def get(self, key: str) -> dict | None:
+        path = self._entry_path(key)
+        try:
+            if time.time() - path.stat().st_mtime > self.max_age:
+                path.unlink(missing_ok=True)
+                return None
+            with open(path, "rb") as f:
+                payload = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return None
+
+        # Touch the entry so eviction keeps recently used results
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        return payload
+
+    def put(self, key: str, payload: dict):
+        fd, tmp_path = tempfile.mkstemp(dir=self.base_dir, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+            os.replace(tmp_path, self._entry_path(key))
+        except BaseException:
+            Path(tmp_path).unlink(missing_ok=True)
+            raise
+        self.evict()
+
+    def evict(self):
+        """
+        Remove expired entries, then the least recently used ones until
+        the cache fits in ``max_bytes``.
+        """
+        now = time.time()
+        entries = []
+        for path in self.base_dir.glob("*.pkl"):
+            try:
+                stat = path.stat()
+            except OSError:
+                continue
+            if now - stat.st_mtime > self.max_age:
+                path.unlink(missing_ok=True)
+            else:
+                entries.append((stat.st_mtime, stat.st_size, path))
+
+        total = sum(size for _, size, _ in entries)
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            path.unlink(missing_ok=True)
+            total -= size
+
+    def clear(self):
+        for path in self.base_dir.glob("*.pkl"):
+            path.unlink(missing_ok=True)
@@ -1,33 +1,295 @@
+import asyncio
 import json
+import sqlite3
+from contextlib import closing
+from datetime import datetime, timezone
 from pathlib import Path
-from datetime import datetime
+
+import numpy as np
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    name TEXT NOT NULL,
+    timestamp REAL NOT NULL,
+    global_score NUMERIC,
+    payload TEXT NOT NULL
+);
+-- Covering indexes: score queries never touch the payload pages
+CREATE INDEX IF NOT EXISTS runs_name_timestamp ON runs (name, timestamp, global_score);
+CREATE INDEX IF NOT EXISTS runs_timestamp ON runs (timestamp, name, global_score);
+
+CREATE TABLE IF NOT EXISTS scores (
+    run_id INTEGER NOT NULL REFERENCES runs (id) ON DELETE CASCADE,
+    component TEXT NOT NULL,
+    value NUMERIC,
+    PRIMARY KEY (run_id, component)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS scores_component ON scores (component, run_id, value);
+"""
 
 
 class CriticSessionStore:
     """
-    Simple local persistence layer for ai-critic sessions.
+    Local persistence layer for ai-critic sessions.
+
+    Every save is kept as a new run in an embedded SQLite database
+    (``sessions.db``). Global and component scores live in their own
+    indexed columns, so score queries never deserialize the detail
+    payloads. The database runs in WAL mode with a busy timeout, which
+    makes concurrent writers (e.g. parallel CI jobs) safe.
+
+    Sessions written by older versions as ``<name>.json`` files are
+    still readable.
     """
 
-    def __init__(self, base_dir: str | None = None):
+    def __init__(self, base_dir: str | None = None, timeout: float = 30.0):
         self.base_dir = Path(
             base_dir or Path.home() / ".ai_critic_sessions"
         )
         self.base_dir.mkdir(parents=True, exist_ok=True)
+        self.db_path = self.base_dir / "sessions.db"
+        self.timeout = timeout
+
+        with closing(self._connect()) as conn:
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.executescript(_SCHEMA)
+
+    def _connect(self) -> sqlite3.Connection:
+        # One short-lived connection per operation: safe across threads
+        # and processes
+        conn = sqlite3.connect(
+            self.db_path, timeout=self.timeout, isolation_level=None
+        )
+        conn.execute("PRAGMA foreign_keys=ON")
+        return conn
 
     def _session_path(self, name: str) -> Path:
         return self.base_dir / f"{name}.json"
 
-    def save(self, name: str, payload: dict):
-        data = {
-            "timestamp": datetime.utcnow().isoformat(),
-            "payload": payload
-        }
-        with open(self._session_path(name), "w") as f:
-            json.dump(data, f, indent=2)
-
-    def load(self, name: str) -> dict | None:
+    def _load_legacy(self, name: str) -> dict | None:
         path = self._session_path(name)
         if not path.exists():
             return None
         with open(path) as f:
             return json.load(f)["payload"]
+
+    def save(self, name: str, payload: dict) -> int:
+        """
+        Store a new run of session ``name`` and return its run id.
+        """
+        scores = payload.get("scores") or {}
+        components = {
+            key: value
+            for key, value in scores.get("components", {}).items()
+            if isinstance(value, (int, float))
+        }
+
+        with closing(self._connect()) as conn:
+            conn.execute("BEGIN IMMEDIATE")
+            try:
+                cursor = conn.execute(
+                    "INSERT INTO runs (name, timestamp, global_score, payload) "
+                    "VALUES (?, ?, ?, ?)",
+                    (
+                        name,
+                        datetime.now(timezone.utc).timestamp(),
+                        scores.get("global"),
+                        json.dumps(payload),
+                    ),
+                )
+                run_id = cursor.lastrowid
+                conn.executemany(
+                    "INSERT INTO scores (run_id, component, value) VALUES (?, ?, ?)",
+                    [(run_id, key, value) for key, value in components.items()],
+                )
+                conn.execute("COMMIT")
+            except BaseException:
+                conn.execute("ROLLBACK")
+                raise
+        return run_id
+
+    async def asave(self, name: str, payload: dict) -> int:
+        """
+        ``save`` from a coroutine: serialization and the SQLite write
+        run in a worker thread, so the event loop is not blocked.
+        """
+        return await asyncio.to_thread(self.save, name, payload)
+
+    def _latest_run_id(self, conn, name: str) -> int | None:
+        row = conn.execute(
+            "SELECT id FROM runs WHERE name = ? ORDER BY timestamp DESC, id DESC LIMIT 1",
+            (name,),
+        ).fetchone()
+        return row[0] if row else None
+
+    def load(self, name: str) -> dict | None:
+        """
+        Payload of the latest run of session ``name``.
+        """
+        with closing(self._connect()) as conn:
+            row = conn.execute(
+                "SELECT payload FROM runs WHERE name = ? "
+                "ORDER BY timestamp DESC, id DESC LIMIT 1",
+                (name,),
+            ).fetchone()
+        if row is None:
+            return self._load_legacy(name)
+        return json.loads(row[0])
+
+    def load_scores(self, name: str) -> dict | None:
+        """
+        Scores of the latest run of session ``name``, read from the
+        score columns only.
+        """
+        with closing(self._connect()) as conn:
+            run_id = self._latest_run_id(conn, name)
+            if run_id is None:
+                legacy = self._load_legacy(name)
+                return legacy.get("scores") if legacy else None
+
+            (global_score,) = conn.execute(
+                "SELECT global_score FROM runs WHERE id = ?", (run_id,)
+            ).fetchone()
+            components = conn.execute(
+                "SELECT component, value FROM scores WHERE run_id = ?", (run_id,)
+            ).fetchall()
+
+        if global_score is None and not components:
+            return None
+        return {"global": global_score, "components": dict(components)}
+
+    def history(self, name: str) -> list[dict]:
+        """
+        Every run of session ``name`` (oldest first), without payloads.
+        """
+        with closing(self._connect()) as conn:
+            runs = conn.execute(
+                "SELECT id, timestamp, global_score FROM runs "
+                "WHERE name = ? ORDER BY timestamp, id",
+                (name,),
+            ).fetchall()
+            components = {}
+            for run_id, component, value in conn.execute(
+                "SELECT s.run_id, s.component, s.value FROM scores s "
+                "JOIN runs r ON r.id = s.run_id WHERE r.name = ?",
+                (name,),
+            ):
+                components.setdefault(run_id, {})[component] = value
+
+        return [
+            {
+                "run_id": run_id,
+                "timestamp": datetime.fromtimestamp(ts, timezone.utc).isoformat(),
+                "scores": {
+                    "global": global_score,
+                    "components": components.get(run_id, {}),
+                },
+            }
+            for run_id, ts, global_score in runs
+        ]
+
+    def score_series(self, prefix: str | None = None, since=None, until=None,
+                     components=None) -> dict:
+        """
+        Columnar score series over many runs, oldest first.
+
+        Only the indexed score columns are read (covering indexes, no
+        payload pages) and payloads are never deserialized. The cost is
+        then linear in the selected rows and dominated by the sqlite3
+        module building Python rows: about 2 µs per run and component,
+        i.e. 0.2-0.8 s for 100k runs with a few components (see
+        ``store-*-series`` in ``benchmarks/bench_audit.py``). Narrow
+        ``prefix``, the time range or ``components`` on larger stores.
+
+        Parameters
+        ----------
+        prefix : str or None
+            Only sessions whose name starts with ``prefix``.
+        since, until : datetime, float, str or None
+            Time range (datetime, POSIX timestamp or ISO string).
+        components : iterable of str or None
+            Components to load. None loads all of them; an empty list
+            only reads the global score.
+
+        Returns
+        -------
+        dict
+            ``run_id``, ``name``, ``timestamp`` (POSIX seconds) and
+            ``global`` arrays, plus ``components``: one float array per
+            component, NaN where a run lacks it.
+        """
+        where, params = [], []
+        if prefix:
+            # Range scan on the (name, timestamp) index instead of LIKE
+            where.append("r.name >= ? AND r.name < ?")
+            params += [prefix, prefix + "\U0010ffff"]
+        if since is not None:
+            where.append("r.timestamp >= ?")
+            params.append(_to_timestamp(since))
+        if until is not None:
+            where.append("r.timestamp <= ?")
+            params.append(_to_timestamp(until))
+        clause = f"WHERE {' AND '.join(where)}" if where else ""
+
+        # Filtered queries are driven by the runs indexes (CROSS JOIN fixes
+        # the join order); unfiltered ones read the scores index only
+        if where:
+            comp_query = (
+                "SELECT s.run_id, s.value FROM runs r CROSS JOIN scores s "
+                f"ON s.run_id = r.id AND s.component = ? {clause}"
+            )
+        else:
+            comp_query = "SELECT s.run_id, s.value FROM scores s WHERE s.component = ?"
+
+        with closing(self._connect()) as conn:
+            runs = conn.execute(
+                f"SELECT r.id, r.name, r.timestamp, r.global_score FROM runs r "
+                f"{clause} ORDER BY r.timestamp",
+                params,
+            ).fetchall()
+
+            if components is None:
+                components = [
+                    row[0] for row in
+                    conn.execute("SELECT DISTINCT component FROM scores ORDER BY component")
+                ]
+            # One query per component keeps rows numeric (run_id, value)
+            columns = {
+                component: conn.execute(comp_query, [component] + params).fetchall()
+                for component in components
+            }
+
+        run_ids, names, timestamps, global_scores = (
+            zip(*runs) if runs else ((), (), (), ())
+        )
+        series = {
+            "run_id": np.array(run_ids, dtype=np.int64),
+            "name": np.array(names, dtype=object),
+            "timestamp": np.array(timestamps, dtype=np.float64),
+            "global": np.array(global_scores, dtype=np.float64),
+            "components": {},
+        }
+
+        order = np.argsort(series["run_id"])
+        for component, rows in columns.items():
+            column = np.full(len(run_ids), np.nan)
+            if rows:
+                rows = np.array(rows, dtype=np.float64)
+                positions = order[np.searchsorted(
+                    series["run_id"], rows[:, 0].astype(np.int64), sorter=order
+                )]
+                column[positions] = rows[:, 1]
+            series["components"][component] = column
+
+        return series
+
+
+def _to_timestamp(value) -> float:
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    if isinstance(value, datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=timezone.utc)
+        return value.timestamp()
+    return float(value)
@@ -0,0 +1,80 @@
+import warnings
+
+import numpy as np
+from numpy.lib.stride_tricks import sliding_window_view
+
+
+def rolling_baseline(values, window=5, groups=None):
+    """
+    Median of the ``window`` previous values for every position.
+
+    With ``groups`` (one label per position), the previous values are
+    taken within the position's own group only. Positions without a
+    full window of history are NaN.
+    """
+    values = np.asarray(values, dtype=np.float64)
+    baseline = np.full(len(values), np.nan)
+    if groups is None:
+        groups = np.zeros(len(values), dtype=np.int64)
+    else:
+        _, groups = np.unique(np.asarray(groups, dtype=object), return_inverse=True)
+
+    # Group once: a stable sort keeps each group's rows in their order
+    rows = np.argsort(groups, kind="stable")
+    starts = np.flatnonzero(np.r_[True, np.diff(groups[rows]) != 0])
+    # Rank of every sorted row inside its group
+    rank = np.arange(len(rows)) - np.repeat(starts, np.diff(np.r_[starts, len(rows)]))
+    ready = np.flatnonzero(rank >= window)
+    if len(ready):
+        # windows[i] holds sorted rows i .. i + window - 1
+        windows = sliding_window_view(values[rows], window)[ready - window]
+        with warnings.catch_warnings():
+            # All-NaN windows (component missing) stay NaN
+            warnings.simplefilter("ignore", RuntimeWarning)
+            baseline[rows[ready]] = np.nanmedian(windows, axis=1)
+    return baseline
+
+
+def detect_regressions(series, threshold=10.0, window=5, component="global"):
+    """
+    Flag runs whose score dropped more than ``threshold`` points below
+    the rolling baseline of the previous ``window`` runs of the same
+    session name, so series mixing several models (a prefix query)
+    compare each run with its own history only.
+
+    Parameters
+    ----------
+    series : dict
+        Output of ``CriticSessionStore.score_series``.
+    threshold : float
+        Minimum drop (in score points) to report.
+    window : int
+        Number of previous runs forming the baseline.
+    component : str
+        "global" or a component name (e.g. "robustness").
+
+    Returns
+    -------
+    list of dict
+        One entry per regression with ``run_id``, ``name``, ``timestamp``,
+        ``score``, ``baseline`` and ``drop``.
+    """
+    values = series["global"] if component == "global" else series["components"][component]
+    values = np.asarray(values, dtype=np.float64)
+    baseline = rolling_baseline(values, window, groups=series["name"])
+    drop = baseline - values
+
+    with np.errstate(invalid="ignore"):
+        flagged = np.flatnonzero(drop > threshold)
+
+    return [
+        {
+            "run_id": int(series["run_id"][i]),
+            "name": series["name"][i],
+            "timestamp": float(series["timestamp"][i]),
+            "score": float(values[i]),
+            "baseline": float(baseline[i]),
+            "drop": float(drop[i]),
+        }
+        for i in flagged
+    ]
@@ -0,0 +1,321 @@
+"""
+Audit throughput and scaling benchmarks.
+
+Runs ai_critic on synthetic datasets scaled across rows, features and
+model types, and records wall time, number of model fits and peak
+memory for every case.
+
+    python -m benchmarks.bench_audit --save baseline.json
+    python -m benchmarks.bench_audit --compare baseline.json
+
+``--preset quick`` (default) takes a few minutes; ``--preset full``
+scales up to 1e7 rows and 1e4 features (large datasets are written to
+memory-mapped ``.npy`` files) and takes much longer. ``--compare`` exits
+with status 1 when a case is slower, uses more memory or fits more
+models than the baseline allows.
+"""
+import argparse
+import itertools
+import json
+import platform
+import sys
+import tempfile
+import time
+import tracemalloc
+from datetime import datetime, timezone
+from pathlib import Path
+
+import numpy as np
+import sklearn
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.linear_model import LogisticRegression, Ridge
+
+import ai_critic
+from ai_critic import AICritic
+from ai_critic.evaluators import data, robustness
+from ai_critic.evaluators.folds import FoldEngine
+from ai_critic.evaluators.validation import make_cv
+from ai_critic.sessions import CriticSessionStore
+
+SEED = 0
+
+MODELS = {
+    "logreg": lambda: LogisticRegression(max_iter=200),
+    "forest": lambda: RandomForestClassifier(n_estimators=20, max_depth=8, random_state=SEED),
+    "ridge": lambda: Ridge(),
+}
+
+PRESETS = {
+    "quick": {
+        "audit": {"rows": [1_000, 10_000], "features": [10, 100], "models": ["logreg", "forest"]},
+        "data": {"rows": [10_000, 100_000], "features": [10, 100]},
+        "store_runs": [1_000],
+    },
+    "full": {
+        "audit": {
+            "rows": [1_000, 10_000, 100_000, 1_000_000],
+            "features": [10, 100, 1_000],
+            "models": ["logreg", "forest", "ridge"],
+        },
+        "data": {
+            "rows": [1_000, 100_000, 1_000_000, 10_000_000],
+            "features": [10, 100, 1_000, 10_000],
+        },
+        "store_runs": [1_000, 100_000],
+    },
+}
+
+# Datasets larger than this many cells are skipped (audits) or
+# memory-mapped from disk (data scans)
+MAX_AUDIT_CELLS = 10_000_000
+MAX_SCAN_CELLS = 1_000_000_000
+IN_MEMORY_CELLS = 10_000_000
+
+
+# =========================
+# Synthetic data
+# =========================
+def make_dataset(n_rows, n_features, task="classification", workdir=None, block=100_000):
+    """
+    Synthetic X/y with a linear signal on the first 5 features.
+
+    Datasets above ``IN_MEMORY_CELLS`` are generated block by block
+    into a memory-mapped ``.npy`` file inside ``workdir``.
+    """
+    rng = np.random.default_rng(SEED)
+    weights = np.zeros(n_features)
+    weights[:min(5, n_features)] = 1.0
+
+    if n_rows * n_features > IN_MEMORY_CELLS and workdir is not None:
+        path = Path(workdir) / f"X_{n_rows}_{n_features}.npy"
+        X = np.lib.format.open_memmap(path, mode="w+", dtype=np.float32,
+                                      shape=(n_rows, n_features))
+    else:
+        X = np.empty((n_rows, n_features), dtype=np.float32)
+    signal = np.empty(n_rows)
+
+    for start in range(0, n_rows, block):
+        rows = min(block, n_rows - start)
+        X[start:start + rows] = rng.standard_normal((rows, n_features))
+        signal[start:start + rows] = X[start:start + rows] @ weights
+
+    signal += rng.standard_normal(n_rows)
+    y = (signal > 0).astype(np.int64) if task == "classification" else signal
+    if isinstance(X, np.memmap):
+        X.flush()
+    return X, y
+
+
+# =========================
+# Measurement
+# =========================
+def measure(func, repeat=3):
+    """
+    Best-of-``repeat`` wall time, then one traced run for peak memory.
+
+    ``func`` returns the number of model fits it performed.
+    """
+    times = []
+    for _ in range(repeat):
+        start = time.perf_counter()
+        n_fits = func()
+        times.append(time.perf_counter() - start)
+
+    tracemalloc.start()
+    try:
+        func()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return {"wall_time": min(times), "n_fits": int(n_fits), "peak_memory_bytes": int(peak)}
+
+
+def audit_cases(preset):
+    config = PRESETS[preset]["audit"]
+    for model, n_rows, n_features in itertools.product(
+        config["models"], config["rows"], config["features"]
+    ):
+        if n_rows * n_features > MAX_AUDIT_CELLS:
+            continue
+        task = "regression" if model == "ridge" else "classification"
+        yield f"{model}-{n_rows}x{n_features}", model, task, n_rows, n_features
+
+
+def run_audit_case(model, task, n_rows, n_features, repeat):
+    X, y = make_dataset(n_rows, n_features, task)
+    results = {}
+
+    def evaluate():
+        critic = AICritic(MODELS[model](), X, y, profile=True)
+        return critic.evaluate(view="profile")["total"]["n_fits"]
+
+    def deploy_decision():
+        # evaluate + gate; a second call on the same critic is memoized
+        critic = AICritic(MODELS[model](), X, y, profile=True)
+        critic.deploy_decision()
+        critic.deploy_decision()
+        return critic.evaluate(view="profile")["total"]["n_fits"]
+
+    def robustness_sweep():
+        folds = FoldEngine(MODELS[model](), X, y, make_cv(y))
+        robustness.evaluate(folds.model, X, y, folds=folds, random_state=SEED)
+        return folds.n_fits
+
+    results["evaluate"] = measure(evaluate, repeat)
+    results["deploy_decision"] = measure(deploy_decision, repeat)
+    results["robustness"] = measure(robustness_sweep, repeat)
+    return results
+
+
+def run_data_cases(preset, repeat, workdir, keep):
+    config = PRESETS[preset]["data"]
+    for n_rows, n_features in itertools.product(config["rows"], config["features"]):
+        if n_rows * n_features > MAX_SCAN_CELLS or not keep(f"data-{n_rows}x{n_features}"):
+            continue
+        X, y = make_dataset(n_rows, n_features, workdir=workdir)
+
+        def scan():
+            data.evaluate(X, y)
+            return 0
+
+        yield f"data-{n_rows}x{n_features}", measure(scan, repeat)
+        del X
+
+
+def run_store_cases(preset, repeat, workdir, keep):
+    for n_runs in PRESETS[preset]["store_runs"]:
+        if not keep(f"store-{n_runs}"):
+            continue
+        store = CriticSessionStore(Path(workdir) / f"store_{n_runs}")
+        rng = np.random.default_rng(SEED)
+        payload = {"details": {"blob": "x" * 2_000}}
+
+        start = time.perf_counter()
+        for i in range(n_runs):
+            payload["scores"] = {
+                "global": int(rng.integers(0, 100)),
+                "components": {"robustness": int(rng.integers(0, 100))},
+            }
+            store.save(f"model-{i % 50}", payload)
+        save_time = (time.perf_counter() - start) / n_runs
+
+        def series():
+            store.score_series(prefix="model-1")
+            return 0
+
+        def series_all():
+            store.score_series()
+            return 0
+
+        # Both reads are linear in the selected runs (~2 µs per run and
+        # component, mostly sqlite3 row building): expect tenths of a
+        # second at 100k runs, not milliseconds
+        yield f"store-{n_runs}-save", {"wall_time": save_time, "n_fits": 0, "peak_memory_bytes": 0}
+        yield f"store-{n_runs}-series", measure(series, repeat)
+        yield f"store-{n_runs}-series-all", measure(series_all, repeat)
+
+
+def run(preset="quick", repeat=3, only=None):
+    """
+    Run a preset and return ``{"meta": ..., "results": {case: metrics}}``.
+    """
+    results = {}
+
+    def keep(name):
+        return only is None or only in name
+
+    with tempfile.TemporaryDirectory() as workdir:
+        for name, model, task, n_rows, n_features in audit_cases(preset):
+            if not keep(name):
+                continue
+            for target, metrics in run_audit_case(model, task, n_rows, n_features, repeat).items():
+                results[f"{target}/{name}"] = metrics
+                _report(f"{target}/{name}", metrics)
+
+        for name, metrics in itertools.chain(
+            run_data_cases(preset, repeat, workdir, keep),
+            run_store_cases(preset, repeat, workdir, keep),
+        ):
+            results[name] = metrics
+            _report(name, metrics)
+
+    return {
+        "meta": {
+            "preset": preset,
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "ai_critic": ai_critic.__version__,
+            "numpy": np.__version__,
+            "scikit-learn": sklearn.__version__,
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+        },
+        "results": results,
+    }
+
+
+def _report(name, metrics):
+    print(
+        f"{name:<40} {metrics['wall_time']:>10.4f}s "
+        f"{metrics['n_fits']:>4} fits {metrics['peak_memory_bytes'] / 2**20:>10.1f} MiB",
+        flush=True,
+    )
+
+
+# =========================
+# Baseline comparison
+# =========================
+def compare(current, baseline, time_tolerance=0.25, memory_tolerance=0.10):
+    """
+    Cases that regressed against ``baseline``.
+
+    A case regresses when its wall time or peak memory grows beyond
+    the tolerance (relative) or it performs more model fits.
+    """
+    regressions = []
+    for name, metrics in current["results"].items():
+        base = baseline["results"].get(name)
+        if base is None:
+            continue
+        if metrics["wall_time"] > base["wall_time"] * (1 + time_tolerance):
+            regressions.append((name, "wall_time", base["wall_time"], metrics["wall_time"]))
+        if metrics["peak_memory_bytes"] > base["peak_memory_bytes"] * (1 + memory_tolerance):
+            regressions.append(
+                (name, "peak_memory_bytes", base["peak_memory_bytes"], metrics["peak_memory_bytes"])
+            )
+        if metrics["n_fits"] > base["n_fits"]:
+            regressions.append((name, "n_fits", base["n_fits"], metrics["n_fits"]))
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--preset", choices=sorted(PRESETS), default="quick")
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument("--only", help="Only run cases whose name contains this string")
+    parser.add_argument("--save", help="Write results to this JSON file")
+    parser.add_argument("--compare", help="Baseline JSON file to compare against")
+    parser.add_argument("--time-tolerance", type=float, default=0.25)
+    parser.add_argument("--memory-tolerance", type=float, default=0.10)
+    args = parser.parse_args(argv)
+
+    current = run(args.preset, args.repeat, args.only)
+
+    if args.save:
+        with open(args.save, "w") as f:
+            json.dump(current, f, indent=2)
+
+    if args.compare:
+        with open(args.compare) as f:
+            baseline = json.load(f)
+        regressions = compare(current, baseline, args.time_tolerance, args.memory_tolerance)
+        for name, metric, before, after in regressions:
+            print(f"REGRESSION {name}: {metric} {before:.4g} -> {after:.4g}")
+        if regressions:
+            return 1
+        print("No regressions against baseline.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,112 @@
+import numpy as np
+import pytest
+
+from ai_critic.evaluators.adapters import ModelAdapter
+
+torch = pytest.importorskip("torch")
+
+
+def test_torch_adapter_mini_batches_and_chunked_predict(tmp_path):
+    torch.manual_seed(0)
+    rng = np.random.default_rng(0)
+    X = rng.random((500, 4), dtype=np.float32)
+    y = X @ np.arange(1, 5, dtype=np.float32)
+
+    model = torch.nn.Sequential(torch.nn.Linear(4, 16), torch.nn.ReLU(), torch.nn.Linear(16, 1))
+    adapter = ModelAdapter(
+        model, framework="torch", epochs=20, lr=1e-2,
+        batch_size=32, predict_batch_size=64, num_threads=1
+    )
+    previous_threads = torch.get_num_threads()
+    adapter.fit(X, y)
+
+    predictions = adapter.predict(X)
+    assert predictions.shape == (500,)
+    assert np.mean((predictions - y) ** 2) < 0.1 * np.var(y)
+    assert torch.get_num_threads() == previous_threads
+
+    # Read-only memmaps are consumed without copies or warnings
+    np.save(tmp_path / "X.npy", X)
+    X_mmap = np.load(tmp_path / "X.npy", mmap_mode="r")
+    np.testing.assert_allclose(adapter.predict(X_mmap), predictions)
+
+
+def test_torch_adapter_clones_from_initial_snapshot():
+    from sklearn.base import clone, is_classifier
+
+    model = torch.nn.Sequential(torch.nn.Linear(4, 8), torch.nn.ReLU(), torch.nn.Linear(8, 2))
+    adapter = ModelAdapter(model, framework="torch", task="classification", epochs=2)
+    initial = {k: v.clone() for k, v in model.state_dict().items()}
+
+    X = np.random.default_rng(0).random((100, 4), dtype=np.float32)
+    y = (X[:, 0] > 0.5).astype(int)
+    adapter.fit(X, y)
+
+    cloned = clone(adapter)
+    assert cloned.model is not adapter.model
+    for name, tensor in cloned.model.state_dict().items():
+        assert torch.equal(tensor, initial[name])
+
+    assert is_classifier(adapter)
+    assert adapter.get_params()["epochs"] == 2
+    assert adapter.n_parameters() == 4 * 8 + 8 + 8 * 2 + 2
+
+
+def test_torch_audit_uses_cv_machinery():
+    from ai_critic import AICritic
+
+    X = torch.randn(300, 6)
+    y = torch.randint(0, 2, (300,))
+    model = torch.nn.Sequential(torch.nn.Linear(6, 8), torch.nn.ReLU(), torch.nn.Linear(8, 2))
+
+    critic = AICritic(
+        model, X, y, framework="torch", adapter_kwargs={"task": "classification", "epochs": 2}
+    )
+    details = critic.evaluate(view="details")
+
+    assert details["config"]["n_trainable_weights"] == 6 * 8 + 8 + 8 * 2 + 2
+    assert details["performance"]["validation_strategy"] == "StratifiedKFold"
+    assert 0.0 <= details["robustness"]["cv_score_original"] <= 1.0
+
+
+def test_torch_single_output_loss_follows_the_task():
+    from sklearn.base import is_classifier, is_regressor
+
+    torch.manual_seed(0)
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(400, 3)).astype(np.float32)
+    binary = (X[:, 0] > 0).astype(int)
+    counts = rng.poisson(np.exp(X[:, 0]))
+
+    def net():
+        return torch.nn.Sequential(torch.nn.Linear(3, 8), torch.nn.ReLU(), torch.nn.Linear(8, 1))
+
+    # Integer targets without a task stay a regression (MSE), as before
+    regressor = ModelAdapter(net(), framework="torch", epochs=5)
+    assert is_regressor(regressor)
+    assert regressor.fit(X, counts).predict(X).shape == (400,)
+    regressor.fit(X, binary)
+
+    # A single-output classifier is trained on its logit
+    classifier = ModelAdapter(net(), framework="torch", task="classification", epochs=30, lr=1e-2)
+    assert is_classifier(classifier)
+    assert classifier.fit(X, binary).score(X, binary) > 0.9
+
+
+def test_torch_audits_are_reproducible_from_the_audit_seed():
+    from ai_critic import AICritic
+
+    X = np.random.default_rng(0).normal(size=(300, 4)).astype(np.float32)
+    y = X @ np.arange(1, 5, dtype=np.float32)
+
+    def cv_scores(global_seed):
+        torch.manual_seed(0)
+        model = torch.nn.Sequential(
+            torch.nn.Linear(4, 8), torch.nn.ReLU(), torch.nn.Dropout(0.2), torch.nn.Linear(8, 1)
+        )
+        # Global RNG state differs between the two audits
+        torch.manual_seed(global_seed)
+        critic = AICritic(model, X, y, framework="torch", random_state=3, adapter_kwargs={"epochs": 2})
+        return critic.evaluate(view="details")["performance"]["cv_scores"]
+
+    assert cv_scores(1) == cv_scores(2)
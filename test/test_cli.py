@@ -0,0 +1,50 @@
+import json
+
+import joblib
+import numpy as np
+from sklearn.datasets import load_iris
+from sklearn.linear_model import LogisticRegression
+from sklearn.tree import DecisionTreeClassifier
+
+from ai_critic import cli, loaders
+
+
+def test_cli_audits_manifest_and_loads_datasets_once(tmp_path, monkeypatch):
+    X, y = load_iris(return_X_y=True)
+    np.save(tmp_path / "X.npy", X)
+    np.save(tmp_path / "y.npy", y)
+    np.savez(tmp_path / "data.npz", X=X, y=y)
+    joblib.dump(LogisticRegression(max_iter=200), tmp_path / "logreg.joblib")
+    joblib.dump(DecisionTreeClassifier(random_state=0), tmp_path / "tree.pkl")
+
+    manifest = {
+        "datasets": {"iris": {"X": "X.npy", "y": "y.npy"}},
+        "audits": [
+            {"name": "logreg", "model": "logreg.joblib", "dataset": "iris"},
+            {"name": "tree", "model": "tree.pkl", "dataset": "iris"},
+            {"name": "archive", "model": "logreg.joblib", "path": "data.npz"},
+            {"name": "missing", "model": "logreg.joblib", "X": "nope.npy", "y": "y.npy"},
+        ],
+    }
+    (tmp_path / "manifest.json").write_text(json.dumps(manifest))
+
+    loads = []
+    load_dataset = cli.load_dataset
+    monkeypatch.setattr(cli, "load_dataset", lambda spec: loads.append(spec) or load_dataset(spec))
+
+    output = tmp_path / "results.jsonl"
+    code = cli.main([str(tmp_path / "manifest.json"), "-o", str(output), "-j", "2"])
+
+    records = [json.loads(line) for line in output.read_text().splitlines()]
+    assert [r["name"] for r in records] == ["logreg", "tree", "archive", "missing"]
+    assert len(loads) == 3
+    assert records[0]["deploy"] and records[0]["cv_mean_score"] > 0.9
+    assert records[0]["cv_mean_score"] == records[2]["cv_mean_score"]
+    assert "FileNotFoundError" in records[3]["error"]
+    assert code == cli.EXIT_ERROR
+
+
+def test_load_file_memory_maps_npy(tmp_path):
+    np.save(tmp_path / "X.npy", np.arange(6.0).reshape(3, 2))
+    X = loaders.load_file(tmp_path / "X.npy")
+    assert isinstance(X, np.memmap)
@@ -0,0 +1,127 @@
+import numpy as np
+
+from ai_critic.evaluators import data
+
+
+def test_leakage_scan_matches_corrcoef():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(300, 40))
+    y = rng.normal(size=300)
+    X[:, 3] = 2 * y + 0.01 * rng.normal(size=300)
+    X[:, 7] = 1.5  # constant column
+
+    expected = np.array([
+        np.nan if np.std(X[:, i]) == 0 else np.corrcoef(X[:, i], y)[0, 1]
+        for i in range(X.shape[1])
+    ])
+    # Tiny budget forces several column blocks
+    corr = data.feature_target_correlation(X, y, block_bytes=300 * 8 * 6)
+
+    np.testing.assert_allclose(corr, expected, equal_nan=True)
+
+    report = data.evaluate(X, y, dtype=np.float32)
+    assert report["data_leakage"]["suspected"]
+    assert [f["feature_index"] for f in report["data_leakage"]["details"]] == [3]
+
+
+def test_memory_mapped_audit(tmp_path):
+    from sklearn.linear_model import LogisticRegression
+
+    from ai_critic import AICritic
+
+    rng = np.random.default_rng(1)
+    X = rng.normal(size=(600, 8))
+    y = (X[:, 0] + 0.5 * rng.normal(size=600) > 0).astype(int)
+    np.save(tmp_path / "X.npy", X)
+    np.save(tmp_path / "y.npy", y)
+
+    critic = AICritic(LogisticRegression(), str(tmp_path / "X.npy"), str(tmp_path / "y.npy"))
+    assert isinstance(critic.X, np.memmap)
+
+    in_memory = data.evaluate(X, y)
+    streamed = data.evaluate(critic.X, critic.y, block_bytes=8 * 8 * 50)
+    assert streamed["class_balance"] == in_memory["class_balance"]
+    assert streamed["has_nan"] is False
+
+    report = critic.evaluate(view="details")
+    assert report["robustness"]["verdict"] in ("stable", "fragile", "misleading")
+
+
+def test_sparse_audit_matches_dense_and_keeps_sparsity():
+    from scipy import sparse
+    from sklearn.linear_model import LogisticRegression
+
+    from ai_critic import AICritic
+    from ai_critic.evaluators.robustness import GaussianNoise
+    from ai_critic.evaluators.streaming import take_rows
+
+    rng = np.random.default_rng(0)
+    X = sparse.random(600, 50, density=0.1, format="lil", random_state=0)
+    y = rng.integers(0, 2, size=600)
+    X[:, 4] = y[:, None] + 0.5  # leaked
+    X = X.tocsr()
+
+    np.testing.assert_allclose(
+        data.feature_target_correlation(X, y),
+        data.feature_target_correlation(X.toarray(), y),
+        atol=1e-12,
+        equal_nan=True,
+    )
+
+    # Noise only touches the stored entries
+    noisy = take_rows(X, np.arange(600), transform=GaussianNoise(1.0, seed=0), dtype=np.float64)
+    assert sparse.issparse(noisy) and noisy.nnz == X.nnz
+
+    details = AICritic(LogisticRegression(max_iter=200), X, y).evaluate(view="details")
+    assert details["data"]["data_leakage"]["details"][0]["feature_index"] == 4
+    assert details["robustness"]["verdict"] == "misleading"
+
+
+def test_mutual_information_flags_non_linear_leaks_only():
+    from sklearn.datasets import load_iris
+
+    X, y = load_iris(return_X_y=True)
+    assert not data.evaluate(X, y)["data_leakage"]["suspected"]
+
+    rng = np.random.default_rng(0)
+    y = rng.integers(0, 5, size=5000)
+    X = rng.normal(size=(5000, 4))
+    X[:, 2] = np.array([7.0, -3.0, 100.0, 2.0, -50.0])[y]  # hashed target
+
+    report = data.evaluate(X, y)["data_leakage"]
+    assert [f["feature_index"] for f in report["details"]] == [2]
+    assert report["details"][0]["detected_by"] == ["mutual_information"]
+    assert abs(report["details"][0]["correlation"]) < 0.98
+
+
+def test_float32_compute_dtype_bounds_peak_allocation():
+    import tracemalloc
+
+    from sklearn.linear_model import LogisticRegression
+
+    from ai_critic.evaluators import robustness
+    from ai_critic.evaluators.folds import FoldEngine
+    from ai_critic.evaluators.validation import make_cv
+
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(20000, 50)).astype(np.float32)
+    y = (X[:, 0] > 0).astype(int)
+    block_bytes = 1 << 19
+    folds = FoldEngine(LogisticRegression(), X, y, make_cv(y))
+    folds.run("clean")
+
+    def peak(func):
+        tracemalloc.start()
+        try:
+            func()
+            return tracemalloc.get_traced_memory()[1]
+        finally:
+            tracemalloc.stop()
+
+    # Neither evaluator may hold a full copy of X, let alone an upcast one
+    data_peak = peak(lambda: data.evaluate(X, y, dtype=np.float32, block_bytes=block_bytes))
+    robustness_peak = peak(lambda: robustness.evaluate(
+        None, X, y, folds=folds, dtype=np.float32, block_bytes=block_bytes, random_state=0
+    ))
+    assert data_peak < X.nbytes / 2
+    assert robustness_peak < X.nbytes / 2
@@ -0,0 +1,121 @@
+import numpy as np
+from sklearn.datasets import load_iris
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.linear_model import LogisticRegression, SGDClassifier
+from sklearn.tree import DecisionTreeClassifier
+from sklearn.model_selection import cross_val_score
+
+from ai_critic import AICritic
+from ai_critic.evaluators import learning_curve, performance, robustness
+from ai_critic.evaluators.folds import FoldEngine
+from ai_critic.evaluators.validation import make_cv
+
+
+def test_fold_engine_matches_cross_val_score():
+    X, y = load_iris(return_X_y=True)
+    model = LogisticRegression(max_iter=200)
+
+    folds = FoldEngine(model, X, y, make_cv(y))
+    expected = cross_val_score(model, X, y, cv=make_cv(y))
+
+    np.testing.assert_allclose(folds.scores("clean"), expected)
+
+
+def test_clean_folds_are_fitted_once():
+    X, y = load_iris(return_X_y=True)
+    model = LogisticRegression(max_iter=200)
+    folds = FoldEngine(model, X, y, make_cv(y))
+
+    performance.evaluate(model, X, y, folds=folds)
+    robustness.evaluate(model, X, y, folds=folds)
+
+    # The noise sweep only predicts with the 3 clean fold models
+    assert folds.n_fits == 3
+
+
+def test_robustness_sweep_and_retrain_mode():
+    X, y = load_iris(return_X_y=True)
+    model = LogisticRegression(max_iter=200)
+    folds = FoldEngine(model, X, y, make_cv(y))
+    levels = (0.05, 0.5, 2.0)
+
+    result = robustness.evaluate(
+        model, X, y, folds=folds, noise_levels=levels,
+        feature_groups={"petal": [2, 3]}, random_state=0
+    )
+    curve = result["degradation_curve"]
+    assert [p["noise_level"] for p in curve] == [0.02, 0.05, 0.5, 2.0]
+    assert curve[-1]["cv_score"] < curve[0]["cv_score"]
+    assert len(result["feature_groups"]["petal"]) == len(curve)
+    assert folds.n_fits == 3
+
+    retrained = robustness.evaluate(
+        model, X, y, folds=folds, noise_levels=(), mode="retrain", random_state=0
+    )
+    assert retrained["mode"] == "retrain"
+    assert folds.n_fits == 6
+
+
+def test_learning_curve_grows_models_on_shared_folds():
+    X, y = load_iris(return_X_y=True)
+
+    # Incremental learners are fed one chunk per train size
+    sgd = SGDClassifier(random_state=0)
+    folds = FoldEngine(sgd, X, y, make_cv(y))
+    result = learning_curve.evaluate(sgd, X, y, folds=folds)
+    assert result["strategy"] == "partial_fit"
+    assert result["train_sizes"] == [0.2, 0.5, 1.0]
+    # Smaller sizes grow their own model; the full size is the clean fit
+    assert result["validation_scores"][-1] == performance.evaluate(sgd, X, y, folds=folds)["cv_mean_score"]
+    assert folds.n_fits == 9
+
+    # Ensembles are refitted, but the full size is the clean CV fit
+    forest = RandomForestClassifier(n_estimators=20, random_state=0)
+    folds = FoldEngine(forest, X, y, make_cv(y))
+    result = learning_curve.evaluate(forest, X, y, folds=folds)
+    assert result["strategy"] == "refit"
+    assert result["validation_scores"][-1] == performance.evaluate(forest, X, y, folds=folds)["cv_mean_score"]
+    assert folds.n_fits == 9
+
+
+def test_learning_curve_gap_flags_memorization():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(600, 5))
+    y = rng.integers(0, 2, 600)
+
+    result = learning_curve.evaluate(DecisionTreeClassifier(random_state=0), X, y)
+    assert result["overfitting"]
+    assert result["train_validation_gap"] > 0.4
+
+
+def test_learning_curve_handles_rare_and_late_classes():
+    # Two 6-row minority classes: stratified nested subsets keep them
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(300, 5))
+    y = np.zeros(300, dtype=int)
+    y[:6], y[6:12] = 1, 2
+    assert AICritic(LogisticRegression(), X, y).deploy_decision()["deploy"]
+
+    # Progressive subsamples: a class may first appear at a larger size,
+    # so the warm-started model is restarted instead of crashing
+    X, y = load_iris(return_X_y=True)
+    report = AICritic(
+        LogisticRegression(max_iter=300), X, y, progressive=True, min_samples=50
+    ).evaluate()
+    assert report["details"]["learning_curve"]["strategy"] == "warm_start"
+
+    # A size that cannot be fitted (one row, one class) is NaN, not an error
+    result = learning_curve.evaluate(LogisticRegression(max_iter=300), X, y, train_sizes=(0.001,))
+    assert np.isnan(result["validation_scores"][0])
+    assert not np.isnan(result["validation_scores"][-1])
+
+
+def test_parallel_audit_matches_sequential():
+    X, y = load_iris(return_X_y=True)
+    model = LogisticRegression(max_iter=200)
+
+    sequential = AICritic(model, X, y).evaluate(view="details")
+    parallel = AICritic(model, X, y, n_jobs=2, backend="threading").evaluate(view="details")
+
+    assert list(parallel) == ["data", "config", "performance", "robustness", "learning_curve"]
+    assert parallel["performance"] == sequential["performance"]
@@ -0,0 +1,42 @@
+import subprocess
+import sys
+
+# Modules that must only load when a plot or a non-sklearn adapter is requested
+HEAVY_MODULES = ("matplotlib", "seaborn", "torch", "tensorflow")
+
+# Time ai_critic's own modules may spend executing at import (not
+# counting the dependencies they import)
+IMPORT_BUDGET_SECONDS = 0.25
+
+
+def _own_import_time(statement, package="ai_critic"):
+    # -X importtime reports each module's "self" time in microseconds,
+    # so CPU contention in scikit-learn's import does not count here
+    out = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", statement],
+        capture_output=True, text=True, check=True
+    )
+    total = 0
+    for line in out.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        self_us, _, name = line[len("import time:"):].split("|")
+        name = name.strip()
+        if name == package or name.startswith(package + "."):
+            total += int(self_us)
+    return total / 1e6
+
+
+def test_import_does_not_load_heavy_dependencies():
+    code = (
+        "import sys; from ai_critic import AICritic; "
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    out = subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    )
+    assert out.stdout.strip() == ""
+
+
+def test_import_time_budget():
+    assert _own_import_time("from ai_critic import AICritic") < IMPORT_BUDGET_SECONDS
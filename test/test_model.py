@@ -1,7 +1,15 @@
+import asyncio
+import time
+
+import numpy as np
+import pytest
 from sklearn.datasets import load_iris
 from sklearn.linear_model import LogisticRegression
 
 from ai_critic import AICritic
+from ai_critic.plotting import PlotRenderer
+from ai_critic.profiling import ProfileHook
+from ai_critic.sessions import CriticSessionStore
 
 
 def test_ai_critic_runs():
@@ -15,3 +23,240 @@ def test_ai_critic_runs():
     assert "performance" in report
     assert "robustness" in report
     assert report["performance"]["cv_mean_score"] > 0.5
+
+
+def test_evaluation_is_memoized():
+    X, y = load_iris(return_X_y=True)
+    critic = AICritic(LogisticRegression(max_iter=200), X, y)
+
+    calls = []
+    run = critic._run
+    critic._run = lambda *args: calls.append(1) or run(*args)
+
+    report = critic.evaluate()
+    critic.evaluate(view="executive")
+    critic.deploy_decision()
+    assert len(calls) == 1
+
+    # New params -> new fingerprint
+    critic.model.set_params(C=0.5)
+    critic.evaluate()
+    assert len(calls) == 2
+
+    critic.invalidate()
+    assert critic.evaluate() == critic.evaluate()
+    assert len(calls) == 3
+
+    # Callers get copies; mutating them must not corrupt the memo
+    report["details"].clear()
+    assert critic.evaluate()["details"]
+
+
+def test_progressive_audit_stops_on_confirmed_leakage():
+    rng = np.random.default_rng(0)
+    X = rng.normal(size=(40_000, 5))
+    y = (X[:, 0] > 0).astype(int)
+    X[:, 4] = y + rng.normal(scale=0.01, size=len(y))  # leaked target
+
+    critic = AICritic(LogisticRegression(), X, y, progressive=True, min_samples=2000)
+    report = critic.evaluate(view="all")
+
+    assert report["progressive"]["n_samples_used"] == 2000
+    assert report["progressive"]["reason"] == "leakage_confirmed"
+    assert critic.deploy_decision()["risk_level"] == "high"
+
+
+def test_evaluate_many_ranks_candidates():
+    X, y = load_iris(return_X_y=True)
+    models = {
+        "weak": LogisticRegression(C=1e-4, max_iter=200),
+        "strong": LogisticRegression(max_iter=200),
+    }
+
+    sequential = AICritic.evaluate_many(models, X, y, random_state=0)
+    parallel = AICritic.evaluate_many(models, X, y, n_jobs=2, random_state=0)
+
+    assert [row["name"] for row in sequential["ranking"]] == ["strong", "weak"]
+    assert sequential["ranking"] == parallel["ranking"]
+    assert set(sequential["reports"]) == {"weak", "strong"}
+
+
+def test_seed_tree_makes_audits_bit_identical_across_n_jobs():
+    from sklearn.ensemble import RandomForestClassifier
+
+    X, y = load_iris(return_X_y=True)
+
+    def details(random_state=7, **kwargs):
+        # Unseeded forest: its fold fits are seeded from the audit's tree
+        model = RandomForestClassifier(n_estimators=5)
+        return AICritic(model, X, y, random_state=random_state, **kwargs).evaluate()["details"]
+
+    sequential = details()
+    assert details(n_jobs=2) == sequential
+    assert details(n_jobs=2, backend="threading") == sequential
+
+    batch = AICritic.evaluate_many(
+        {"forest": RandomForestClassifier(n_estimators=5)}, X, y, random_state=7
+    )
+    assert batch["reports"]["forest"]["details"] == sequential
+
+    other = details(random_state=8)
+    assert other["robustness"] != sequential["robustness"]
+
+
+def test_profile_reports_every_stage():
+    X, y = load_iris(return_X_y=True)
+    seen = []
+
+    class Collector(ProfileHook):
+        def on_stage_end(self, stage, metrics):
+            seen.append(stage)
+
+    critic = AICritic(LogisticRegression(max_iter=200), X, y, profile_hooks=[Collector()])
+    profile = critic.evaluate(view="profile")
+
+    assert set(profile["stages"]) == {
+        "data", "config", "performance", "robustness", "learning_curve", "summary"
+    }
+    assert sorted(seen) == sorted(profile["stages"])
+    # 3 clean folds shared by performance, robustness and the full
+    # train size, plus a warm-started model per fold at the 2 smaller ones
+    assert profile["total"]["n_fits"] == 9
+
+
+def test_plots_render_in_background_from_results(tmp_path):
+    X, y = load_iris(return_X_y=True)
+    critic = AICritic(LogisticRegression(max_iter=200), X, y, plot_dir=tmp_path, plot_top_k=3)
+    critic.evaluate()
+
+    calls = []
+    critic._run = lambda: calls.append(1)
+    report = critic.evaluate(plot=True)
+    written = critic.wait_for_plots()
+
+    # Plots reuse the memoized results instead of re-running evaluators
+    assert calls == []
+    assert set(written) == {"heatmap", "performance", "robustness"}
+    assert written == report["plots"]
+    assert all((tmp_path / name).exists() for name in
+               ("heatmap_correlation.png", "performance.png", "robustness.png"))
+
+
+def test_plot_paths_only_announce_written_plots(tmp_path):
+    X, y = load_iris(return_X_y=True)
+    renderer = PlotRenderer(tmp_path)
+    details = {
+        "data": {"top_correlated_features": []},
+        "performance": {"cv_scores": [0.9, 0.95], "cv_mean_score": 0.925},
+        "robustness": {"degradation_curve": [], "cv_score_original": 0.925},
+    }
+
+    assert set(renderer.paths()) == {"heatmap", "performance", "robustness"}
+    assert set(renderer.paths(details)) == {"performance"}
+    assert renderer.render(details, X, y) == renderer.paths(details)
+    assert [p.name for p in tmp_path.iterdir()] == ["performance.png"]
+
+
+def test_async_audit_streams_results_and_saves_session(tmp_path):
+    X, y = load_iris(return_X_y=True)
+    critic = AICritic(LogisticRegression(max_iter=200), X, y, session="async")
+    critic._store = CriticSessionStore(tmp_path)
+
+    async def audit():
+        streamed = [name async for name, _, _ in critic.astream()]
+        return streamed, await critic.aevaluate(), await critic.adeploy_decision()
+
+    streamed, report, decision = asyncio.run(audit())
+
+    assert streamed[:2] == ["data", "config"]
+    assert streamed[-1] == "report"
+    assert set(streamed[:-1]) == set(report["details"])
+    assert report == critic.evaluate()
+    assert decision == critic.deploy_decision()
+    assert len(critic._store.history("async")) == 1
+
+
+def test_async_audit_timeout_cancels_remaining_evaluators():
+    X, y = load_iris(return_X_y=True)
+    critic = AICritic(LogisticRegression(max_iter=200), X, y)
+    started = []
+
+    def slow_robustness(*args, **kwargs):
+        started.append(1)
+        time.sleep(0.5)
+        raise AssertionError("not reached")
+
+    schedule = critic._schedule
+
+    def patched(**kwargs):
+        scheduler = schedule(**kwargs)
+        func, requires = scheduler._tasks["performance"]
+        scheduler._tasks["performance"] = (lambda deps: time.sleep(0.5) or func(deps), requires)
+        scheduler._tasks["robustness"] = (slow_robustness, ("performance",))
+        return scheduler
+
+    critic._schedule = patched
+
+    with pytest.raises(asyncio.TimeoutError):
+        asyncio.run(critic.aevaluate(timeout=0.2))
+
+    # asyncio.run waits for the executor: performance finished, but
+    # robustness never started and nothing was memoized
+    assert started == []
+    assert critic._results == {}
+
+
+def test_callback_mode_reports_partial_verdicts():
+    X, y = load_iris(return_X_y=True)
+    critic = AICritic(LogisticRegression(max_iter=200), X, y)
+    events = []
+
+    report = critic.evaluate(on_result=lambda name, result, summary: events.append((name, summary)))
+
+    assert [name for name, _ in events] == ["data", "config", "performance", "robustness", "learning_curve"]
+    assert all(summary["verdict"] == "⏳ Incomplete" for _, summary in events[:-1])
+    assert events[-1][1] == report["executive"]
+    assert report == critic.evaluate()
+
+
+def test_fit_budget_degrades_remaining_evaluators():
+    X, y = load_iris(return_X_y=True)
+
+    # Enough for the clean CV, not for the learning-curve sizes
+    report = AICritic(LogisticRegression(max_iter=200), X, y, max_fits=3).evaluate()
+    assert report["budget"]["n_fits"] == 3
+    assert list(report["budget"]["degraded"]) == ["learning_curve"]
+    assert report["details"]["learning_curve"]["train_sizes"] == [1.0]
+
+    # Not even the clean CV: everything moves to the 2-fold subsample engine
+    report = AICritic(
+        LogisticRegression(max_iter=200), X, y, max_fits=2, min_samples=100
+    ).evaluate()
+    assert report["budget"]["n_fits"] == 2
+    assert len(report["performance"]["cv_scores"]) == 2
+    assert set(report["technical"]["degraded_evaluators"]) == {
+        "performance", "robustness", "learning_curve"
+    }
+
+    # No subsample smaller than the data: the clean CV is kept and reused
+    report = AICritic(LogisticRegression(max_iter=200), X, y, max_seconds=1e-9).evaluate()
+    assert report["budget"]["n_fits"] == 3
+    assert len(report["robustness"]["degradation_curve"]) == 1
+    assert "performance" not in report["budget"]["degraded"]
+
+
+def test_overfitting_only_costs_score_points():
+    from sklearn.datasets import make_classification
+    from sklearn.ensemble import RandomForestClassifier
+
+    from ai_critic.evaluators.scoring import compute_scores
+
+    # Label noise: a forest memorizes its training rows
+    X, y = make_classification(n_samples=600, flip_y=0.3, random_state=0)
+    critic = AICritic(RandomForestClassifier(n_estimators=20, random_state=0), X, y)
+    report = critic.evaluate(view="all")
+
+    assert report["details"]["learning_curve"]["overfitting"]
+    assert critic.deploy_decision()["deploy"]
+    assert report["executive"]["verdict"] == "✅ Acceptable"
+    assert compute_scores(report)["components"]["generalization"] < 100
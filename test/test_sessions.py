@@ -0,0 +1,159 @@
+import json
+import os
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+from sklearn.datasets import load_iris
+from sklearn.linear_model import LogisticRegression
+
+from ai_critic import AICritic
+from ai_critic.sessions import CriticSessionStore, ResultCache, detect_regressions
+
+
+def test_result_cache_serves_unchanged_audits(tmp_path):
+    X, y = load_iris(return_X_y=True)
+    cache = ResultCache(tmp_path / "cache")
+
+    first = AICritic(LogisticRegression(max_iter=200), X, y, cache=cache).evaluate()
+
+    # A new critic (e.g. a new process) on the same model and data
+    second = AICritic(LogisticRegression(max_iter=200), X, y, cache=cache)
+    second._run = lambda plot=False: (_ for _ in ()).throw(AssertionError("re-ran"))
+    assert second.evaluate() == first
+
+    # Different params miss the cache
+    third = AICritic(LogisticRegression(max_iter=100), X, y, cache=cache)
+    assert third.fingerprint() != second.fingerprint()
+
+
+def test_warm_result_cache_replays_every_evaluator(tmp_path):
+    import asyncio
+
+    from ai_critic.critic import EVALUATORS
+
+    X, y = load_iris(return_X_y=True)
+    cache = ResultCache(tmp_path / "cache")
+    AICritic(LogisticRegression(max_iter=200), X, y, cache=cache).evaluate()
+
+    def critic():
+        # Fresh memo: only the disk cache can answer
+        critic = AICritic(LogisticRegression(max_iter=200), X, y, cache=cache)
+        critic._run = lambda *args: (_ for _ in ()).throw(AssertionError("re-ran"))
+        return critic
+
+    events = [name for name, _, _ in critic().stream()]
+    assert events == list(EVALUATORS) + ["report"]
+
+    seen = []
+    critic().evaluate(on_result=lambda name, result, summary: seen.append(name))
+    assert seen == list(EVALUATORS)
+
+    async def consume():
+        return [name async for name, _, _ in critic().astream()]
+
+    assert asyncio.run(consume()) == list(EVALUATORS) + ["report"]
+
+
+def test_result_cache_eviction(tmp_path):
+    cache = ResultCache(tmp_path, max_bytes=10_000, max_age=60)
+
+    cache.put("old", {"blob": "x" * 100})
+    old_path = tmp_path / "old.pkl"
+    os.utime(old_path, (time.time() - 120, time.time() - 120))
+    assert cache.get("old") is None
+
+    for i in range(5):
+        cache.put(f"k{i}", {"blob": "x" * 4000})
+        os.utime(tmp_path / f"k{i}.pkl", (time.time() - 10 + i, time.time() - 10 + i))
+    cache.evict()
+
+    assert sorted(p.stem for p in tmp_path.glob("*.pkl")) == ["k3", "k4"]
+
+
+def _payload(global_score, robustness=100):
+    return {
+        "details": {"note": "large detail payload"},
+        "scores": {
+            "global": global_score,
+            "components": {"data_integrity": 100, "validation": 100, "robustness": robustness},
+        },
+    }
+
+
+def test_session_store_keeps_history(tmp_path):
+    store = CriticSessionStore(tmp_path)
+    store.save("model-a", _payload(90))
+    store.save("model-a", _payload(75, robustness=65))
+
+    assert store.load("model-a")["scores"]["global"] == 75
+    assert store.load_scores("model-a") == {
+        "global": 75,
+        "components": {"data_integrity": 100, "validation": 100, "robustness": 65},
+    }
+    assert [run["scores"]["global"] for run in store.history("model-a")] == [90, 75]
+    assert store.load("missing") is None
+
+
+def test_session_store_concurrent_writers(tmp_path):
+    store = CriticSessionStore(tmp_path)
+    with ThreadPoolExecutor(max_workers=8) as pool:
+        list(pool.map(lambda i: CriticSessionStore(tmp_path).save("ci", _payload(i)), range(40)))
+
+    assert len(store.history("ci")) == 40
+
+
+def test_session_store_reads_legacy_json(tmp_path):
+    with open(tmp_path / "old.json", "w") as f:
+        json.dump({"timestamp": "2024-01-01T00:00:00", "payload": _payload(60)}, f)
+
+    store = CriticSessionStore(tmp_path)
+    assert store.load_scores("old")["global"] == 60
+
+
+def test_compare_with_reads_scores_only(tmp_path):
+    X, y = load_iris(return_X_y=True)
+    store = CriticSessionStore(tmp_path)
+    store.save("v1", _payload(50, robustness=40))
+
+    critic = AICritic(LogisticRegression(max_iter=200), X, y, session="v2")
+    critic._store = store
+    critic.evaluate()
+
+    diff = critic.compare_with("v1")["score_diff"]
+    assert diff["global_score"]["previous"] == 50
+    assert diff["components"]["robustness"]["previous"] == 40
+
+
+def test_score_series_and_regressions(tmp_path):
+    store = CriticSessionStore(tmp_path)
+    for score in [90, 92, 91, 90, 93, 91, 70, 90]:
+        store.save("release/model-a", _payload(score, robustness=score - 5))
+    store.save("other", _payload(10))
+
+    series = store.score_series(prefix="release/")
+    assert list(series["global"]) == [90, 92, 91, 90, 93, 91, 70, 90]
+    assert set(series["name"]) == {"release/model-a"}
+    assert series["components"]["robustness"][0] == 85
+
+    only_global = store.score_series(components=[])
+    assert len(only_global["global"]) == 9 and only_global["components"] == {}
+
+    regressions = detect_regressions(series, threshold=10, window=5)
+    assert [(r["score"], r["baseline"]) for r in regressions] == [(70, 91)]
+
+    future = store.score_series(since=series["timestamp"][-1] + 3600)
+    assert len(future["run_id"]) == 0
+
+
+def test_regressions_use_a_baseline_per_session_name(tmp_path):
+    store = CriticSessionStore(tmp_path)
+    # A steady 60-point model interleaved with a steady 90-point one
+    for i in range(8):
+        store.save("release/small", _payload(60))
+        store.save("release/large", _payload(40 if i == 7 else 90))
+
+    series = store.score_series(prefix="release/")
+    regressions = detect_regressions(series, threshold=10, window=5)
+    assert [(r["name"], r["score"], r["baseline"]) for r in regressions] == [
+        ("release/large", 40, 90)
+    ]